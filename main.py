@@ -15,6 +15,7 @@ from utils.db_manager import (
     get_all_ntis_projects, get_all_univ_bids,
     get_purchase_signals, mark_signal_acted,
     get_cad_department_stats, get_cad_confirmed_schools,
+    get_unfinished_scan_job, get_scan_job_progress, get_schools_without_contacts,
 )
 import modules.api_koneps as ak
 import modules.crawler_grants as cg
@@ -27,6 +28,7 @@ import modules.crawler_edu_policy as ep
 import modules.crawler_ntis as ntis_crawler
 import modules.crawler_univ_bids as univ_bids_crawler
 import modules.purchase_signal_engine as pse
+import modules.school_profile as school_profile
 import modules.crawler_cad_departments as cad_crawler
 from utils.text_processor import build_reference_card_prompt
 from modules.scheduler import start_scheduler, get_scheduler_status
@@ -544,26 +546,49 @@ def convert_df_to_csv(df: pd.DataFrame) -> bytes:
     return df.to_csv(index=False).encode('utf-8-sig')
 
 
-def call_gemini(prompt: str) -> str:
-    import requests
+REFERENCE_CARD_GENERATION_CONFIG = {"temperature": 0.5, "maxOutputTokens": 2048}
+
+
+def call_gemini(prompt: str, use_cache: bool = False) -> str:
     from config import GEMINI_API_KEY
+    from utils.gemini_cache import generate_text, GeminiError
     if not GEMINI_API_KEY:
         return "⚠️ GEMINI_API_KEY가 설정되지 않았습니다."
-    url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash:generateContent?key={GEMINI_API_KEY}"
-    payload = {
-        "contents": [{"parts": [{"text": prompt}]}],
-        "generationConfig": {"temperature": 0.5, "maxOutputTokens": 2048},
-    }
     try:
-        res = requests.post(url, headers={"Content-Type": "application/json"}, json=payload, timeout=30)
-        if res.status_code == 200:
-            parts = res.json().get("candidates", [{}])[0].get("content", {}).get("parts", [])
-            return parts[0].get("text", "결과 없음") if parts else "결과 없음"
-        return f"⚠️ API 에러 [{res.status_code}]: {res.text}"
+        text = generate_text(
+            prompt, GEMINI_API_KEY, REFERENCE_CARD_GENERATION_CONFIG,
+            timeout=30, source='reference_card', cache=use_cache,
+        )
+        return text or "결과 없음"
+    except GeminiError as e:
+        return f"⚠️ API 에러 [{e.status_code}]: {e.body}"
     except Exception as e:
         return f"⚠️ 오류: {e}"
 
 
+def stream_gemini(prompt: str, use_cache: bool = False):
+    """call_gemini의 스트리밍 버전 — st.write_stream에 전달 (끝까지 받은 결과만 캐시, 오류는 안내 문구로 출력)."""
+    from config import GEMINI_API_KEY
+    from utils.gemini_cache import stream_text, GeminiError
+    if not GEMINI_API_KEY:
+        yield "⚠️ GEMINI_API_KEY가 설정되지 않았습니다."
+        return
+    received = False
+    try:
+        for chunk in stream_text(
+            prompt, GEMINI_API_KEY, REFERENCE_CARD_GENERATION_CONFIG,
+            timeout=30, source='reference_card', cache=use_cache,
+        ):
+            received = True
+            yield chunk
+        if not received:
+            yield "결과 없음"
+    except GeminiError as e:
+        yield f"\n\n⚠️ API 에러 [{e.status_code}]: {e.body}"
+    except Exception as e:
+        yield f"\n\n⚠️ 오류: {e}"
+
+
 def section_header(icon: str, title: str):
     """공통 섹션 헤더 컴포넌트."""
     st.markdown(f"""
@@ -670,6 +695,55 @@ def render_sidebar() -> str:
             KONEPS &nbsp;✅ 설정됨
             </div>
             """, unsafe_allow_html=True)
+        with st.expander("🗄️ API 캐시 현황"):
+            from utils.cache_store import get_cache_store
+            from utils.http_cache import clear_http_cache
+            cache_stats = get_cache_store().stats()
+            if cache_stats:
+                rows = "<br>".join(
+                    f"{s['namespace'].upper()}·{s['source']} &nbsp;{s['hit_ratio'] * 100:.0f}% "
+                    f"({s['requests'] - s['misses']}/{s['requests']})"
+                    + (f" · {s['saved_tokens']:,} tok 절감" if s['saved_tokens'] else "")
+                    for s in cache_stats
+                )
+                st.markdown(f"""
+                <div style="font-size:0.75rem; color:#6B8CAE; line-height:2;">
+                {rows}
+                </div>
+                """, unsafe_allow_html=True)
+            else:
+                st.caption("캐시 사용 기록 없음")
+            if st.button("HTTP 캐시 비우기", key="clear_http_cache", use_container_width=True):
+                st.caption(f"{clear_http_cache()}건 삭제")
+
+        with st.expander("🤖 LLM 호출 현황 (7일)"):
+            from utils.db_manager import get_llm_call_summary
+            llm_stats = get_llm_call_summary(days=7)
+            if llm_stats:
+                rows = "<br>".join(
+                    f"{s['source']} &nbsp;{s['calls']}회 · 평균 {s['avg_ms'] / 1000:.1f}s "
+                    f"(p95 {s['p95_ms'] / 1000:.1f}s) · 누적 {s['total_sec']:.0f}s"
+                    f" · {s['prompt_tokens'] + s['output_tokens']:,} tok"
+                    + (f" · 오류 {s['error_rate'] * 100:.0f}%" if s['errors'] else "")
+                    + (f" · 재시도 {s['retries']}" if s['retries'] else "")
+                    + (f" · 대기 {s['wait_ratio'] * 100:.0f}%" if s['wait_ratio'] >= 0.05 else "")
+                    for s in llm_stats
+                )
+                st.markdown(f"""
+                <div style="font-size:0.75rem; color:#6B8CAE; line-height:2;">
+                {rows}
+                </div>
+                """, unsafe_allow_html=True)
+            else:
+                st.caption("LLM 호출 기록 없음")
+
+            from utils.contact_extractor import get_preextract_stats
+            pre_stats = get_preextract_stats()
+            if pre_stats['calls']:
+                st.caption(
+                    f"연락처 규칙 추출 {pre_stats['calls']}건 · LLM 생략 {pre_stats['hit_rate'] * 100:.0f}% "
+                    f"(부분 {pre_stats['partial']}건) · 절감 약 {pre_stats['saved_ms'] / 1000:.0f}s"
+                )
 
         st.markdown(f"""
         <div style="font-size:0.68rem; color:#2D4A62; text-align:center; margin-top:12px;">
@@ -756,7 +830,7 @@ def render_dashboard():
             render_kpi_card("🔬", "R&D 과제", len(ntis_df), "연구과제 뉴스", "blue")
 
     # 이번 주 할 일 (Top 5)
-    weekly_top5 = pse.get_weekly_action_list(top_n=5)
+    weekly_top5 = pse.get_top_schools(5)
     if weekly_top5:
         st.markdown("---")
         section_header("🎯", "이번 주 접근 대상 TOP 5")
@@ -774,6 +848,32 @@ def render_dashboard():
             </div>
             """, unsafe_allow_html=True)
 
+    # 최근 30일 점수 변동 (일별 점수 스냅샷 비교)
+    movers = pse.get_score_movers(days=30, limit=5)
+    if movers['risers'] or movers['tier_changes']:
+        st.markdown("---")
+        section_header("📈", f"점수 급상승 학교 ({movers['from_date']} → {movers['to_date']})")
+        mv_left, mv_right = st.columns([1.4, 1])
+        with mv_left:
+            for m in movers['risers']:
+                st.markdown(f"""
+                <div style="background:#161B22; border:1px solid #21262D; border-radius:8px;
+                             padding:8px 14px; margin-bottom:6px; display:flex; justify-content:space-between; align-items:center;">
+                    <div>
+                        <span style="font-weight:700; color:#E8EDF2; font-size:0.85rem;">{m['school_name']}</span>
+                        <span style="font-size:0.7rem; color:#4A6A8A; margin-left:8px;">{m['program_name']} · {m['from_score']}점 → {m['to_score']}점</span>
+                    </div>
+                    <div style="background:#68D39122; color:#68D391; padding:2px 10px;
+                                border-radius:12px; font-size:0.75rem; font-weight:600;">+{m['delta']}</div>
+                </div>
+                """, unsafe_allow_html=True)
+        with mv_right:
+            upgrades = [m for m in movers['tier_changes'] if m['to_tier'] < m['from_tier']]
+            downgrades = len(movers['tier_changes']) - len(upgrades)
+            st.caption(f"등급 상향 {len(upgrades)}교 · 하향 {downgrades}교")
+            for m in upgrades[:5]:
+                st.markdown(f"- **{m['school_name']}** : {m['from_tier_name']} → {m['to_tier_name']}")
+
     st.markdown("---")
 
     col_left, col_right = st.columns([1.4, 1])
@@ -860,7 +960,8 @@ def render_target_discovery():
 
     # ── 탭1: 기존 개별 교수 발굴 ──
     with tab_individual:
-        info_box("학교명만 입력하면 AI가 3D CAD·디지털 트윈 관련 교수진 연락처를 자동 수집합니다.")
+        info_box("학교명만 입력하면 AI가 3D CAD·디지털 트윈 관련 교수진 연락처를 자동 수집합니다. "
+                 "여러 학교는 일괄 발굴로 동시에 수집할 수 있습니다.")
 
         col1, col2 = st.columns([1, 2])
 
@@ -883,6 +984,46 @@ def render_target_discovery():
                         except Exception as e:
                             st.error(f"오류: {e}")
 
+            # 일괄 발굴 (여러 학교 동시 실행)
+            st.markdown("---")
+            section_header("📚", "일괄 교수 발굴")
+            bulk_source = st.radio(
+                "대상", ["CAD 학과 보유 · 연락처 없는 학교", "연락처 없는 전체 학교", "직접 입력"],
+                key="bulk_contact_source", label_visibility="collapsed",
+            )
+            if bulk_source == "직접 입력":
+                bulk_text = st.text_area("학교명 (줄마다 1개)", key="bulk_contact_names", height=120)
+                bulk_schools = list(dict.fromkeys(n.strip() for n in bulk_text.splitlines() if n.strip()))
+            else:
+                bulk_limit = st.number_input("최대 학교 수", min_value=1, max_value=100, value=10, step=1,
+                                             key="bulk_contact_limit")
+                bulk_schools = [s['school_name'] for s in get_schools_without_contacts(
+                    limit=int(bulk_limit), cad_only=bulk_source.startswith("CAD"),
+                )]
+            st.caption(f"대상 {len(bulk_schools)}교 · 동시 {cc.BULK_SCHOOL_WORKERS}교")
+
+            if st.button("🚀  일괄 발굴 시작", use_container_width=True, key="bulk_contact_btn",
+                         disabled=not bulk_schools):
+                bulk_progress = st.progress(0.0, text=f"{len(bulk_schools)}교 동시 탐색 중…")
+                bulk_log = st.empty()
+                log_lines = []
+
+                def _on_bulk_done(entry, done, total, inserted):
+                    if entry['error']:
+                        mark = f"⚠️ {entry['error'][:40]}"
+                    else:
+                        mark = f"{len(entry['contacts'])}명"
+                    log_lines.insert(0, f"{entry['school_name']} — {mark} ({entry['elapsed_sec']:.0f}s)")
+                    bulk_progress.progress(done / total, text=f"{done}/{total}교 완료 · {inserted}건 저장")
+                    bulk_log.caption("  \n".join(log_lines[:8]))
+
+                result = cc.bulk_discover_professors(bulk_schools, on_result=_on_bulk_done)
+                st.success(
+                    f"✅ {result['schools']}교 완료 ({result['elapsed_sec']:.0f}초) | "
+                    f"{result['found']}명 발굴 / {result['inserted']}건 신규 저장"
+                    + (f" | 실패 {result['failed']}교" if result['failed'] else "")
+                )
+
         with col2:
             section_header("📋", "발굴된 타겟 현황")
             df = get_all_contacts()
@@ -939,20 +1080,69 @@ def render_target_discovery():
         with col_ctrl:
             section_header("⚙️", "스캔 설정")
             max_schools = st.number_input(
-                "한 번에 스캔할 학교 수", min_value=1, max_value=30, value=5, step=1,
+                "한 번에 스캔할 학교 수", min_value=1, max_value=100, value=10, step=1,
                 key="cad_max_schools"
             )
             collect_prof = st.checkbox("교수 정보도 함께 수집", value=True, key="cad_collect_prof")
 
+            def _on_school_done(entry, done, total):
+                mark = "✅" if entry.get('has_cad') else ("⚠️" if entry.get('error') else "➖")
+                resumed = " (이어서)" if entry.get('resumed_from') else ""
+                progress.progress(min(done / total, 1.0), text=f"{done}/{total} {mark} {entry['school_name']}{resumed}")
+
+            # 중단·취소된 스캔 작업 (저장된 단계부터 재개)
+            unfinished_job = get_unfinished_scan_job()
+            if unfinished_job:
+                job_progress = get_scan_job_progress(unfinished_job['id'])
+                statuses = job_progress['statuses']
+                stages = job_progress['stages']
+                status_label = {'running': '진행 중/중단됨', 'cancelled': '취소됨',
+                                'incomplete': '일부 실패'}.get(unfinished_job['status'], unfinished_job['status'])
+                st.warning(
+                    f"⏸️ 미완료 스캔 작업 #{unfinished_job['id']} ({status_label}) — "
+                    f"완료 {statuses.get('done', 0)}/{unfinished_job['total']}교 · "
+                    f"실패 {statuses.get('failed', 0)}교 · "
+                    f"검색만 완료 {stages.get('searched', 0)}교 · 판별 완료 {stages.get('classified', 0)}교"
+                )
+                c_resume, c_cancel = st.columns(2)
+                with c_resume:
+                    if st.button("▶️ 이어서 스캔", use_container_width=True, key="cad_resume_btn"):
+                        progress = st.progress(0.0, text=f"작업 #{unfinished_job['id']} 재개 중…")
+                        with st.spinner("저장된 단계부터 이어서 스캔 중…"):
+                            try:
+                                # 이전 실행(새로고침·오류로 중단)이 잡고 있던 학교도 즉시 회수
+                                result = cad_crawler.resume_cad_scan_job(
+                                    unfinished_job['id'], on_result=_on_school_done, release_claims=True,
+                                )
+                                st.success(
+                                    f"✅ {result['scanned']}교 이어서 스캔 완료 | "
+                                    f"CAD 학과 {result['cad_found']}교 발견 | "
+                                    f"교수 {result['professors_saved']}명 저장"
+                                )
+                                st.session_state['cad_scan_results'] = result.get('results', [])
+                                st.rerun()
+                            except Exception as e:
+                                st.error(f"오류: {e}")
+                with c_cancel:
+                    if unfinished_job['status'] != 'cancelled' and st.button(
+                        "⏹️ 작업 취소", use_container_width=True, key="cad_cancel_btn"
+                    ):
+                        cad_crawler.cancel_cad_scan_job(unfinished_job['id'])
+                        st.rerun()
+
             if st.button("🔬 CAD 학과 일괄 스캔 시작", use_container_width=True, key="cad_batch_btn"):
-                with st.spinner(f"상위 {max_schools}교 CAD 학과 스캔 중… (학교당 약 30초)"):
+                progress = st.progress(0.0, text=f"상위 {max_schools}교 CAD 학과 동시 스캔 중…")
+
+                with st.spinner("Tavily 검색 · Gemini 판별 동시 실행 중…"):
                     try:
                         result = cad_crawler.batch_scan_cad_departments(
                             max_schools=max_schools,
                             collect_professors=collect_prof,
+                            on_result=_on_school_done,
                         )
+                        resumed = f"(미완료 작업 #{result['job_id']} 이어서) " if result.get('resumed') else ""
                         st.success(
-                            f"✅ {result['scanned']}교 스캔 완료 | "
+                            f"✅ {resumed}{result['scanned']}교 스캔 완료 | "
                             f"CAD 학과 {result['cad_found']}교 발견 | "
                             f"교수 {result['professors_saved']}명 저장"
                         )
@@ -1295,6 +1485,7 @@ def render_spec_in():
             budget = st.text_input("확보/추정 예산", value=auto_budget, placeholder="약 10억 원")
             solution = st.text_input("제안 솔루션명 *", placeholder="3DEXPERIENCE / 스마트팩토리 통합")
             extra = st.text_area("추가 강조 소구점", placeholder="유지보수 3년 무상 등", height=80)
+            reuse = st.checkbox("동일 입력이면 이전 생성 결과 재사용", value=False, key="doc_reuse")
             submitted = st.form_submit_button("✨  문서 초안 생성", use_container_width=True)
 
     with col2:
@@ -1303,9 +1494,9 @@ def render_spec_in():
             if not school or not project or not solution:
                 st.error("학교명, 사업명, 솔루션명은 필수입니다.")
             else:
-                with st.spinner("Gemini AI가 맞춤형 문서를 작성 중…"):
-                    result = dg.generate_spec_in_document(school, project, budget, solution, extra)
-                    st.markdown(result)
+                # 생성되는 대로 표시 — 중지 버튼을 누르면 재실행되며 스트림(HTTP 연결)도 닫힘
+                st.button("⏹️ 생성 중지", key="doc_stop")
+                st.write_stream(dg.stream_spec_in_document(school, project, budget, solution, extra, use_cache=reuse))
         else:
             st.markdown("""
             <div style="background:#161B22; border:1px dashed #2D4A62; border-radius:10px;
@@ -1332,6 +1523,7 @@ def render_reference_card():
             r_budget = st.text_input("사업 규모", placeholder="약 5억 원")
             r_outcome = st.text_area("도입 성과", placeholder="실습실 30석 구축, 취업률 15% 향상 등", height=80)
             save_ref = st.checkbox("DB에 실적 저장")
+            reuse = st.checkbox("동일 입력이면 이전 생성 결과 재사용", value=False, key="ref_reuse")
             submitted = st.form_submit_button("✨  레퍼런스 카드 생성", use_container_width=True)
 
     with col2:
@@ -1343,10 +1535,9 @@ def render_reference_card():
                 if save_ref:
                     insert_reference(r_school, r_solution, r_project, r_year, r_budget, r_outcome)
                     st.success("✅ 실적이 DB에 저장되었습니다.")
-                with st.spinner("AI가 레퍼런스 카드를 작성 중…"):
-                    prompt = build_reference_card_prompt(r_school, r_solution, r_project, r_year, r_budget, r_outcome)
-                    result = call_gemini(prompt)
-                    st.markdown(result)
+                prompt = build_reference_card_prompt(r_school, r_solution, r_project, r_year, r_budget, r_outcome)
+                st.button("⏹️ 생성 중지", key="ref_stop")
+                st.write_stream(stream_gemini(prompt, use_cache=reuse))
         else:
             st.markdown("""
             <div style="background:#161B22; border:1px dashed #2D4A62; border-radius:10px;
@@ -1459,6 +1650,98 @@ def render_school_info():
 
 
 
+def render_school_profile(profile: dict):
+    """school_profile.get_school_profile() 결과를 요약 카드 + 탭으로 표시합니다."""
+    if "error" in profile:
+        if profile.get("db_error"):
+            st.error(profile["error"])
+        else:
+            st.warning(profile["error"])
+        return
+
+    score = profile['score']
+    targets = profile['targets']
+    programs = ", ".join(dict.fromkeys(t['program_name'] for t in targets if t.get('program_name')))
+    status = targets[0].get('sales_status', '-') if targets else '타겟 학교 DB 미등록'
+    st.markdown(f"""
+    <div style="background:#161B22; border:1px solid #21262D; border-radius:8px;
+                 padding:12px 16px; margin:8px 0 12px 0;">
+        <span style="font-weight:700; color:#E8EDF2; font-size:1rem;">{profile['school_name']}</span>
+        <span style="font-size:0.75rem; color:#4A6A8A; margin-left:8px;">{programs or '-'} · {status}</span>
+        <span style="float:right; font-size:0.8rem; color:#F6AD55; font-weight:600;">
+            {f"{score['total_score']}점 · {score['tier']}" if score else "점수 없음"}</span>
+    </div>
+    """, unsafe_allow_html=True)
+    st.caption(
+        f"조회 {profile['elapsed_ms']}ms{' (캐시)' if profile['cached'] else ''} · "
+        f"검색 표기 {len(profile['stored_forms'])}개"
+    )
+
+    counts = profile['counts']
+    k1, k2, k3, k4, k5, k6 = st.columns(6)
+    with k1:
+        render_kpi_card("📡", "구매 신호", counts['signals'], "전체 이력", "red")
+    with k2:
+        render_kpi_card("👥", "교수·담당자", counts['contacts'], "발굴된 연락처", "blue")
+    with k3:
+        render_kpi_card("📊", "나라장터 공고", counts['bids'], "수요기관 기준", "purple")
+    with k4:
+        render_kpi_card("🏛️", "산학협력단 입찰", counts['univ_bids'], "자체 입찰 공고", "orange")
+    with k5:
+        render_kpi_card("🔬", "R&D 과제", counts['ntis_projects'], "주관기관 기준", "teal")
+    with k6:
+        render_kpi_card("💰", "재정지원사업", counts['grants'], "선정 뉴스", "green")
+
+    tab_sig, tab_contact, tab_bid, tab_rnd, tab_trend = st.tabs(
+        ["📡 구매 신호", "👥 교수·담당자", "📊 공고·입찰", "🔬 R&D·지원사업", "📈 점수·영업 이력"]
+    )
+
+    def show(rows: list, columns: dict, empty_msg: str):
+        if not rows:
+            st.caption(empty_msg)
+            return
+        df = pd.DataFrame(rows)
+        existing = [c for c in columns if c in df.columns]
+        st.dataframe(df[existing], use_container_width=True, hide_index=True, column_config=columns)
+
+    with tab_sig:
+        show(profile['signals'], {
+            'detected_at': '감지일', 'signal_type': '유형', 'signal_title': '제목',
+            'signal_score': '점수', 'source': '출처', 'is_acted': '조치',
+        }, "구매 신호가 없습니다.")
+    with tab_contact:
+        show(profile['contacts'], {
+            'name': '이름', 'department': '학과', 'email': '이메일', 'phone': '전화',
+            'research_area': '연구분야', 'contact_status': '접촉 상태',
+        }, "발굴된 교수·담당자가 없습니다.")
+    with tab_bid:
+        show(profile['bids'], {
+            'contract_date': '일자', 'bid_type': '구분', 'bid_title': '공고명',
+            'bid_price': '금액', 'successful_bidder': '낙찰업체',
+        }, "나라장터 공고가 없습니다.")
+        show(profile['univ_bids'], {
+            'pub_date': '게시일', 'bid_title': '공고명', 'bid_type': '구분', 'budget': '예산', 'deadline': '마감',
+        }, "산학협력단 입찰 공고가 없습니다.")
+    with tab_rnd:
+        show(profile['ntis_projects'], {
+            'project_name': '과제명', 'lead_researcher': '책임자', 'lead_department': '학과',
+            'total_budget': '예산', 'relevance_score': '관련도',
+        }, "R&D 과제가 없습니다.")
+        show(profile['grants'], {
+            'project_name': '사업명', 'agency': '기관', 'status': '상태', 'crawled_at': '수집일',
+        }, "재정지원사업 뉴스가 없습니다.")
+    with tab_trend:
+        history = profile['score_history']
+        if history:
+            trend = pd.DataFrame(history).sort_values('snapshot_date').set_index('snapshot_date')
+            st.line_chart(trend['total_score'])
+        else:
+            st.caption("점수 스냅샷이 아직 없습니다.")
+        show(profile['status_history'], {
+            'changed_at': '변경일시', 'old_status': '이전 상태', 'new_status': '변경 상태',
+        }, "영업 상태 변경 이력이 없습니다.")
+
+
 def render_target_school_db():
     render_page_header("타겟 학교 DB", "전국 CAD 관련 학교 통합 DB")
 
@@ -1590,11 +1873,21 @@ def render_target_school_db():
             if not row_match.empty:
                 sid = int(row_match.iloc[0]['id'])
                 if update_target_school_status(sid, new_status, memo):
+                    school_profile.clear_school_profile_cache(sel_school)
                     st.success(f"✅ {sel_school} → {new_status}")
                     st.rerun()
     else:
         empty_state("🔍", "필터 조건에 맞는 학교가 없습니다.")
 
+    # ── 학교 360° 프로필 (모든 수집 데이터를 학교 단위로 한 번에 조회) ──
+    st.markdown("---")
+    section_header("🏫", "학교 360° 프로필")
+    profile_query = st.text_input(
+        "학교명", placeholder="부산대학교 · 부산대 · 부산대학교 산학협력단", key="profile_school",
+    )
+    if profile_query.strip():
+        render_school_profile(school_profile.get_school_profile(profile_query))
+
     # ── 학교 데이터 관리 (CSV 업로드 / 수동 추가 / 삭제) ──
     st.markdown("---")
     section_header("📋", "학교 데이터 관리")
@@ -1959,6 +2252,14 @@ def render_purchase_signals():
                         st.success(f"✅ {count}건 신규 수집 완료")
                     else:
                         st.info("신규 입찰 뉴스가 없습니다.")
+            if st.button("🔄 전체 학교 스윕", use_container_width=True, key="univ_sweep",
+                         help="타겟 학교 전체를 묶음 쿼리로 검색 (오래 검색하지 않은 학교 우선)"):
+                with st.spinner("타겟 학교 전체 입찰 뉴스 스윕 중…"):
+                    count = univ_bids_crawler.sweep_univ_bid_news()
+                    if count > 0:
+                        st.success(f"✅ {count}건 신규 수집 완료")
+                    else:
+                        st.info("신규 입찰 뉴스가 없습니다.")
 
         bids_df = get_all_univ_bids()
 
@@ -24,10 +24,10 @@
 """
 import os
 import urllib.parse
-import requests
 import datetime
 from dotenv import load_dotenv
 from utils.db_manager import insert_bids
+from utils.http_cache import cached_get, is_data_go_kr_success
 
 load_dotenv()
 
@@ -229,7 +229,7 @@ def _call_bid_api(api_key: str, start_dt: datetime.datetime,
     }
     try:
         url = _build_url(_BID_URL, api_key, extra)
-        res = requests.get(url, timeout=20)
+        res = cached_get(url, source='koneps', timeout=20, cacheable=is_data_go_kr_success)
         if res.status_code != 200:
             return []
         data = res.json()
@@ -333,7 +333,8 @@ def fetch_pre_spec_bids(days: int = 30) -> int:
     }
 
     try:
-        res = requests.get(_build_url(_PRE_SPEC_URL, api_key, extra), timeout=20)
+        res = cached_get(_build_url(_PRE_SPEC_URL, api_key, extra), source='koneps',
+                         timeout=20, cacheable=is_data_go_kr_success)
         if res.status_code != 200:
             return 0
         data  = res.json()
@@ -410,7 +411,8 @@ def fetch_bid_results_for_history() -> int:
             extra["dminsttNm"] = demand_agency[:20]
 
         try:
-            res = requests.get(_build_url(_BID_URL, api_key, extra), timeout=15)
+            res = cached_get(_build_url(_BID_URL, api_key, extra), source='koneps',
+                             timeout=15, cacheable=is_data_go_kr_success)
             if res.status_code != 200:
                 continue
             data  = res.json()
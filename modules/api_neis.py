@@ -6,8 +6,8 @@ NEIS(교육행정정보시스템) 학교알리미 API 연동 모듈
 - 인증키 없이 무료 사용 가능 (공개 데이터)
 NEIS API 문서: https://open.neis.go.kr/portal/guide/apiIntroPage.do
 """
-import requests
 from typing import Optional
+from utils.http_cache import cached_get, is_neis_success
 
 NEIS_BASE = "https://open.neis.go.kr/hub"
 
@@ -18,7 +18,8 @@ def _neis_get(endpoint: str, params: dict) -> list:
     params.setdefault("pIndex", "1")
     params.setdefault("pSize", "100")
     try:
-        r = requests.get(f"{NEIS_BASE}/{endpoint}", params=params, timeout=15)
+        r = cached_get(f"{NEIS_BASE}/{endpoint}", params=params, source="neis", timeout=15,
+                       cacheable=is_neis_success)
         if r.status_code != 200:
             return []
         data = r.json()
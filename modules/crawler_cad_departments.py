@@ -9,22 +9,74 @@ CAD/CAM 학과 탐색 + 교수 정보 수집 크롤러
   1단계: Tavily 검색 → Gemini가 "이 학교에 CAD 학과가 있는지" 판별
   2단계: CAD 학과 확인 시 → Tavily로 교수진 검색 → Gemini가 구조화 추출
 
+■ 동시 스캔 (iter_scan_cad_departments)
+  - Tavily 검색 / Gemini 판별·추출을 단계별 스레드 풀로 분리해 여러 학교를 동시에 처리
+  - 호출 속도는 utils.rate_limiter 제공자별 토큰 버킷이 제한 (429 시 자동 백오프)
+  - 학교 1곳이 끝날 때마다 결과를 바로 반환 (UI 진행 표시·중간 저장)
+
+■ 묶음 판별 (CLASSIFY_BATCH_SIZE, 기본 5교)
+  - 여러 학교의 검색 근거(요약본)를 Gemini 요청 1건에 담아 학교별 JSON으로 판별
+  - 응답은 번호·학교명·형식을 검증해 분리, 깨졌거나 빠진 학교만 단건 판별로 재시도
+  - 묶음 크기는 입력 토큰 예산(CLASSIFY_TOKEN_BUDGET)으로 제한, 응답 파싱 실패 시 절반으로 축소
+  - benchmark_batch_classification() → 100교 기준 호출 수·토큰·시간 비교
+
+■ 검색 근거 압축 (utils/evidence_condenser)
+  - 프롬프트 조립 전 중복 스니펫·탐색 문구·키워드 없는 문장을 제거하고 출처 URL은 유지
+  - 판별 DETECT_EVIDENCE_TOKENS / 교수 추출 PROFESSOR_EVIDENCE_TOKENS / 묶음 판별 학교당 BATCH_EVIDENCE_TOKENS 예산
+  - evaluate_evidence_condensation() → 압축 전후 프롬프트 토큰과 판별 결과 일치도 비교
+
+■ 교수 연락처 규칙 추출 (utils/contact_extractor)
+  - ac.kr·hs.kr 이메일, 국내 전화번호, "OOO 교수" 이름을 정규식으로 먼저 추출
+  - 연결 신뢰도가 PREEXTRACT_MIN_CONFIDENCE 이상이면 Gemini 생략, 아니면 애매한 줄만 Gemini로 추출 후 병합
+
+■ 재개 가능한 스캔 작업 (scan_jobs / scan_tasks)
+  - 학교별 단계 pending → searched → classified → professors_collected 와
+    단계 산출물(검색 결과, 판별 JSON, 학과별 검색 결과·교수 목록)을 체크포인트로 저장
+  - 작업자는 학교를 claim(임대)해서 처리, 중단·취소된 작업은 저장된 단계부터 재개
+    → 이미 끝난 Tavily/Gemini 호출은 반복하지 않음
+
 ■ 법적 고려
   - 학과 홈페이지 공개 정보만 추출
   - 학과사무실 대표 연락처 우선 수집
   - 이메일 자동 수집 프로그램이 아닌, AI 기반 정보 정리 도구
 """
 import json
+import queue
 import re
-import time
 import os
-import requests
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-from tavily import TavilyClient
+from utils.tavily_cache import tavily_search, is_replay_mode
+from utils.gemini_cache import generate_text
+from utils.llm_client import json_generation_config
+from utils.contact_extractor import extract_with_fallback
+from utils.evidence_condenser import (
+    CONTACT_KEYWORDS,
+    CONTACT_PATTERNS,
+    DEPARTMENT_KEYWORDS,
+    condense,
+    condense_evidence,
+    estimate_tokens,
+)
 from utils.db_manager import (
     insert_contacts,
     update_target_school_cad_info,
     get_cad_scan_pending_schools,
+    create_scan_job,
+    get_scan_job,
+    get_unfinished_scan_job,
+    claim_scan_tasks,
+    save_scan_task_stage,
+    finish_scan_task,
+    requeue_scan_tasks,
+    set_scan_job_status,
+    finalize_scan_job,
+    get_scan_job_progress,
+    get_scan_task_evidence,
 )
 
 load_dotenv()
@@ -42,40 +94,81 @@ CAD_KEYWORDS = [
     '유한요소해석', 'FEA', 'CFD', '시뮬레이션',
 ]
 
+# 검색 근거 압축 기준 (utils.evidence_condenser) — 판별: CAD + 학과 문맥, 교수 추출: 연락처 문맥
+DETECT_KEYWORDS = CAD_KEYWORDS + DEPARTMENT_KEYWORDS
+PROFESSOR_KEYWORDS = CONTACT_KEYWORDS + ['CAD', '설계', '기계']
+
+# 프롬프트에 넣을 검색 근거 토큰 예산 (환경변수로 조정)
+DETECT_EVIDENCE_TOKENS = int(os.getenv("CAD_DETECT_EVIDENCE_TOKENS", "2500"))
+PROFESSOR_EVIDENCE_TOKENS = int(os.getenv("CAD_PROFESSOR_EVIDENCE_TOKENS", "2000"))
+
 
 # ──────────────────────────────────────────────
 # Gemini API 호출 (공통)
 # ──────────────────────────────────────────────
 
-def _call_gemini(prompt: str, max_tokens: int = 4096) -> str:
-    """Gemini REST API를 호출하고 응답 텍스트를 반환합니다."""
+# Gemini JSON 스키마 응답 모드 (utils.llm_client.json_generation_config)
+_DEPARTMENT_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "dept_name": {"type": "STRING"},
+        "cad_subjects": {"type": "ARRAY", "items": {"type": "STRING"}},
+        "confidence": {"type": "STRING", "enum": ["high", "medium", "low"]},
+    },
+    "required": ["dept_name"],
+}
+DETECT_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "has_cad_dept": {"type": "BOOLEAN"},
+        "departments": {"type": "ARRAY", "items": _DEPARTMENT_SCHEMA},
+    },
+    "required": ["has_cad_dept", "departments"],
+}
+BATCH_DETECT_SCHEMA = {
+    "type": "ARRAY",
+    "items": {
+        "type": "OBJECT",
+        "properties": {
+            "id": {"type": "INTEGER"},
+            "school_name": {"type": "STRING"},
+            **DETECT_SCHEMA["properties"],
+        },
+        "required": ["id", "school_name", "has_cad_dept", "departments"],
+    },
+}
+PROFESSOR_SCHEMA = {
+    "type": "ARRAY",
+    "items": {
+        "type": "OBJECT",
+        "properties": {
+            key: {"type": "STRING"}
+            for key in ("name", "department", "email", "phone", "research_area", "source_url")
+        },
+        "required": ["name"],
+    },
+}
+
+
+def _call_gemini(prompt: str, max_tokens: int = 4096, cache: bool = None,
+                 response_schema: dict = None) -> str:
+    """
+    Gemini REST API를 호출하고 응답 텍스트를 반환합니다.
+    cache=False: 캐시 미사용 (벤치마크용), response_schema: JSON 스키마 응답 모드
+    """
     if not GEMINI_API_KEY or len(GEMINI_API_KEY) < 20:
         raise ValueError("GEMINI_API_KEY가 누락되었거나 유효하지 않습니다.")
 
-    api_url = (
-        f"https://generativelanguage.googleapis.com/v1beta"
-        f"/models/gemini-2.5-flash:generateContent?key={GEMINI_API_KEY}"
-    )
-    payload = {
-        "contents": [{"parts": [{"text": prompt}]}],
-        "generationConfig": {"temperature": 0.1, "maxOutputTokens": max_tokens},
-    }
-    res = requests.post(
-        api_url,
-        headers={"Content-Type": "application/json"},
-        json=payload,
-        timeout=60,
-    )
-    if res.status_code != 200:
-        raise RuntimeError(f"Gemini API 에러 [{res.status_code}]: {res.text[:200]}")
-
-    parts = (
-        res.json()
-        .get("candidates", [{}])[0]
-        .get("content", {})
-        .get("parts", [])
+    if response_schema:
+        generation_config = json_generation_config(response_schema, 0.1, max_tokens)
+    else:
+        generation_config = {"temperature": 0.1, "maxOutputTokens": max_tokens}
+
+    # 동일 프롬프트(같은 학교 + 같은 검색 결과)는 캐시된 응답 재사용
+    return generate_text(
+        prompt, GEMINI_API_KEY, generation_config,
+        timeout=60, source='cad_departments', cache=cache,
     )
-    return parts[0].get("text", "") if parts else ""
 
 
 def _parse_json_response(raw_text: str) -> dict | list:
@@ -124,20 +217,20 @@ def _parse_json_response(raw_text: str) -> dict | list:
 # Tavily 검색 (공통)
 # ──────────────────────────────────────────────
 
-def _tavily_search(queries: list, max_results: int = 3) -> str:
-    """여러 쿼리로 Tavily 검색을 실행하고 결과를 합칩니다."""
-    if not TAVILY_API_KEY:
+def _tavily_search(queries: list, family: str, max_results: int = 3) -> str:
+    """
+    여러 쿼리로 Tavily 검색을 실행하고 결과를 합칩니다.
+    family: 캐시 TTL 구분 ('curriculum' / 'professor') — utils.tavily_cache 참조
+    """
+    if not TAVILY_API_KEY and not is_replay_mode():
         raise ValueError("TAVILY_API_KEY가 누락되었습니다.")
 
-    client = TavilyClient(api_key=TAVILY_API_KEY)
     all_parts = []
 
     for query in queries:
         try:
-            res = client.search(
-                query=query,
-                search_depth="advanced",
-                include_raw_content=False,
+            res = tavily_search(
+                query, family, TAVILY_API_KEY,
                 max_results=max_results,
             )
             for r in res.get("results", []):
@@ -209,30 +302,8 @@ CAD, CAM, CAE, CATIA, SolidWorks, NX, AutoCAD, 3D모델링, 기계설계,
 [끝]"""
 
 
-def scan_cad_department(school_name: str, school_type: str = '4년제') -> dict:
-    """
-    단일 학교에 대해 CAD/CAM 학과 보유 여부를 판별합니다.
-
-    반환값:
-        {
-            "has_cad_dept": True/False,
-            "dept_names": ["기계공학과", ...],
-            "details": [{"dept_name": "...", "cad_subjects": [...], "confidence": "high"}]
-        }
-    """
-    queries = _build_curriculum_queries(school_name, school_type)
-    content = _tavily_search(queries)
-
-    if not content:
-        return {"has_cad_dept": False, "dept_names": [], "details": []}
-
-    prompt = _build_cad_detect_prompt(school_name, content)
-    raw = _call_gemini(prompt)
-    result = _parse_json_response(raw)
-
-    if not isinstance(result, dict):
-        return {"has_cad_dept": False, "dept_names": [], "details": []}
-
+def _apply_cad_detection(school_name: str, result: dict) -> dict:
+    """판별 JSON을 정리해 DB(target_schools)에 반영하고 공통 반환 형식으로 바꿉니다."""
     has_cad = result.get("has_cad_dept", False)
     departments = result.get("departments", [])
 
@@ -252,6 +323,354 @@ def scan_cad_department(school_name: str, school_type: str = '4년제') -> dict:
     }
 
 
+def _detect_cad_departments(school_name: str, content: str) -> dict:
+    """검색 결과로 CAD 학과 보유 여부를 판별하고 DB에 반영합니다."""
+    if not content:
+        return {"has_cad_dept": False, "dept_names": [], "details": []}
+
+    # 중복·탐색 문구·저신호 문장을 걷어낸 근거만 전송
+    evidence = condense_evidence(content, DETECT_KEYWORDS, DETECT_EVIDENCE_TOKENS)
+    prompt = _build_cad_detect_prompt(school_name, evidence)
+    raw = _call_gemini(prompt, response_schema=DETECT_SCHEMA)
+    result = _parse_json_response(raw)
+
+    if not isinstance(result, dict):
+        return {"has_cad_dept": False, "dept_names": [], "details": []}
+
+    return _apply_cad_detection(school_name, result)
+
+
+# ──────────────────────────────────────────────
+# 1단계(묶음): 여러 학교 CAD 학과 동시 판별
+# ──────────────────────────────────────────────
+
+# 요청 1건에 묶을 최대 학교 수 (1이면 학교별 단건 판별, 환경변수 CAD_CLASSIFY_BATCH_SIZE)
+CLASSIFY_BATCH_SIZE = int(os.getenv("CAD_CLASSIFY_BATCH_SIZE", "5"))
+
+# 묶음 요청 1건의 입력 토큰 예산 (환경변수 CAD_CLASSIFY_TOKEN_BUDGET)
+CLASSIFY_TOKEN_BUDGET = int(os.getenv("CAD_CLASSIFY_TOKEN_BUDGET", "12000"))
+
+# 묶음 판별 시 학교 1곳당 검색 근거 토큰 예산
+BATCH_EVIDENCE_TOKENS = int(os.getenv("CAD_BATCH_EVIDENCE_TOKENS", "1200"))
+
+# 응답 토큰: 기본 + 학교당 (판별 JSON 1건 분량)
+_BATCH_OUTPUT_BASE_TOKENS = 512
+_BATCH_OUTPUT_TOKENS_PER_SCHOOL = 384
+_MAX_OUTPUT_TOKENS = 8192
+
+
+def _condense_evidence(content: str, token_budget: int = BATCH_EVIDENCE_TOKENS, track: bool = True) -> str:
+    """묶음 판별용으로 검색 결과를 압축합니다 (utils.evidence_condenser, CAD·학과 키워드 기준)."""
+    return condense_evidence(content, DETECT_KEYWORDS, token_budget, track=track)
+
+
+def _build_cad_batch_prompt(items: list) -> str:
+    """여러 학교(items: [(학교명, 근거), ...])를 한 번에 판별하는 Gemini 프롬프트를 생성합니다."""
+    sections = "\n\n".join(
+        f"[검색 결과 {idx}: {name}]\n{evidence}\n[끝 {idx}]"
+        for idx, (name, evidence) in enumerate(items, 1)
+    )
+    return f"""다음은 {len(items)}개 학교의 학과 및 교육과정 관련 웹 검색 결과야.
+
+학교마다 따로, 아래 키워드와 관련된 교과목이나 실습 과정이 있는 학과를 찾아줘.
+
+[관련 키워드]
+CAD, CAM, CAE, CATIA, SolidWorks, NX, AutoCAD, 3D모델링, 기계설계,
+기구설계, 금형설계, 메카트로닉스, 자동화설계, 디지털트윈,
+3D프린팅, CNC, 컴퓨터응용설계, 컴퓨터응용가공, 스마트팩토리
+
+반드시 아래 형식의 유효한 JSON 배열만 반환해. 마크다운이나 설명은 절대 포함하지 마.
+학교마다 정확히 1개 항목을 만들고, id는 검색 결과 번호를 그대로 사용해.
+
+[
+  {{
+    "id": 검색 결과 번호,
+    "school_name": "학교명",
+    "has_cad_dept": true 또는 false,
+    "departments": [
+      {{
+        "dept_name": "학과명",
+        "cad_subjects": ["발견된 CAD 관련 교과목명"],
+        "confidence": "high 또는 medium 또는 low"
+      }}
+    ]
+  }}
+]
+
+주의사항:
+- 해당 학교의 검색 결과에 나온 정보만 사용할 것 (추측 금지, 다른 학교 결과와 섞지 말 것)
+- 관련 학과가 없으면 "has_cad_dept": false, "departments": []
+- 학과명은 정확히 기재 (예: "기계공학과", "스마트기계공학과")
+- confidence: 검색 결과에 교과목명이 명확히 나오면 "high", 학과명만 있으면 "medium", 불확실하면 "low"
+
+{sections}"""
+
+
+def _batch_output_tokens(count: int) -> int:
+    return min(_MAX_OUTPUT_TOKENS, _BATCH_OUTPUT_BASE_TOKENS + _BATCH_OUTPUT_TOKENS_PER_SCHOOL * count)
+
+
+def _validate_batch_item(item, items: list) -> dict | None:
+    """묶음 응답 항목 1개를 검증합니다. 형식이 맞으면 {"idx", "has_cad_dept", "departments"}, 아니면 None."""
+    if not isinstance(item, dict):
+        return None
+    idx = item.get("id")
+    if isinstance(idx, str) and idx.strip().isdigit():
+        idx = int(idx)
+    if not isinstance(idx, int) or isinstance(idx, bool) or not 1 <= idx <= len(items):
+        return None
+    name = item.get("school_name")
+    if name and name.strip() != items[idx - 1][0]:
+        return None   # 번호와 학교명이 어긋나면 결과가 섞였을 수 있으므로 버림
+    if not isinstance(item.get("has_cad_dept"), bool):
+        return None
+    departments = item.get("departments", [])
+    if not isinstance(departments, list):
+        return None
+    departments = [d for d in departments if isinstance(d, dict) and isinstance(d.get("dept_name"), str)]
+    return {"idx": idx - 1, "has_cad_dept": item["has_cad_dept"], "departments": departments}
+
+
+def _split_batch_response(raw: str, items: list) -> list:
+    """묶음 응답을 검증·분리합니다. 반환값: 입력 순서의 판별 dict 목록 (검증 실패 학교는 None)."""
+    parsed = _parse_json_response(raw)
+    results = [None] * len(items)
+    if not isinstance(parsed, list):
+        return results
+    for item in parsed:
+        valid = _validate_batch_item(item, items)
+        if valid is not None and results[valid['idx']] is None:
+            results[valid['idx']] = {
+                "has_cad_dept": valid['has_cad_dept'],
+                "departments": valid['departments'],
+            }
+    return results
+
+
+def _detect_cad_departments_batch(items: list, apply: bool = True) -> dict:
+    """
+    여러 학교의 검색 결과를 Gemini 요청 1건으로 판별합니다.
+    응답이 깨졌거나 빠진 학교는 학교별 단건 판별로 대체합니다.
+
+    파라미터:
+        items: [(학교명, 검색 결과), ...]
+        apply: True이면 판별 결과를 DB(target_schools)에 반영
+    반환값:
+        {"results": [판별 dict 또는 Exception, ...] (입력 순서),
+         "calls": Gemini 호출 수, "fallbacks": 단건 재판별 학교 수, "parse_failed": 응답 전체 파싱 실패 여부}
+    """
+    empty = {"has_cad_dept": False, "dept_names": [], "details": []}
+    results = [None] * len(items)
+    targets = []
+    for pos, (name, content) in enumerate(items):
+        if content:
+            targets.append(pos)
+        else:
+            results[pos] = dict(empty)
+
+    calls = 0
+    parse_failed = False
+    split = []
+    if len(targets) > 1:
+        batch = [(items[p][0], _condense_evidence(items[p][1])) for p in targets]
+        try:
+            raw = _call_gemini(_build_cad_batch_prompt(batch), max_tokens=_batch_output_tokens(len(batch)),
+                               response_schema=BATCH_DETECT_SCHEMA)
+            calls += 1
+            split = _split_batch_response(raw, batch)
+            parse_failed = all(r is None for r in split)
+        except Exception as e:
+            print(f"[CAD 묶음 판별 오류] {len(batch)}교: {e}")
+            parse_failed = True
+
+    fallbacks = 0
+    for n, pos in enumerate(targets):
+        name, content = items[pos]
+        parsed = split[n] if n < len(split) else None
+        try:
+            if parsed is not None:
+                results[pos] = _apply_cad_detection(name, parsed) if apply else parsed
+                continue
+            if len(targets) > 1:
+                fallbacks += 1
+            calls += 1
+            if apply:
+                results[pos] = _detect_cad_departments(name, content)
+            else:
+                results[pos] = _parse_json_response(
+                    _call_gemini(_build_cad_detect_prompt(name, content), response_schema=DETECT_SCHEMA)
+                )
+        except Exception as e:
+            results[pos] = e
+
+    return {"results": results, "calls": calls, "fallbacks": fallbacks, "parse_failed": parse_failed}
+
+
+def _plan_classify_batches(items: list, max_size: int = None, token_budget: int = None) -> list:
+    """
+    (학교명, 검색 결과) 목록을 토큰 예산·최대 크기에 맞춰 묶음으로 나눕니다.
+    반환값: [[(학교명, 검색 결과), ...], ...]
+    """
+    max_size = max(1, max_size or CLASSIFY_BATCH_SIZE)
+    token_budget = token_budget or CLASSIFY_TOKEN_BUDGET
+    batches = []
+    current = []
+    current_tokens = 0
+    for name, content in items:
+        tokens = estimate_tokens(_condense_evidence(content, track=False))
+        if current and (len(current) >= max_size or current_tokens + tokens > token_budget):
+            batches.append(current)
+            current = []
+            current_tokens = 0
+        current.append((name, content))
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+class _ClassifyBatcher:
+    """
+    교육과정 검색이 끝난 학교를 모아 토큰 예산·최대 크기가 차면 묶음 판별로 넘깁니다.
+    남은 검색이 없으면 모인 만큼 바로 넘기고, 응답 파싱이 통째로 실패하면 이후 묶음 크기를 절반으로 줄입니다.
+    """
+
+    def __init__(self, expected: int, submit, max_size: int = None, token_budget: int = None):
+        self.expected = expected
+        self.submit = submit
+        self.max_size = max(1, max_size or CLASSIFY_BATCH_SIZE)
+        self.token_budget = token_budget or CLASSIFY_TOKEN_BUDGET
+        self.buffer = []
+        self.buffer_tokens = 0
+        self.lock = threading.Lock()
+
+    def _take(self) -> list:
+        batch, self.buffer, self.buffer_tokens = self.buffer, [], 0
+        return batch
+
+    def add(self, scan, content: str) -> None:
+        ready = []
+        with self.lock:
+            self.expected -= 1
+            tokens = estimate_tokens(_condense_evidence(content, track=False))
+            if self.buffer and self.buffer_tokens + tokens > self.token_budget:
+                ready.append(self._take())
+            self.buffer.append((scan, content))
+            self.buffer_tokens += tokens
+            if len(self.buffer) >= self.max_size or self.expected <= 0:
+                ready.append(self._take())
+        for batch in ready:
+            self.submit(batch)
+
+    def skip(self) -> None:
+        """묶음에 들어오지 않고 끝난 학교 (검색 오류·빈 결과) — 대기 중인 묶음이 막히지 않게 처리."""
+        ready = None
+        with self.lock:
+            self.expected -= 1
+            if self.expected <= 0 and self.buffer:
+                ready = self._take()
+        if ready:
+            self.submit(ready)
+
+    def shrink(self) -> None:
+        with self.lock:
+            self.max_size = max(1, self.max_size // 2)
+
+
+def benchmark_batch_classification(evidence: dict = None, batch_sizes: tuple = (1, 5, 10),
+                                   live: bool = False, per_schools: int = 100) -> list:
+    """
+    단건 판별과 묶음 판별의 호출 수·토큰·시간을 학교 100곳 기준으로 비교합니다.
+
+    파라미터:
+        evidence: {학교명: 교육과정 검색 결과} (없으면 scan_tasks에 저장된 검색 결과 사용)
+        batch_sizes: 비교할 최대 묶음 크기 (1 = 기존 학교별 단건 판별)
+        live: True이면 실제 Gemini를 호출해 시간·대체 호출까지 측정 (DB 반영·캐시 없음)
+    반환값:
+        [{"batch_size", "schools", "calls", "prompt_tokens", "output_token_limit",
+          "output_tokens"(live), "wall_sec"(live), "fallbacks"(live)}, ...] — 수치는 per_schools 기준으로 환산
+    ※ 토큰은 estimate_tokens 추정치 (output_tokens는 실제 응답 길이 기준)
+    """
+    if evidence is None:
+        evidence = get_scan_task_evidence(limit=per_schools)
+    items = [(name, content) for name, content in evidence.items() if content]
+    if not items:
+        return []
+    scale = per_schools / len(items)
+
+    rows = []
+    for size in batch_sizes:
+        batches = _plan_classify_batches(items, max_size=size)
+        prompts = [
+            _build_cad_detect_prompt(
+                b[0][0], condense_evidence(b[0][1], DETECT_KEYWORDS, DETECT_EVIDENCE_TOKENS, track=False)
+            ) if len(b) == 1
+            else _build_cad_batch_prompt([(n, _condense_evidence(c, track=False)) for n, c in b])
+            for b in batches
+        ]
+        row = {
+            'batch_size': size,
+            'schools': len(items),
+            'calls': len(batches),
+            'prompt_tokens': sum(estimate_tokens(p) for p in prompts),
+            'output_token_limit': sum(4096 if len(b) == 1 else _batch_output_tokens(len(b)) for b in batches),
+        }
+
+        if live:
+            started = time.perf_counter()
+            calls = fallbacks = output_tokens = 0
+            for batch, prompt in zip(batches, prompts):
+                if len(batch) == 1:
+                    raw = _call_gemini(prompt, cache=False, response_schema=DETECT_SCHEMA)
+                    calls += 1
+                    output_tokens += estimate_tokens(raw)
+                    continue
+                # 묶음 응답의 출력 토큰은 대체 호출 포함 전체 응답 길이로 추정
+                raw = _call_gemini(prompt, max_tokens=_batch_output_tokens(len(batch)), cache=False,
+                                   response_schema=BATCH_DETECT_SCHEMA)
+                calls += 1
+                output_tokens += estimate_tokens(raw)
+                split = _split_batch_response(raw, [(n, _condense_evidence(c, track=False)) for n, c in batch])
+                for (name, content), parsed in zip(batch, split):
+                    if parsed is None:
+                        fallbacks += 1
+                        calls += 1
+                        output_tokens += estimate_tokens(
+                            _call_gemini(_build_cad_detect_prompt(
+                                name, condense_evidence(content, DETECT_KEYWORDS, DETECT_EVIDENCE_TOKENS, track=False)
+                            ), cache=False,
+                                         response_schema=DETECT_SCHEMA)
+                        )
+            row.update({
+                'calls': calls,
+                'output_tokens': output_tokens,
+                'wall_sec': round(time.perf_counter() - started, 2),
+                'fallbacks': fallbacks,
+            })
+
+        for key in ('calls', 'prompt_tokens', 'output_token_limit', 'output_tokens', 'wall_sec', 'fallbacks'):
+            if key in row:
+                row[key] = round(row[key] * scale, 1)
+        rows.append(row)
+    return rows
+
+
+def scan_cad_department(school_name: str, school_type: str = '4년제') -> dict:
+    """
+    단일 학교에 대해 CAD/CAM 학과 보유 여부를 판별합니다.
+
+    반환값:
+        {
+            "has_cad_dept": True/False,
+            "dept_names": ["기계공학과", ...],
+            "details": [{"dept_name": "...", "cad_subjects": [...], "confidence": "high"}]
+        }
+    """
+    queries = _build_curriculum_queries(school_name, school_type)
+    content = _tavily_search(queries, 'curriculum')
+    return _detect_cad_departments(school_name, content)
+
+
 # ──────────────────────────────────────────────
 # 2단계: 교수진 정보 수집
 # ──────────────────────────────────────────────
@@ -286,9 +705,46 @@ def _build_professor_prompt(school_name: str, dept_name: str, content: str) -> s
 [끝]"""
 
 
+def _build_professor_queries(school_name: str, dept: str) -> list:
+    return [
+        f'"{school_name}" "{dept}" 교수진 연락처 이메일',
+        f'"{school_name}" "{dept}" 학과사무실 전화번호',
+    ]
+
+
+def _extract_professors(school_name: str, dept: str, content: str) -> list:
+    """
+    학과 검색 결과에서 교수·학과사무실 정보를 추출합니다.
+    규칙 추출(utils/contact_extractor)로 충분하면 Gemini를 생략하고, 아니면 애매한 줄만 Gemini로 보냅니다.
+    """
+    if not content:
+        return []
+
+    def llm_extract(text: str) -> list:
+        evidence = condense_evidence(
+            text, PROFESSOR_KEYWORDS + [dept], PROFESSOR_EVIDENCE_TOKENS, keep_patterns=CONTACT_PATTERNS,
+        )
+        result = _parse_json_response(
+            _call_gemini(_build_professor_prompt(school_name, dept, evidence), response_schema=PROFESSOR_SCHEMA)
+        )
+        return result if isinstance(result, list) else []
+
+    professors = []
+    for prof in extract_with_fallback(content, llm_extract, dept):
+        if not prof.get("name"):
+            continue
+        prof["school_name"] = school_name
+        # department가 없으면 현재 학과명으로 채움
+        if not prof.get("department"):
+            prof["department"] = dept
+        professors.append(prof)
+    return professors
+
+
 def scan_and_collect_professors(school_name: str, dept_names: list) -> list:
     """
     CAD 학과가 확인된 학교에 대해 교수진 정보를 수집합니다.
+    (호출 간격은 utils.rate_limiter 토큰 버킷이 조절)
 
     반환값: [{"school_name", "name", "department", "email", "phone",
              "research_area", "source_url"}, ...]
@@ -296,108 +752,430 @@ def scan_and_collect_professors(school_name: str, dept_names: list) -> list:
     all_professors = []
 
     for dept in dept_names:
-        queries = [
-            f'"{school_name}" "{dept}" 교수진 연락처 이메일',
-            f'"{school_name}" "{dept}" 학과사무실 전화번호',
-        ]
-        content = _tavily_search(queries, max_results=3)
+        content = _tavily_search(_build_professor_queries(school_name, dept), 'professor', max_results=3)
+        all_professors.extend(_extract_professors(school_name, dept, content))
 
-        if not content:
-            continue
+    return all_professors
 
-        prompt = _build_professor_prompt(school_name, dept, content)
-        raw = _call_gemini(prompt)
-        result = _parse_json_response(raw)
 
-        if not isinstance(result, list):
-            continue
+# ──────────────────────────────────────────────
+# 배치 실행
+# ──────────────────────────────────────────────
+
+# 단계별 동시 실행 수 (환경변수로 조정, 실제 호출 속도는 토큰 버킷이 제한)
+TAVILY_WORKERS = int(os.getenv("CAD_SCAN_TAVILY_WORKERS", "4"))
+GEMINI_WORKERS = int(os.getenv("CAD_SCAN_GEMINI_WORKERS", "3"))
 
-        for prof in result:
-            if not prof.get("name"):
+
+def _dept_set(result) -> set:
+    if not isinstance(result, dict):
+        return set()
+    return {
+        re.sub(r'\s+', '', d.get('dept_name', ''))
+        for d in result.get('departments', []) if isinstance(d, dict) and d.get('dept_name')
+    }
+
+
+def evaluate_evidence_condensation(evidence: dict = None, limit: int = 50, live: bool = False) -> dict:
+    """
+    검색 근거 압축 전후의 프롬프트 토큰과 판별 결과 일치도를 비교합니다.
+
+    파라미터:
+        evidence: {학교명: 교육과정 검색 결과} (없으면 scan_tasks에 저장된 검색 결과 — 평가 세트)
+        live: True이면 원문·압축본 프롬프트로 각각 판별해 답 일치도 계산
+              (Gemini 캐시 경유 → 같은 평가 세트를 다시 돌리면 API 호출 없음, DB 반영 없음)
+    반환값:
+        {"samples", "tokens_before", "tokens_after", "reduction",
+         "agreement"(live: has_cad_dept 일치율), "dept_overlap"(live: 학과명 Jaccard 평균),
+         "details": [{"school_name", "tokens_before", "tokens_after", "agree", "dept_overlap"}, ...]}
+    """
+    if evidence is None:
+        evidence = get_scan_task_evidence(limit=limit)
+    items = [(name, content) for name, content in evidence.items() if content][:limit]
+
+    details = []
+    for name, content in items:
+        raw_prompt = _build_cad_detect_prompt(name, content)
+        condensed = condense(content, DETECT_KEYWORDS, DETECT_EVIDENCE_TOKENS, track=False)
+        short_prompt = _build_cad_detect_prompt(name, condensed['text'])
+        row = {
+            'school_name': name,
+            'tokens_before': estimate_tokens(raw_prompt),
+            'tokens_after': estimate_tokens(short_prompt),
+        }
+        if live:
+            before = _parse_json_response(_call_gemini(raw_prompt, response_schema=DETECT_SCHEMA))
+            after = _parse_json_response(_call_gemini(short_prompt, response_schema=DETECT_SCHEMA))
+            before_depts, after_depts = _dept_set(before), _dept_set(after)
+            union = before_depts | after_depts
+            row['agree'] = (
+                isinstance(before, dict) and isinstance(after, dict)
+                and bool(before.get('has_cad_dept')) == bool(after.get('has_cad_dept'))
+            )
+            row['dept_overlap'] = round(len(before_depts & after_depts) / len(union), 3) if union else 1.0
+        details.append(row)
+
+    tokens_before = sum(d['tokens_before'] for d in details)
+    tokens_after = sum(d['tokens_after'] for d in details)
+    summary = {
+        'samples': len(details),
+        'tokens_before': tokens_before,
+        'tokens_after': tokens_after,
+        'reduction': round(1 - tokens_after / tokens_before, 3) if tokens_before else 0.0,
+        'details': details,
+    }
+    if live and details:
+        summary['agreement'] = round(sum(1 for d in details if d['agree']) / len(details), 3)
+        summary['dept_overlap'] = round(sum(d['dept_overlap'] for d in details) / len(details), 3)
+    return summary
+
+
+# 학교별 진행 단계 (scan_tasks.stage) — 재개 시 저장된 단계 다음부터 실행
+STAGE_PENDING = 'pending'
+STAGE_SEARCHED = 'searched'                 # 교육과정 검색 결과 저장됨
+STAGE_CLASSIFIED = 'classified'             # CAD 학과 판별 결과 저장됨
+STAGE_PROFESSORS = 'professors_collected'   # 교수 정보 저장 완료
+
+# 작업자가 한 번에 가져오는 학교 수 (배치 사이에 취소 여부 확인)
+CLAIM_BATCH_SIZE = int(os.getenv("CAD_SCAN_CLAIM_SIZE", "10"))
+
+
+class _SchoolScan:
+    """동시 스캔 중인 학교 1곳의 진행 상태 (저장된 단계·중간 산출물 + 학과별 완료 대기)."""
+
+    def __init__(self, school: dict):
+        self.task_id = school.get('task_id')
+        self.school_type = school.get('school_type', '4년제')
+        self.stage = school.get('stage') or STAGE_PENDING
+        self.search_content = school.get('search_content')
+        self.classification = school.get('classification')
+        # {학과명: {"content": 검색 결과, "professors": [...]}}
+        self.dept_artifacts = dict(school.get('dept_artifacts') or {})
+        self.entry = {
+            'school_name': school['school_name'],
+            'has_cad': None,
+            'dept_names': [],
+            'professors_count': school.get('professors_count', 0) if self.stage == STAGE_PROFESSORS else 0,
+        }
+        if self.stage != STAGE_PENDING:
+            self.entry['resumed_from'] = self.stage
+        self.professors = []
+        self.pending_depts = 0
+        self.done = False
+        self.batched = False    # 묶음 판별 대기 수에서 빠졌는지 (_ClassifyBatcher.add/skip 호출 여부)
+        self.lock = threading.Lock()
+
+    def checkpoint(self, **fields) -> None:
+        """scan_tasks에 단계·산출물을 저장합니다 (작업에 속하지 않은 학교는 생략)."""
+        if self.task_id is not None:
+            save_scan_task_stage(self.task_id, **fields)
+
+
+def iter_scan_cad_departments(schools: list, collect_professors: bool = True,
+                              tavily_workers: int = None, gemini_workers: int = None,
+                              classify_batch_size: int = None):
+    """
+    여러 학교를 단계별 스레드 풀로 동시에 스캔하고, 학교가 끝나는 순서대로 결과를 반환합니다.
+
+    파라미터:
+        schools: [{"school_name", "school_type"}, ...] (get_cad_scan_pending_schools 형식)
+                 또는 claim_scan_tasks 결과 — task_id가 있으면 단계마다 체크포인트를 저장하고
+                 저장된 단계(stage)·산출물부터 이어서 실행 (이미 끝난 Tavily/Gemini 호출은 생략)
+        collect_professors: True이면 CAD 학과 발견 시 교수 정보도 수집·저장
+        classify_batch_size: CAD 학과 판별을 요청 1건에 묶을 최대 학교 수
+                             (기본 CLASSIFY_BATCH_SIZE, 1이면 학교별 단건 판별)
+    yield:
+        {"school_name", "has_cad", "dept_names", "professors_count"[, "resumed_from"][, "error"]}
+    """
+    if not schools:
+        return
+    classify_batch_size = classify_batch_size or CLASSIFY_BATCH_SIZE
+
+    tavily_pool = ThreadPoolExecutor(max_workers=tavily_workers or TAVILY_WORKERS)
+    gemini_pool = ThreadPoolExecutor(max_workers=gemini_workers or GEMINI_WORKERS)
+    finished = queue.Queue()
+
+    def finish(scan: _SchoolScan, error: Exception = None, stage: str = None):
+        with scan.lock:
+            if scan.done:   # 다른 학과 단계에서 이미 오류로 종료된 학교
+                return
+            scan.done = True
+        if error is not None:
+            print(f"[CAD 스캔 오류] {scan.entry['school_name']}: {error}")
+            scan.entry['error'] = str(error)
+        if scan.task_id is not None:
+            try:
+                finish_scan_task(
+                    scan.task_id, error=scan.entry.get('error'),
+                    professors_count=scan.entry['professors_count'], stage=stage,
+                )
+            except Exception as e:
+                print(f"[CAD 스캔 체크포인트 오류] {scan.entry['school_name']}: {e}")
+        finished.put(scan.entry)
+
+    def chain(future, on_success, scan, on_error=None):
+        """이전 단계가 끝나면 다음 단계를 실행합니다 (예외 시 학교 단위 오류로 종료)."""
+        def _done(f):
+            try:
+                on_success(f.result())
+            except Exception as e:
+                finish(scan, e)
+                if on_error:
+                    on_error()
+        future.add_done_callback(_done)
+
+    def on_dept_done(scan: _SchoolScan, dept: str, professors: list, save: bool = True):
+        with scan.lock:
+            if save:
+                scan.dept_artifacts.setdefault(dept, {})['professors'] = professors
+                scan.checkpoint(dept_artifacts=scan.dept_artifacts)
+            scan.professors.extend(professors)
+            scan.pending_depts -= 1
+            last = scan.pending_depts == 0
+        if last:
+            if scan.professors:
+                scan.entry['professors_count'] = insert_contacts(scan.professors)
+            finish(scan, stage=STAGE_PROFESSORS)
+
+    def extract_dept(scan: _SchoolScan, dept: str, content: str):
+        chain(
+            gemini_pool.submit(_extract_professors, scan.entry['school_name'], dept, content),
+            lambda profs: on_dept_done(scan, dept, profs), scan,
+        )
+
+    def on_dept_searched(scan: _SchoolScan, dept: str, content: str):
+        with scan.lock:
+            scan.dept_artifacts.setdefault(dept, {})['content'] = content
+            scan.checkpoint(dept_artifacts=scan.dept_artifacts)
+        extract_dept(scan, dept, content)
+
+    def start_dept(scan: _SchoolScan, dept: str):
+        saved = scan.dept_artifacts.get(dept, {})
+        if 'professors' in saved:
+            on_dept_done(scan, dept, saved['professors'], save=False)
+        elif 'content' in saved:
+            extract_dept(scan, dept, saved['content'])
+        else:
+            search = tavily_pool.submit(
+                _tavily_search, _build_professor_queries(scan.entry['school_name'], dept), 'professor', 3
+            )
+            chain(search, lambda content: on_dept_searched(scan, dept, content), scan)
+
+    def on_detected(scan: _SchoolScan, result: dict):
+        scan.entry['has_cad'] = result['has_cad_dept']
+        scan.entry['dept_names'] = result['dept_names']
+        if scan.stage == STAGE_PROFESSORS:
+            finish(scan)
+            return
+        if not (result['has_cad_dept'] and collect_professors and result['dept_names']):
+            finish(scan)
+            return
+        scan.pending_depts = len(result['dept_names'])
+        for dept in result['dept_names']:
+            start_dept(scan, dept)
+
+    def on_classified(scan: _SchoolScan, result: dict):
+        scan.checkpoint(stage=STAGE_CLASSIFIED, classification=result)
+        on_detected(scan, result)
+
+    def on_batch_classified(future, batch: list):
+        try:
+            outcome = future.result()
+        except Exception as e:
+            for scan, _ in batch:
+                finish(scan, e)
+            return
+        if outcome['parse_failed']:
+            batcher.shrink()
+        for (scan, _), result in zip(batch, outcome['results']):
+            if isinstance(result, Exception):
+                finish(scan, result)
                 continue
-            prof["school_name"] = school_name
-            # department가 없으면 현재 학과명으로 채움
-            if not prof.get("department"):
-                prof["department"] = dept
-            all_professors.append(prof)
+            try:
+                on_classified(scan, result)
+            except Exception as e:
+                finish(scan, e)
 
-        # 학과 간 API 호출 간격
-        time.sleep(1)
+    def submit_batch(batch: list):
+        try:
+            future = gemini_pool.submit(
+                _detect_cad_departments_batch,
+                [(scan.entry['school_name'], content) for scan, content in batch],
+            )
+        except Exception as e:    # 묶음에 모인 학교가 결과 없이 남지 않게 모두 오류로 종료
+            for scan, _ in batch:
+                finish(scan, e)
+            return
+        future.add_done_callback(lambda f: on_batch_classified(f, batch))
+
+    # 교육과정 판별 대기 학교 수 (검색 전·검색 완료 단계) → 묶음이 다 차지 않아도 마지막에 넘기기 위함
+    to_classify = sum(1 for s in schools if (s.get('stage') or STAGE_PENDING) in (STAGE_PENDING, STAGE_SEARCHED))
+    batcher = _ClassifyBatcher(to_classify, submit_batch, max_size=classify_batch_size) \
+        if classify_batch_size > 1 else None
+
+    def release(scan: _SchoolScan):
+        """묶음에 들어가지 않고 끝나는 학교를 대기 수에서 뺍니다 (남은 묶음이 넘겨지지 않고 막히지 않게)."""
+        if batcher is None or scan.batched or scan.stage not in (STAGE_PENDING, STAGE_SEARCHED):
+            return
+        scan.batched = True
+        batcher.skip()
+
+    def classify(scan: _SchoolScan, content: str):
+        if batcher is not None and content:
+            scan.batched = True
+            batcher.add(scan, content)
+            return
+        release(scan)
+        chain(
+            gemini_pool.submit(_detect_cad_departments, scan.entry['school_name'], content),
+            lambda result: on_classified(scan, result), scan,
+        )
+
+    def on_searched(scan: _SchoolScan, content: str):
+        scan.checkpoint(stage=STAGE_SEARCHED, search_content=content)
+        classify(scan, content)
+
+    def start(scan: _SchoolScan):
+        try:
+            if scan.stage == STAGE_PENDING:
+                queries = _build_curriculum_queries(scan.entry['school_name'], scan.school_type)
+                search = tavily_pool.submit(_tavily_search, queries, 'curriculum')
+                chain(search, lambda content: on_searched(scan, content), scan, lambda: release(scan))
+            elif scan.stage == STAGE_SEARCHED:
+                classify(scan, scan.search_content or '')
+            else:
+                on_detected(scan, scan.classification or
+                            {'has_cad_dept': False, 'dept_names': [], 'details': []})
+        except Exception as e:    # 검색 제출 전 실패 — 묶음 대기 수에서도 빼야 다른 학교 결과가 나옴
+            finish(scan, e)
+            release(scan)
+
+    for school in schools:
+        start(_SchoolScan(school))
 
-    return all_professors
+    try:
+        for _ in range(len(schools)):
+            yield finished.get()
+    finally:
+        tavily_pool.shutdown(wait=True)
+        gemini_pool.shutdown(wait=True)
 
 
 # ──────────────────────────────────────────────
-# 배치 실행
+# 재개 가능한 스캔 작업 (scan_jobs / scan_tasks)
 # ──────────────────────────────────────────────
 
-def batch_scan_cad_departments(max_schools: int = 10,
-                                collect_professors: bool = True) -> dict:
+def start_cad_scan_job(max_schools: int = 10, collect_professors: bool = True) -> int | None:
+    """미확인(has_cad_dept=0) 상위 학교로 새 스캔 작업을 만듭니다. 대상이 없으면 None."""
+    pending = get_cad_scan_pending_schools(limit=max_schools)[:max_schools]
+    if not pending:
+        return None
+    return create_scan_job(pending, collect_professors)
+
+
+def run_cad_scan_job(job_id: int, on_result=None, worker_id: str = None,
+                     claim_size: int = None) -> dict:
     """
-    미확인(has_cad_dept=0) 학교를 배치 스캔합니다.
+    스캔 작업의 대기 학교를 배치 단위로 가져와(claim) 동시 스캔합니다.
+    배치 사이에 작업이 취소(cancelled)되었으면 멈추며, 남은 학교는 재개 시 이어서 처리됩니다.
 
     파라미터:
-        max_schools: 한 번에 처리할 최대 학교 수
-        collect_professors: True이면 CAD 학과 발견 시 교수 정보도 수집
-
+        on_result: 학교 1곳 완료 시마다 호출할 함수 (result_entry, 작업 내 완료 수, 작업 전체 수)
+        worker_id: 작업자 이름 (기본: 호스트·프로세스 기반 고유값)
     반환값:
-        {"scanned": int, "cad_found": int, "professors_saved": int, "results": list}
+        {"job_id", "status", "scanned", "cad_found", "professors_saved", "results"}
     """
-    pending = get_cad_scan_pending_schools(limit=max_schools)
-    if not pending:
-        return {"scanned": 0, "cad_found": 0, "professors_saved": 0, "results": []}
+    job = get_scan_job(job_id)
+    if job is None:
+        raise ValueError(f"스캔 작업을 찾을 수 없습니다: {job_id}")
+
+    collect_professors = bool(job['collect_professors'])
+    worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+    statuses = get_scan_job_progress(job_id)['statuses']
+    completed = statuses.get('done', 0) + statuses.get('failed', 0)
 
     scanned = 0
     cad_found = 0
     professors_saved = 0
     results = []
 
-    for school in pending[:max_schools]:
-        school_name = school['school_name']
-        school_type = school.get('school_type', '4년제')
-
-        try:
-            # 1단계: CAD 학과 판별
-            scan_result = scan_cad_department(school_name, school_type)
-            scanned += 1
-
-            result_entry = {
-                'school_name': school_name,
-                'has_cad': scan_result['has_cad_dept'],
-                'dept_names': scan_result['dept_names'],
-                'professors_count': 0,
-            }
-
-            if scan_result['has_cad_dept'] and collect_professors:
-                cad_found += 1
-
-                # 2단계: 교수 정보 수집
-                professors = scan_and_collect_professors(
-                    school_name, scan_result['dept_names']
-                )
-                if professors:
-                    saved = insert_contacts(professors)
-                    professors_saved += saved
-                    result_entry['professors_count'] = saved
-
-            results.append(result_entry)
-
-        except Exception as e:
-            print(f"[CAD 스캔 오류] {school_name}: {e}")
-            results.append({
-                'school_name': school_name,
-                'has_cad': None,
-                'dept_names': [],
-                'professors_count': 0,
-                'error': str(e),
-            })
-
-        # 학교 간 API 호출 간격 (rate limit 방지)
-        time.sleep(2)
+    while True:
+        job = get_scan_job(job_id)
+        if job is None or job['status'] == 'cancelled':
+            break
+        tasks = claim_scan_tasks(job_id, worker_id, limit=claim_size or CLAIM_BATCH_SIZE)
+        if not tasks:
+            break
+
+        for entry in iter_scan_cad_departments(tasks, collect_professors):
+            results.append(entry)
+            completed += 1
+            if 'error' not in entry:
+                scanned += 1
+                if entry['has_cad'] and collect_professors:
+                    cad_found += 1
+                professors_saved += entry['professors_count']
+            if on_result:
+                on_result(entry, completed, job['total'])
 
     return {
+        "job_id": job_id,
+        "status": finalize_scan_job(job_id),
         "scanned": scanned,
         "cad_found": cad_found,
         "professors_saved": professors_saved,
         "results": results,
     }
+
+
+def resume_cad_scan_job(job_id: int = None, on_result=None, release_claims: bool = False) -> dict | None:
+    """
+    중단·취소된 스캔 작업을 저장된 단계부터 이어서 실행합니다 (job_id 없으면 가장 최근 미완료 작업).
+    release_claims=True이면 이전 실행이 잡고 있던 학교를 임대 만료 전이라도 즉시 회수합니다.
+    재개할 작업이 없으면 None.
+    """
+    if job_id is None:
+        job = get_unfinished_scan_job()
+        if job is None:
+            return None
+        job_id = job['id']
+    requeue_scan_tasks(job_id, release_claims=release_claims)
+    return run_cad_scan_job(job_id, on_result=on_result)
+
+
+def cancel_cad_scan_job(job_id: int) -> None:
+    """스캔 작업을 취소합니다. 실행 중인 배치는 끝까지 처리되고 다음 배치부터 멈춥니다."""
+    set_scan_job_status(job_id, 'cancelled')
+
+
+def batch_scan_cad_departments(max_schools: int = 10,
+                                collect_professors: bool = True,
+                                on_result=None,
+                                resume: bool = True) -> dict:
+    """
+    미확인(has_cad_dept=0) 학교를 동시 스캔합니다 (scan_jobs 작업으로 기록 → 중단 시 재개 가능).
+
+    파라미터:
+        max_schools: 한 번에 처리할 최대 학교 수 (새 작업을 만들 때만 적용)
+        collect_professors: True이면 CAD 학과 발견 시 교수 정보도 수집 (새 작업을 만들 때만 적용)
+        on_result: 학교 1곳 완료 시마다 호출할 함수 (result_entry, 완료 수, 전체 수)
+        resume: True이면 취소되지 않은 미완료 작업이 있을 때 새 작업 대신 그 작업을 이어서 실행
+
+    반환값:
+        {"scanned": int, "cad_found": int, "professors_saved": int, "results": list,
+         "job_id": int | None, "status": str, "resumed": bool}
+    """
+    job = get_unfinished_scan_job() if resume else None
+    if job is not None and job['status'] != 'cancelled':
+        result = resume_cad_scan_job(job['id'], on_result=on_result)
+        result['resumed'] = True
+        return result
+
+    job_id = start_cad_scan_job(max_schools, collect_professors)
+    if job_id is None:
+        return {"scanned": 0, "cad_found": 0, "professors_saved": 0, "results": [],
+                "job_id": None, "status": None, "resumed": False}
+
+    result = run_cad_scan_job(job_id, on_result=on_result)
+    result['resumed'] = False
+    return result
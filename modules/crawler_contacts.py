@@ -14,18 +14,33 @@
     - 교육청 담당 장학사 (예산 흐름 파악용)
 
 ■ Tavily → Gemini 파이프라인
-  Tavily로 웹 검색 → Gemini가 구조화된 JSON으로 파싱
+  Tavily로 웹 검색 → 규칙 기반 연락처 사전 추출(utils/contact_extractor, 충분하면 Gemini 생략)
+  → 검색 근거 압축(utils/evidence_condenser, 연락처 문장 우선) → Gemini가 구조화된 JSON으로 파싱
 """
 import json
+import os
 import re
-import requests
-from tavily import TavilyClient
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from utils.contact_extractor import extract_with_fallback
+from utils.evidence_condenser import CONTACT_KEYWORDS, CONTACT_PATTERNS, DEPARTMENT_KEYWORDS, condense_evidence
+from utils.tavily_cache import tavily_search, is_replay_mode
+from utils.gemini_cache import generate_text, GeminiError
+from utils.db_manager import insert_contacts
 from config import GEMINI_API_KEY, TAVILY_API_KEY
 
 # ──────────────────────────────────────────────
 # 학교 유형 판별
 # ──────────────────────────────────────────────
 
+# 일괄 발굴: 동시에 처리할 학교 수 / 검색 동시 실행 수 / 몇 교마다 DB에 저장할지
+BULK_SCHOOL_WORKERS = int(os.getenv('CONTACT_BULK_WORKERS', '4'))
+BULK_SEARCH_WORKERS = int(os.getenv('CONTACT_BULK_SEARCH_WORKERS', '6'))
+BULK_FLUSH_SIZE = int(os.getenv('CONTACT_BULK_FLUSH_SIZE', '5'))
+
+# 담당자 추출 프롬프트의 검색 근거 토큰 예산 (utils/evidence_condenser 참조)
+CONTACT_EVIDENCE_TOKENS = int(os.getenv('CONTACT_EVIDENCE_TOKENS', '2500'))
+
 _VOCATIONAL_KEYWORDS = ['고등학교', '마이스터고', '특성화고', '공업고', '기술고', '공고']
 _COLLEGE_KEYWORDS    = ['전문대', '폴리텍', '직업전문학교']
 
@@ -133,79 +148,85 @@ def _build_prompt(school_name: str, content: str) -> str:
 # 메인 함수
 # ──────────────────────────────────────────────
 
-def search_and_extract_professors(school_name: str) -> list:
+def _search_all(queries: list, pool: ThreadPoolExecutor) -> list:
+    """쿼리들을 pool에서 동시에 검색하고 쿼리 순서대로 응답을 반환합니다 (실패한 쿼리는 빈 결과)."""
+    futures = [pool.submit(tavily_search, q, 'contacts', TAVILY_API_KEY, max_results=3) for q in queries]
+    responses = []
+    for query, future in zip(queries, futures):
+        try:
+            responses.append(future.result())
+        except Exception as e:
+            print(f"[Tavily 오류] {query}: {e}")
+            responses.append({})
+    return responses
+
+
+def search_and_extract_professors(school_name: str, search_pool: ThreadPoolExecutor = None) -> list:
     """
     Tavily 검색 + Gemini 파싱으로 학교 유형에 맞는 담당자 정보를 수집합니다.
+    search_pool: 검색 쿼리를 실행할 스레드 풀 (일괄 발굴 시 학교 간 공유, 없으면 학교마다 생성)
     반환값: [{"school_name", "name", "department", "email", ...}, ...]
     """
-    if not TAVILY_API_KEY:
+    if not TAVILY_API_KEY and not is_replay_mode():
         raise Exception("TAVILY_API_KEY가 누락되었습니다.")
     if not GEMINI_API_KEY or len(GEMINI_API_KEY) < 20:
         raise Exception("GEMINI_API_KEY가 누락되었거나 유효하지 않습니다.")
 
     queries = _build_queries(school_name)
 
-    # ── Tavily 검색 ──
-    client = TavilyClient(api_key=TAVILY_API_KEY)
-    all_content_parts = []
+    # ── Tavily 검색 (캐시 경유, 쿼리 동시 실행 — 호출 속도는 토큰 버킷이 제한) ──
+    if search_pool is None:
+        with ThreadPoolExecutor(max_workers=len(queries), thread_name_prefix="contacts-search") as pool:
+            responses = _search_all(queries, pool)
+    else:
+        responses = _search_all(queries, search_pool)
 
-    for query in queries:
-        try:
-            res = client.search(
-                query=query,
-                search_depth="advanced",
-                include_raw_content=False,
-                max_results=3,
-            )
-            for r in res.get("results", []):
-                text = r.get("content", "").strip()
-                if text:
-                    all_content_parts.append(f"[출처: {r.get('url','')}]\n{text}")
-        except Exception as e:
-            print(f"[Tavily 오류] {query}: {e}")
-            continue
+    all_content_parts = []
+    for res in responses:     # 쿼리 순서 유지 (앞쪽 쿼리가 우선순위 높음)
+        for r in res.get("results", []):
+            text = r.get("content", "").strip()
+            if text:
+                all_content_parts.append(f"[출처: {r.get('url','')}]\n{text}")
 
     if not all_content_parts:
         return []
 
-    # 중복 제거 후 합치기 (Gemini 토큰 절약)
-    combined = "\n\n".join(all_content_parts[:6])   # 최대 6개 결과 사용
+    # 규칙 추출(이메일·전화·이름)로 충분하면 Gemini 생략, 아니면 애매한 줄만 Gemini로
+    contacts = extract_with_fallback(
+        "\n\n".join(all_content_parts[:6]),   # 최대 6개 결과 사용
+        lambda text: _extract_with_gemini(school_name, text),
+    )
+    for contact in contacts:
+        contact.setdefault('school_name', school_name)
+    return contacts
+
+
+def _extract_with_gemini(school_name: str, content: str) -> list:
+    """검색 결과(또는 규칙 추출로 정하지 못한 줄)를 Gemini로 파싱합니다."""
+    # 중복·저신호 문장 제거 후 합치기 (Gemini 토큰 절약, 연락처 문장은 항상 보존)
+    combined = condense_evidence(
+        content,
+        CONTACT_KEYWORDS + DEPARTMENT_KEYWORDS + ['CAD'],
+        CONTACT_EVIDENCE_TOKENS, keep_patterns=CONTACT_PATTERNS,
+    )
 
     # ── Gemini 파싱 ──
-    prompt  = _build_prompt(school_name, combined)
-    api_url = (
-        f"https://generativelanguage.googleapis.com/v1beta"
-        f"/models/gemini-2.5-flash:generateContent?key={GEMINI_API_KEY}"
-    )
-    payload = {
-        "contents":       [{"parts": [{"text": prompt}]}],
-        "generationConfig": {"temperature": 0.1, "maxOutputTokens": 4096},
-    }
+    prompt = _build_prompt(school_name, combined)
 
     try:
-        res = requests.post(
-            api_url,
-            headers={"Content-Type": "application/json"},
-            json=payload,
-            timeout=60,
+        raw_text = generate_text(
+            prompt, GEMINI_API_KEY,
+            {"temperature": 0.1, "maxOutputTokens": 4096},
+            timeout=60, source='contacts',
         )
+    except GeminiError:
+        raise
     except Exception as e:
         raise Exception(f"Gemini API 호출 오류: {e}")
 
-    if res.status_code != 200:
-        raise Exception(f"Gemini API 에러 [{res.status_code}]: {res.text[:200]}")
-
-    parts = (
-        res.json()
-        .get("candidates", [{}])[0]
-        .get("content", {})
-        .get("parts", [])
-    )
-    if not parts:
+    if not raw_text:
         return []
 
-    raw_text = parts[0].get("text", "")
-
     # 마크다운 코드블록 제거
     cleaned = re.sub(r'```(?:json)?\s*', '', raw_text).replace('```', '').strip()
 
@@ -227,3 +248,85 @@ def search_and_extract_professors(school_name: str) -> list:
             return json.loads(json_str[:last + 1] + ']')
         except json.JSONDecodeError as e:
             raise Exception(f"AI 응답 JSON 파싱 실패: {e}")
+
+
+# ──────────────────────────────────────────────
+# 일괄 발굴 (여러 학교 동시 실행)
+# ──────────────────────────────────────────────
+
+def iter_search_professors_bulk(school_names: list, workers: int = None):
+    """
+    여러 학교의 담당자를 동시에 수집하고, 학교 1곳이 끝날 때마다 결과를 반환합니다 (완료 순서).
+    검색 쿼리는 학교 간 공유 풀에서 실행되고 Tavily·Gemini 호출 속도는 제공자별 토큰 버킷이 제한합니다.
+    반환값(yield): {"school_name", "contacts", "error", "elapsed_sec"}
+    """
+    workers = workers or BULK_SCHOOL_WORKERS
+    search_pool = ThreadPoolExecutor(max_workers=BULK_SEARCH_WORKERS, thread_name_prefix="contacts-search")
+    school_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="contacts-school")
+
+    def run(school_name: str) -> dict:
+        started = time.perf_counter()
+        entry = {'school_name': school_name, 'contacts': [], 'error': None}
+        try:
+            entry['contacts'] = search_and_extract_professors(school_name, search_pool=search_pool)
+        except Exception as e:
+            entry['error'] = str(e)
+        entry['elapsed_sec'] = round(time.perf_counter() - started, 1)
+        return entry
+
+    try:
+        futures = [school_pool.submit(run, name) for name in school_names]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        # 소비자가 중단하면 아직 시작하지 않은 학교는 취소
+        school_pool.shutdown(wait=False, cancel_futures=True)
+        search_pool.shutdown(wait=False, cancel_futures=True)
+
+
+def bulk_discover_professors(school_names: list, on_result=None, workers: int = None,
+                             flush_size: int = None) -> dict:
+    """
+    여러 학교의 담당자를 동시에 발굴해 contacts 테이블에 저장합니다.
+    결과는 flush_size교(기본 BULK_FLUSH_SIZE)마다 insert_contacts로 한 번에 저장합니다.
+
+    on_result(entry, done, total, inserted): 학교 1곳 완료 시 호출 (UI 진행 표시용, inserted는 누적 저장 건수)
+    반환값: {"schools", "found", "inserted", "failed", "elapsed_sec", "results"}
+    """
+    flush_size = flush_size or BULK_FLUSH_SIZE
+    started = time.perf_counter()
+    results = []
+    pending = []
+    pending_schools = 0
+    inserted = 0
+    total = len(school_names)
+
+    try:
+        for done, entry in enumerate(iter_search_professors_bulk(school_names, workers), 1):
+            pending.extend(entry['contacts'])
+            pending_schools += 1
+            if pending_schools >= flush_size or done == total:
+                if pending:
+                    inserted += insert_contacts(pending)
+                pending, pending_schools = [], 0
+            results.append({
+                'school_name': entry['school_name'],
+                'found': len(entry['contacts']),
+                'error': entry['error'],
+                'elapsed_sec': entry['elapsed_sec'],
+            })
+            if on_result:
+                on_result(entry, done, total, inserted)
+    finally:
+        # 중간에 중단(on_result 예외·Streamlit 중지 등)돼도 이미 발굴한 담당자는 저장
+        if pending:
+            inserted += insert_contacts(pending)
+
+    return {
+        'schools': len(results),
+        'found': sum(r['found'] for r in results),
+        'inserted': inserted,
+        'failed': sum(1 for r in results if r['error']),
+        'elapsed_sec': round(time.perf_counter() - started, 1),
+        'results': results,
+    }
@@ -13,9 +13,9 @@
   - 설계 용역·공사·인테리어 등 → 제외
 """
 import os
-import requests
 import datetime
 from utils.db_manager import insert_bids
+from utils.http_cache import cached_get, is_data_go_kr_success
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -182,7 +182,7 @@ def fetch_edu_office_bids(days: int = 28) -> int:
             f"&inqryDiv=1&type=json"
         )
         try:
-            r = requests.get(url, timeout=20)
+            r = cached_get(url, source='koneps', timeout=20, cacheable=is_data_go_kr_success)
             if r.status_code != 200:
                 break
             data   = r.json()
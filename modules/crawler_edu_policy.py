@@ -16,24 +16,22 @@
 ■ DB 저장
   - edu_policy_news 테이블에 뉴스 기사 저장
   - 선정교 자동 추출 → target_schools 추가 후보로 표시
+  - 타겟 학교인 선정교는 같은 트랜잭션에서 구매 신호로 생성 (utils.signal_rules 'edu_policy_selection')
 """
 import os
-import re
-import requests
 import urllib.parse
 from datetime import datetime
-from bs4 import BeautifulSoup
-from utils.db_manager import DB_PATH
+from utils.text_normalizer import clean_snippet
+from utils.http_cache import cached_get
+from utils.relevance_scorer import RelevanceScorer, KeywordGroup
+from utils.db_manager import DB_PATH, derive_signals_in_transaction
+from utils.signal_rules import get_signal_deriver
+from modules.school_resolver import get_resolver, extract_school_candidates
 from dotenv import load_dotenv
 import sqlite3
 
 load_dotenv()
 
-# 학교명 추출 정규식
-_SCHOOL_PATTERN = re.compile(
-    r'([가-힣A-Za-z0-9]+(?:대학교|대학|폴리텍|전문대학))'
-)
-
 # ──────────────────────────────────────────────
 # 감시 키워드 (선정교 발표 전용)
 # ──────────────────────────────────────────────
@@ -62,22 +60,25 @@ MUST_EXCLUDE = [
     '부동산', '아파트', '주식',
 ]
 
-
-def _clean_html(raw: str) -> str:
-    """HTML 태그 제거."""
-    return BeautifulSoup(raw, "html.parser").get_text()
+_FILTER = RelevanceScorer([
+    KeywordGroup('include', MUST_INCLUDE),
+    KeywordGroup('exclude', MUST_EXCLUDE),
+])
 
 
-def _extract_schools(text: str) -> list:
-    """텍스트에서 학교명 목록 추출."""
-    matches = _SCHOOL_PATTERN.findall(text)
-    # 중복 제거, 순서 유지
-    seen = set()
+def _extract_schools(text: str, resolver=None) -> list:
+    """
+    텍스트에서 학교명 목록 추출.
+    타겟 DB 학교는 정규 학교명으로, DB에 없는 신규 선정교는 정규식 후보(일반명사 제외)로 추가합니다.
+    """
+    resolver = resolver or get_resolver()
     result = []
-    for m in matches:
-        if m not in seen and len(m) >= 4:  # 최소 4글자 이상
-            seen.add(m)
-            result.append(m)
+    for m in resolver.scan(text):
+        if m['school_name'] not in result:
+            result.append(m['school_name'])
+    for candidate in extract_school_candidates(text):
+        if resolver.resolve_name(candidate) is None and candidate not in result:
+            result.append(candidate)
     return result
 
 
@@ -123,7 +124,10 @@ def fetch_edu_policy_news() -> int:
     }
 
     new_count = 0
+    collected = []  # 구매 신호 규칙 평가 대상 (선정교 → '정책사업 선정' 신호, 이미 저장된 기사 포함)
     seen_links = set()
+    resolver = get_resolver()
+    derive = get_signal_deriver('edu_policy_news')
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -136,7 +140,7 @@ def fetch_edu_policy_news() -> int:
                 f"?query={enc_query}&display=20&sort={sort}"
             )
             try:
-                res = requests.get(url, headers=headers, timeout=10)
+                res = cached_get(url, headers=headers, source='naver', timeout=10)
                 res.raise_for_status()
                 items = res.json().get('items', [])
             except Exception as e:
@@ -149,17 +153,17 @@ def fetch_edu_policy_news() -> int:
                     continue
                 seen_links.add(link)
 
-                title = _clean_html(item.get('title', ''))
-                description = _clean_html(item.get('description', ''))
+                title = clean_snippet(item.get('title', ''))
+                description = clean_snippet(item.get('description', ''))
                 full_text = title + ' ' + description
-                full_lower = full_text.lower()
+                included, excluded = _FILTER.match(full_text)
 
                 # 1차 필터: 선정/발표 맥락 확인
-                if not any(k in full_lower for k in MUST_INCLUDE):
+                if not included:
                     continue
 
                 # 2차 필터: 무관 기사 제외
-                if any(k in full_lower for k in MUST_EXCLUDE):
+                if excluded:
                     continue
 
                 # 사업 유형 판별
@@ -168,7 +172,7 @@ def fetch_edu_policy_news() -> int:
                     continue
 
                 # 학교명 추출
-                schools = _extract_schools(full_text)
+                schools = _extract_schools(full_text, resolver)
                 schools_str = ', '.join(schools) if schools else ''
 
                 pub_date = item.get('pubDate', '')
@@ -185,9 +189,15 @@ def fetch_edu_policy_news() -> int:
                     )
                     if cursor.rowcount > 0:
                         new_count += 1
+                    # 이미 저장된 기사도 평가 → 기존 신호 last_seen 갱신
+                    collected.append({
+                        'title': title, 'description': description, 'source_url': link,
+                        'detected_schools': schools_str, 'policy_type': policy_type,
+                    })
                 except Exception:
                     continue
 
+    derive_signals_in_transaction(cursor, 'edu_policy_news', collected, derive)
     conn.commit()
     conn.close()
     return new_count
@@ -14,21 +14,17 @@
   - 필터: CAD·3D·실습·설계 관련 콘텐츠만 통과
 """
 import os
-import re
-import requests
 import urllib.parse
 from datetime import datetime
-from bs4 import BeautifulSoup
+from utils.text_normalizer import clean_snippet
+from utils.http_cache import cached_get
+from utils.relevance_scorer import RelevanceScorer, KeywordGroup
 from utils.db_manager import insert_grants
+from modules.school_resolver import get_resolver, extract_school_candidates
 from dotenv import load_dotenv
 
 load_dotenv()
 
-# 학교명 추출 정규식
-_SCHOOL_PATTERN = re.compile(
-    r'([가-힣A-Za-z0-9]+(?:대학교|대학|고등학교|마이스터고|폴리텍|전문대학|직업전문학교))'
-)
-
 # ──────────────────────────────────────────────
 # 쿼리 정의 (하나티에스 타겟 사업 특화)
 # ──────────────────────────────────────────────
@@ -93,22 +89,26 @@ RELEVANCE_KEYWORDS = [
     '산학협력', 'PLM', 'PDM', '시뮬레이션',
 ]
 
-
-def clean_html(raw: str) -> str:
-    return BeautifulSoup(raw, "html.parser").get_text()
+# 1~3차 필터를 1회 스캔으로 판정 (대소문자 무시)
+_FILTER = RelevanceScorer([
+    KeywordGroup('include', MUST_INCLUDE),
+    KeywordGroup('exclude', MUST_EXCLUDE),
+    KeywordGroup('relevant', RELEVANCE_KEYWORDS),
+])
 
 
-def extract_school_name(text: str) -> str:
-    matches = _SCHOOL_PATTERN.findall(text)
-    if not matches:
+def extract_school_name(text: str, resolver=None) -> str:
+    """
+    기사에서 선정 학교명을 추출합니다.
+    타겟 학교 DB 해석 결과(정규 학교명)를 우선하고, 없으면 정규식 후보 중 가장 긴 이름을 사용합니다.
+    """
+    match = (resolver or get_resolver()).primary_match(text)
+    if match:
+        return match['school_name']
+    candidates = extract_school_candidates(text)
+    if not candidates:
         return "확인 필요(기사 원문 참조)"
-    return max(matches, key=len)
-
-
-def _is_relevant(title: str, description: str) -> bool:
-    """하나티에스 제품군·타겟 시장과 관련 있는 기사인지 확인."""
-    full = (title + ' ' + description).upper()
-    return any(kw.upper() in full for kw in RELEVANCE_KEYWORDS)
+    return max(candidates, key=len)
 
 
 def fetch_grant_news() -> int:
@@ -130,6 +130,7 @@ def fetch_grant_news() -> int:
 
     grants_data = []
     seen_links  = set()
+    resolver    = get_resolver()
 
     for query in ALL_QUERIES:
         enc_query = urllib.parse.quote(query)
@@ -140,7 +141,7 @@ def fetch_grant_news() -> int:
                 f"?query={enc_query}&display=10&sort={sort}"
             )
             try:
-                res = requests.get(url, headers=headers, timeout=10)
+                res = cached_get(url, headers=headers, source='naver', timeout=10)
                 res.raise_for_status()
                 items = res.json().get('items', [])
             except Exception as e:
@@ -153,23 +154,23 @@ def fetch_grant_news() -> int:
                     continue
                 seen_links.add(link)
 
-                title       = clean_html(item.get('title', ''))
-                description = clean_html(item.get('description', ''))
-                full_lower  = (title + ' ' + description).lower()
+                title       = clean_snippet(item.get('title', ''))
+                description = clean_snippet(item.get('description', ''))
+                included, excluded, relevant = _FILTER.match(title + ' ' + description)
 
                 # 1차 필터: 선정·확정·도입 맥락
-                if not any(k in full_lower for k in MUST_INCLUDE):
+                if not included:
                     continue
 
                 # 2차 필터: 광고·모집·무관 기사 제외
-                if any(k in full_lower for k in MUST_EXCLUDE):
+                if excluded:
                     continue
 
                 # 3차 필터: 하나티에스 제품군·타겟 시장 관련 여부
-                if not _is_relevant(title, description):
+                if not relevant:
                     continue
 
-                school = extract_school_name(title + ' ' + description)
+                school = extract_school_name(title + ' ' + description, resolver)
 
                 grants_data.append({
                     'project_name':   title,
@@ -15,11 +15,13 @@ NTIS (국가과학기술정보서비스) 연구과제 모니터링 모듈
 """
 import os
 import re
-import requests
 import urllib.parse
 from datetime import datetime
-from bs4 import BeautifulSoup
-from utils.db_manager import insert_ntis_projects, insert_purchase_signal
+from utils.text_normalizer import clean_snippet
+from utils.http_cache import cached_get
+from utils.relevance_scorer import RelevanceScorer, KeywordGroup
+from utils.db_manager import insert_ntis_projects
+from modules.school_resolver import get_resolver, extract_school_candidates
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -66,14 +68,25 @@ BUDGET_KW = [
     '장비비', '연구비', '사업비', '예산', '억원', '천만원', '구매', '도입', '구축',
 ]
 
+# 관련성 점수 그룹 (대학/교수 언급 +15는 _calc_relevance에서 정규식으로 가산)
+_SCORER = RelevanceScorer([
+    KeywordGroup('product', ['CATIA', '카티아', 'SOLIDWORKS', '솔리드웍스', '3DEXPERIENCE', 'SIMULIA'], 30),
+    KeywordGroup('cad', ['CAD', 'CAM', 'CAE', 'PLM', '3D설계', '3D 설계', '3D 모델링'], 20),
+    KeywordGroup('research', ['장비비', '연구장비', '연구과제'], 20),
+    KeywordGroup('simulation', ['시뮬레이션', '디지털트윈', '유한요소', '기계설계', '스마트제조'], 15),
+])
 
-def _clean_html(raw: str) -> str:
-    return BeautifulSoup(raw, "html.parser").get_text()
 
-
-def _extract_school(text: str) -> str:
-    matches = _SCHOOL_PATTERN.findall(text)
-    return max(matches, key=len) if matches else ''
+def _extract_school(text: str, resolver=None) -> tuple:
+    """
+    기사에서 주관 대학을 추출합니다.
+    반환값: (학교명, 타겟 DB 해석 여부) — 해석 실패 시 정규식 후보(일반명사 제외)로 대체
+    """
+    match = (resolver or get_resolver()).primary_match(text)
+    if match:
+        return match['school_name'], True
+    candidates = [c for c in extract_school_candidates(text) if _SCHOOL_PATTERN.fullmatch(c)]
+    return (max(candidates, key=len) if candidates else ''), False
 
 
 def _extract_researcher(text: str) -> str:
@@ -83,30 +96,11 @@ def _extract_researcher(text: str) -> str:
 
 def _calc_relevance(title: str, desc: str) -> int:
     """관련성 점수 산정 (0~100)."""
-    text = (title + ' ' + desc).upper()
-    score = 0
-
-    # 제품명 직접 언급 (+30)
-    product_kw = ['CATIA', '카티아', 'SOLIDWORKS', '솔리드웍스', '3DEXPERIENCE', 'SIMULIA']
-    if any(k.upper() in text for k in product_kw):
-        score += 30
-
-    # CAD/CAM 관련 (+20)
-    cad_kw = ['CAD', 'CAM', 'CAE', 'PLM', '3D설계', '3D 설계', '3D 모델링']
-    if any(k.upper() in text for k in cad_kw):
-        score += 20
-
-    # 연구과제/장비비 관련 (+20)
-    if any(k in text for k in ['장비비', '연구장비', '연구과제']):
-        score += 20
+    text = title + ' ' + desc
+    score = _SCORER.score(text)
 
     # 대학/교수 언급 (+15)
-    if _SCHOOL_PATTERN.search(title + ' ' + desc):
-        score += 15
-
-    # 설계/시뮬레이션 관련 (+15)
-    sim_kw = ['시뮬레이션', '디지털트윈', '유한요소', '기계설계', '스마트제조']
-    if any(k in text for k in sim_kw):
+    if _SCHOOL_PATTERN.search(text):
         score += 15
 
     return min(score, 100)
@@ -131,6 +125,7 @@ def fetch_ntis_research_news() -> int:
 
     projects = []
     seen_links = set()
+    resolver = get_resolver()
 
     for query in NTIS_QUERIES:
         enc_query = urllib.parse.quote(query)
@@ -140,7 +135,7 @@ def fetch_ntis_research_news() -> int:
                 f"?query={enc_query}&display=15&sort={sort}"
             )
             try:
-                res = requests.get(url, headers=headers, timeout=10)
+                res = cached_get(url, headers=headers, source='naver', timeout=10)
                 res.raise_for_status()
                 items = res.json().get('items', [])
             except Exception as e:
@@ -153,8 +148,8 @@ def fetch_ntis_research_news() -> int:
                     continue
                 seen_links.add(link)
 
-                title = _clean_html(item.get('title', ''))
-                description = _clean_html(item.get('description', ''))
+                title = clean_snippet(item.get('title', ''))
+                description = clean_snippet(item.get('description', ''))
                 full_text = title + ' ' + description
 
                 # 관련성 점수 산정
@@ -162,7 +157,7 @@ def fetch_ntis_research_news() -> int:
                 if rel_score < 20:
                     continue
 
-                school = _extract_school(full_text)
+                school, _ = _extract_school(full_text, resolver)
                 researcher = _extract_researcher(full_text)
 
                 projects.append({
@@ -176,20 +171,10 @@ def fetch_ntis_research_news() -> int:
                     'keywords': query.replace('"', ''),
                     'relevance_score': rel_score,
                     'source_url': link,
+                    'description': description,    # 저장하지 않음 — 구매 신호 상세용
                 })
 
-                # 점수 50 이상이고 학교명이 감지되면 구매 신호 생성
-                if rel_score >= 50 and school:
-                    insert_purchase_signal(
-                        school_name=school,
-                        signal_type='R&D 과제',
-                        signal_title=title,
-                        signal_detail=f"연구자: {researcher}" if researcher else description[:100],
-                        signal_score=rel_score,
-                        source='NTIS 뉴스',
-                        source_url=link,
-                    )
-
+    # 새 과제 중 관련도 50 이상·타겟 학교로 해석되는 과제는 저장 시 신호 규칙(ntis_research)이 구매 신호로 생성
     if not projects:
         return 0
 
@@ -10,28 +10,47 @@
   2. 타겟 학교 DB에 등록된 학교만 대상으로 검색 (효율성)
   3. CAD/실습실/장비 관련 키워드 필터링
 
+■ 스윕 모드 (sweep_univ_bid_news)
+  - 학교 여러 곳을 OR 연산자(|)로 묶어 1개 쿼리로 검색 → 요청 수 1/배치크기
+  - 검색 결과는 학교명 해석기(school_resolver)로 해당 학교에 귀속
+  - 요청은 스레드 풀로 동시 실행
+  - 마지막 검색 시각이 오래된 학교 → 우선순위 점수 높은 학교 순으로 처리
+    → 매주 타겟 학교 전체를 커버
+
 ■ 확장 계획
   - 주요 대학 산학협력단 홈페이지 직접 크롤링 (구조가 학교마다 다름)
   - RSS 피드 제공 대학은 RSS로 수집
 """
 import os
-import re
-import requests
 import urllib.parse
-from datetime import datetime
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from utils.text_normalizer import clean_snippet
+from utils.http_cache import cached_get
+from utils.relevance_scorer import RelevanceScorer, KeywordGroup
 from utils.db_manager import (
-    insert_univ_bids, insert_purchase_signal,
+    insert_univ_bids,
     get_all_target_schools,
+    get_univ_bid_sweep_state, update_univ_bid_sweep_state,
 )
+from modules.school_resolver import get_resolver
 from dotenv import load_dotenv
 
 load_dotenv()
 
-# 학교명 추출
-_SCHOOL_PATTERN = re.compile(
-    r'([가-힣A-Za-z0-9]+(?:대학교|대학|폴리텍|전문대학))'
-)
+# 학교명 + 입찰/구매 키워드 조합 ({schools} 자리에 학교명 또는 OR 묶음)
+BID_QUERY_TEMPLATES = [
+    '{schools} 입찰 소프트웨어',
+    '{schools} 구매 CAD',
+    '{schools} 산학협력단 장비',
+]
+
+# 스윕 기본값: 쿼리당 학교 수 / 동시 요청 수
+SWEEP_BATCH_SIZE = 5
+SWEEP_MAX_WORKERS = 4
+
+# 학교당 결과 수 (네이버 API display 최대 100)
+_DISPLAY_PER_SCHOOL = 5
+_NAVER_MAX_DISPLAY = 100
 
 # 입찰/구매 관련 키워드
 BID_KEYWORDS = [
@@ -48,106 +67,192 @@ RELEVANCE_KW = [
 ]
 
 
-def _clean_html(raw: str) -> str:
-    return BeautifulSoup(raw, "html.parser").get_text()
+_FILTER = RelevanceScorer([
+    KeywordGroup('bid', BID_KEYWORDS),
+    KeywordGroup('relevant', RELEVANCE_KW),
+])
 
 
 def _is_bid_relevant(title: str, desc: str) -> bool:
     """입찰 + CAD/실습 관련 여부 확인."""
-    text = (title + ' ' + desc).upper()
-    has_bid = any(k in text for k in BID_KEYWORDS)
-    has_rel = any(k.upper() in text for k in RELEVANCE_KW)
+    has_bid, has_rel = _FILTER.match(title + ' ' + desc)
     return has_bid and has_rel
 
 
-def fetch_univ_bid_news(top_n: int = 30) -> int:
-    """
-    타겟 학교 상위 N교의 자체 입찰/구매 공고를 뉴스에서 수집합니다.
-    반환값: 신규 저장 건수
-    """
+def _naver_headers() -> dict:
     client_id = os.getenv("NAVER_CLIENT_ID")
     client_secret = os.getenv("NAVER_CLIENT_SECRET_KEY")
-
     if not client_id or not client_secret:
-        print("[산학협력단 입찰] 네이버 API 키 없음")
-        return 0
-
-    headers = {
+        return {}
+    return {
         "X-Naver-Client-Id": client_id,
         "X-Naver-Client-Secret": client_secret,
     }
 
-    # 타겟 학교 상위 N교만 검색 (효율성)
-    target_df = get_all_target_schools()
-    if target_df.empty:
-        print("[산학협력단 입찰] 타겟 학교 DB 비어있음")
-        return 0
 
-    # 우선순위 상위 학교 선택 (중복 제거)
-    schools = target_df.sort_values('priority_score', ascending=False)
-    unique_schools = schools['school_name'].drop_duplicates().head(top_n).tolist()
+def _build_query(template: str, schools: list) -> str:
+    """학교 1곳은 기존 형식("학교명"), 여러 곳은 OR 묶음("A" | "B")으로 쿼리를 만듭니다."""
+    names = ' | '.join(f'"{s}"' for s in schools)
+    return template.format(schools=names)
+
+
+def _search_news(query: str, display: int, headers: dict) -> list:
+    enc_query = urllib.parse.quote(query)
+    url = (
+        f"https://openapi.naver.com/v1/search/news.json"
+        f"?query={enc_query}&display={display}&sort=date"
+    )
+    res = cached_get(url, headers=headers, source='naver', timeout=10)
+    res.raise_for_status()
+    return res.json().get('items', [])
+
+
+def _attribute(title: str, desc: str, batch: list, resolver) -> list:
+    """검색 결과를 배치 내 학교에 귀속합니다 (1교 배치는 검색 학교로 바로 귀속)."""
+    if len(batch) == 1:
+        return batch
+    mentioned = {m['school_name'] for m in resolver.scan(title + ' ' + desc)}
+    return [s for s in batch if s in mentioned]
+
+
+def _collect_bids(schools: list, headers: dict, batch_size: int, max_workers: int) -> tuple:
+    """
+    학교 목록을 배치로 묶어 동시 검색하고 입찰 뉴스를 학교별로 귀속합니다.
+    반환값: (bids_data, 학교별 감지 건수, 검색 실패 배치 집합)
+    """
+    resolver = get_resolver()
+    batches = [schools[i:i + batch_size] for i in range(0, len(schools), batch_size)]
+    tasks = [(b_idx, tpl) for b_idx in range(len(batches)) for tpl in BID_QUERY_TEMPLATES]
 
     bids_data = []
-    seen_links = set()
-
-    for school in unique_schools:
-        # 학교명 + 입찰/구매 키워드 조합
-        queries = [
-            f'"{school}" 입찰 소프트웨어',
-            f'"{school}" 구매 CAD',
-            f'"{school}" 산학협력단 장비',
-        ]
-
-        for query in queries:
-            enc_query = urllib.parse.quote(query)
-            url = (
-                f"https://openapi.naver.com/v1/search/news.json"
-                f"?query={enc_query}&display=5&sort=date"
-            )
+    hit_counts = {s: 0 for s in schools}
+    failed_batches = set()
+    seen = set()
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        futures = {}
+        for b_idx, tpl in tasks:
+            batch = batches[b_idx]
+            display = min(_DISPLAY_PER_SCHOOL * len(batch), _NAVER_MAX_DISPLAY)
+            fut = pool.submit(_search_news, _build_query(tpl, batch), display, headers)
+            futures[fut] = b_idx
+
+        for fut in as_completed(futures):
+            batch = batches[futures[fut]]
             try:
-                res = requests.get(url, headers=headers, timeout=10)
-                res.raise_for_status()
-                items = res.json().get('items', [])
-            except Exception:
+                items = fut.result()
+            except Exception as e:
+                print(f"[산학협력단 입찰 오류] {', '.join(batch)}: {e}")
+                failed_batches.add(futures[fut])
                 continue
 
             for item in items:
                 link = item.get('originallink') or item.get('link', '')
-                if link in seen_links or not link:
+                if not link:
                     continue
-                seen_links.add(link)
 
-                title = _clean_html(item.get('title', ''))
-                desc = _clean_html(item.get('description', ''))
+                title = clean_snippet(item.get('title', ''))
+                desc = clean_snippet(item.get('description', ''))
 
                 if not _is_bid_relevant(title, desc):
                     continue
 
-                pub_date = item.get('pubDate', '')
-
-                bids_data.append({
-                    'school_name': school,
-                    'bid_title': title,
-                    'bid_url': link,
-                    'pub_date': pub_date,
-                    'deadline': '',
-                    'budget': '',
-                    'bid_type': '뉴스 감지',
-                    'is_relevant': 1,
-                })
-
-                # 구매 신호 생성
-                insert_purchase_signal(
-                    school_name=school,
-                    signal_type='대학 입찰',
-                    signal_title=title,
-                    signal_detail=desc[:150],
-                    signal_score=70,
-                    source='산학협력단 뉴스',
-                    source_url=link,
-                )
+                for school in _attribute(title, desc, batch, resolver):
+                    if (school, link) in seen:
+                        continue
+                    seen.add((school, link))
+                    hit_counts[school] += 1
+
+                    bids_data.append({
+                        'school_name': school,
+                        'bid_title': title,
+                        'bid_url': link,
+                        'pub_date': item.get('pubDate', ''),
+                        'deadline': '',
+                        'budget': '',
+                        'bid_type': '뉴스 감지',
+                        'is_relevant': 1,
+                        'description': desc,    # 저장하지 않음 — 구매 신호 상세용
+                    })
 
+    # 구매 신호는 _save → insert_univ_bids 저장 시 신호 규칙(univ_bid_news)이 생성
+    failed = {s for idx in failed_batches for s in batches[idx]}
+    return bids_data, hit_counts, failed
+
+
+def _save(bids_data: list) -> int:
     if not bids_data:
         return 0
-
     return insert_univ_bids(bids_data)
+
+
+def fetch_univ_bid_news(top_n: int = 30, max_workers: int = SWEEP_MAX_WORKERS) -> int:
+    """
+    타겟 학교 상위 N교의 자체 입찰/구매 공고를 뉴스에서 수집합니다 (학교별 개별 쿼리).
+    반환값: 신규 저장 건수
+    """
+    headers = _naver_headers()
+    if not headers:
+        print("[산학협력단 입찰] 네이버 API 키 없음")
+        return 0
+
+    # 타겟 학교 상위 N교만 검색 (효율성)
+    target_df = get_all_target_schools()
+    if target_df.empty:
+        print("[산학협력단 입찰] 타겟 학교 DB 비어있음")
+        return 0
+
+    # 우선순위 상위 학교 선택 (중복 제거)
+    schools = target_df.sort_values('priority_score', ascending=False)
+    unique_schools = schools['school_name'].drop_duplicates().head(top_n).tolist()
+
+    bids_data, hit_counts, failed = _collect_bids(unique_schools, headers, 1, max_workers)
+    update_univ_bid_sweep_state({s: c for s, c in hit_counts.items() if s not in failed})
+    return _save(bids_data)
+
+
+def get_sweep_order(max_schools: int = None) -> list:
+    """
+    스윕 대상 학교를 우선순위대로 반환합니다.
+    정렬: 한 번도 검색하지 않은 학교 → 마지막 검색이 오래된 학교, 같으면 우선순위 점수 높은 순
+    """
+    target_df = get_all_target_schools()
+    if target_df.empty:
+        return []
+
+    state = get_univ_bid_sweep_state()
+    schools = (
+        target_df.groupby('school_name', as_index=False)['priority_score'].max()
+    )
+    schools['last_checked_at'] = schools['school_name'].map(state).fillna('')
+    schools = schools.sort_values(
+        ['last_checked_at', 'priority_score'], ascending=[True, False]
+    )
+    ordered = schools['school_name'].tolist()
+    return ordered[:max_schools] if max_schools else ordered
+
+
+def sweep_univ_bid_news(max_schools: int = None,
+                        batch_size: int = SWEEP_BATCH_SIZE,
+                        max_workers: int = SWEEP_MAX_WORKERS) -> int:
+    """
+    타겟 학교 전체(또는 max_schools교)를 OR 묶음 쿼리로 동시 스윕합니다.
+    요청 수: ceil(학교 수 / batch_size) × 3 (기존 학교당 3회 대비 1/batch_size)
+    반환값: 신규 저장 건수
+    """
+    headers = _naver_headers()
+    if not headers:
+        print("[산학협력단 입찰] 네이버 API 키 없음")
+        return 0
+
+    schools = get_sweep_order(max_schools)
+    if not schools:
+        print("[산학협력단 입찰] 타겟 학교 DB 비어있음")
+        return 0
+
+    bids_data, hit_counts, failed = _collect_bids(
+        schools, headers, max(1, batch_size), max_workers
+    )
+    # 검색이 실패한 배치의 학교는 다음 스윕에서 우선 처리되도록 시각을 갱신하지 않음
+    update_univ_bid_sweep_state({s: c for s, c in hit_counts.items() if s not in failed})
+    return _save(bids_data)
@@ -1,46 +1,62 @@
 import requests
 from config import GEMINI_API_KEY
+from utils.gemini_cache import generate_text, stream_text, GeminiError
 from utils.text_processor import build_spec_in_prompt
 
-def generate_spec_in_document(school_name: str, project_name: str, budget: str, solution_name: str, extra_points: str) -> str:
+# Spec-in 문서 생성 설정 (일반/스트리밍 생성이 같은 설정 → 같은 캐시 키 공유)
+SPEC_IN_GENERATION_CONFIG = {
+    "temperature": 0.5,
+    "maxOutputTokens": 2048
+}
+
+def generate_spec_in_document(school_name: str, project_name: str, budget: str, solution_name: str, extra_points: str,
+                              use_cache: bool = False) -> str:
     """
     구성된 프롬프트를 Google Gemini API로 전송하고 결과를 반환합니다.
     (추가 라이브러리 설치 방지용 REST API 직접 호출 통신)
+    use_cache=True이면 입력이 같을 때 이전 생성 결과를 재사용합니다 (기본은 매번 새로 생성).
     """
     if not GEMINI_API_KEY:
         return "⚠️ 오류: GEMINI_API_KEY가 등록되지 않았습니다. .env 파일이나 config 설정을 확인하고 다시 실행해 주세요."
         
-    url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash:generateContent?key={GEMINI_API_KEY}"
-    
-    headers = {
-        "Content-Type": "application/json"
-    }
-    
     prompt_text = build_spec_in_prompt(school_name, project_name, budget, solution_name, extra_points)
     
-    payload = {
-        "contents": [{
-            "parts": [{"text": prompt_text}]
-        }],
-        "generationConfig": {
-            "temperature": 0.5,
-            "maxOutputTokens": 2048
-        }
-    }
-    
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=30)
-        
-        if response.status_code == 200:
-            data = response.json()
-            candidates = data.get("candidates", [])
-            if candidates:
-                content = candidates[0].get("content", {}).get("parts", [])
-                if content:
-                    return content[0].get("text", "텍스트가 생성되지 않았습니다.")
-            return "API 응답에서 텍스트를 찾을 수 없습니다."
-        else:
-            return f"⚠️ API 에러 [{response.status_code}]: {response.text}"
-            
-    except requests.exceptions.RequestException as e:
+        # temperature 0.5는 자동 캐시 대상이 아니므로 use_cache로 명시적으로 선택
+        text = generate_text(prompt_text, GEMINI_API_KEY, SPEC_IN_GENERATION_CONFIG,
+                             timeout=30, source='spec_in', cache=use_cache)
+        return text or "API 응답에서 텍스트를 찾을 수 없습니다."
+    
+    except GeminiError as e:
+        return f"⚠️ API 에러 [{e.status_code}]: {e.body}"
+    except (requests.exceptions.RequestException, TimeoutError) as e:
         return f"⚠️ 네트워크 문제로 문서 생성에 실패했습니다: {str(e)}"
+
+
+def stream_spec_in_document(school_name: str, project_name: str, budget: str, solution_name: str, extra_points: str,
+                            use_cache: bool = False, cancel_event=None):
+    """
+    generate_spec_in_document의 스트리밍 버전: 문서 텍스트를 생성되는 대로 조각 단위로 yield합니다.
+    (st.write_stream에 바로 전달, 끝까지 생성된 문서만 캐시에 저장되어 generate_spec_in_document와 공유)
+    오류는 예외 대신 안내 문구를 yield합니다.
+    """
+    if not GEMINI_API_KEY:
+        yield "⚠️ 오류: GEMINI_API_KEY가 등록되지 않았습니다. .env 파일이나 config 설정을 확인하고 다시 실행해 주세요."
+        return
+
+    prompt_text = build_spec_in_prompt(school_name, project_name, budget, solution_name, extra_points)
+
+    received = False
+    try:
+        for chunk in stream_text(prompt_text, GEMINI_API_KEY, SPEC_IN_GENERATION_CONFIG,
+                                 timeout=30, source='spec_in', cache=use_cache,
+                                 cancel_event=cancel_event):
+            received = True
+            yield chunk
+        if not received:
+            yield "API 응답에서 텍스트를 찾을 수 없습니다."
+
+    except GeminiError as e:
+        yield f"\n\n⚠️ API 에러 [{e.status_code}]: {e.body}"
+    except (requests.exceptions.RequestException, TimeoutError) as e:
+        yield f"\n\n⚠️ 네트워크 문제로 문서 생성에 실패했습니다: {str(e)}"
@@ -14,6 +14,20 @@
   Tier 3 (파이프라인): 20~49점
     - 타겟 학교 DB에 존재하나 구체적 신호 없음
 
+■ 계산 방식
+  - 학교별 최고 신호 점수·NTIS 최고 관련도·건수·입찰 건수를 SQLite GROUP BY로 집계해 타겟 학교와 조인
+    (db_manager.get_school_score_aggregates, 원본 테이블 전체를 읽지 않음)
+  - 구매 신호는 전체 이력을 사용하되 detected_at 기준 지수 감쇠 (신호 유형별 반감기, SIGNAL_HALF_LIFE_DAYS)
+    → 학교별 최고 감쇠 점수가 신호 보너스 기준, 감쇠는 SQL 식(decay_weight)으로 집계 안에서 계산
+  - 약칭·캠퍼스 표기로 저장된 집계만 정규 학교명으로 바꿔 합산 → 열 단위 보너스 합산·등급 판정
+  - 결과는 school_scores 테이블에 저장, 입력(구매 신호·NTIS·입찰·영업 상태)이 바뀐 학교만 재계산
+    (refresh_school_scores), 날짜가 바뀌면 감쇠 반영을 위해 1일 1회 전체 재계산, 달이 바뀌면 예산 시기 보너스만 SQL로 갱신
+  - 이번 주 접근 대상은 school_scores 점수 인덱스 순서 조회 + LIMIT (get_top_schools)
+    → 저장된 합계를 상한으로 삼아 상위 K행 중 오늘 계산되지 않은 행만 다시 계산, 신호 상세는 필요할 때 조회
+  - 매일 갱신 직후 점수 스냅샷 저장 (snapshot_school_scores, 전날과 달라진 학교만 1행)
+    → 최근 N일 점수 급상승·등급 변화 조회 (get_score_movers)
+  - benchmark_school_scoring() → 1만 교 × 신호 10만 건 합성 데이터로 이전 방식(iterrows)과 시간·결과 비교
+
 ■ 예산 시기 (대학교 기준)
   - 1~2월: 예산 편성기 → 스펙인 최적기 (+20점)
   - 3~4월: 전반기 발주 집중 (+25점)
@@ -22,14 +36,30 @@
   - 11~12월: 연말 예산 소진 (+25점)
   - 8월: 방학기 (-5점)
 """
-from datetime import datetime
+from datetime import datetime, timedelta
+import math
+import threading
+import time
+
+import pandas as pd
+
 from utils.db_manager import (
-    get_all_target_schools,
-    get_purchase_signals,
+    get_purchase_signal_summary,
     insert_purchase_signal,
-    get_all_ntis_projects,
-    get_all_univ_bids,
+    get_school_score_aggregates,
+    get_school_score_dirty,
+    clear_school_score_dirty,
+    count_school_scores,
+    get_school_scores_scored_on,
+    save_school_scores,
+    update_school_score_budget,
+    get_school_score_rows,
+    get_school_score_signals,
+    save_school_score_snapshot,
+    get_school_score_snapshot_days,
+    get_score_changes,
 )
+from modules.school_resolver import get_resolver
 
 
 # 월별 예산 시기 가중치
@@ -70,27 +100,299 @@ def get_budget_season_info() -> dict:
     }
 
 
+# 영업 상태 보너스
+STATUS_BONUS = {
+    '접촉완료': 10, '제안서발송': 15, '협의중': 20, '수주': 0, '보류': -10,
+}
+
+# 등급 기준 (하한 점수, 등급, 권장 액션) — 높은 등급부터
+TIERS = [
+    (80, 'Tier 1 (즉시 영업)', '즉시 담당자 연락. 견적/제안서 준비.'),
+    (50, 'Tier 2 (단기 기회)', '이번 달 내 접촉. 교수 연구 분야 파악 후 맞춤 제안.'),
+    (None, 'Tier 3 (파이프라인)', '분기 1회 접촉. 예산 시기에 재평가.'),
+]
+
+SIGNAL_BONUS_CAP = 30
+NTIS_BONUS_CAP = 20
+UNIV_BID_BONUS = 25
+
+
+# 신호 유형별 반감기(일) — 이 기간이 지나면 신호 점수가 절반으로 감쇠
+#   입찰·공고: 공고 후 몇 주 안에 계약이 끝나므로 짧게 / 사전규격: 본 공고까지 1~2개월
+#   R&D 과제·재정지원사업: 사업 기간 내내 장비 수요가 이어지므로 길게 / 정책사업 선정: 다년도 사업
+SIGNAL_HALF_LIFE_DAYS = {
+    '대학 입찰': 30,
+    '나라장터 입찰': 30,
+    '교육청 공고': 30,
+    '사전규격': 45,
+    'R&D 과제': 180,
+    '재정지원사업': 180,
+    '정책사업 선정': 365,
+}
+DEFAULT_HALF_LIFE_DAYS = 90
+
+
+# 학교별로 가져올 신호 상세(제목·유형) 건수 — 화면에는 상위 2건만 표시
+SIGNAL_DETAIL_LIMIT = 5
+
+
+def compute_school_scores(school_names: set = None, as_of: str = None) -> list:
+    """
+    타겟 학교의 구매 가능성 점수를 계산합니다 (저장하지 않음).
+    학교별 최고 신호 점수(감쇠 후)·NTIS 최고 관련도·건수·입찰 건수는 SQLite GROUP BY로 집계해 가져옵니다
+    (메모리 사용량이 수집 이력 행 수가 아닌 학교 수에 비례).
+    school_names: 이 학교들만 계산 (없으면 전체)
+    as_of: 감쇠 기준 날짜 'YYYY-MM-DD' (없으면 오늘)
+    반환값: score_schools() 결과 + 'target_id' (동점 정렬용 타겟 학교 행 id)
+    """
+    aggregates = get_school_score_aggregates(
+        signal_detail_limit=SIGNAL_DETAIL_LIMIT,
+        school_names=sorted(school_names) if school_names is not None else None,
+        half_lives=SIGNAL_HALF_LIFE_DAYS,
+        default_half_life=DEFAULT_HALF_LIFE_DAYS,
+        as_of=as_of or datetime.today().strftime("%Y-%m-%d"),
+    )
+    schools = aggregates['schools']
+    if schools.empty:
+        return []
+
+    # 약칭·캠퍼스 표기로 저장된 과거 데이터도 정규 학교명으로 맞춰 합산
+    resolver = get_resolver()
+    schools = _fold_unmatched(schools, aggregates['unmatched'], resolver.canonical_name)
+
+    signal_lists = {}
+    details = sorted(
+        ({**d, 'school_name': resolver.canonical_name(d['school_name'])} for d in aggregates['signal_details']),
+        key=lambda d: (-d['signal_score'], -d['id']),
+    )
+    for d in details:
+        school_list = signal_lists.setdefault(d['school_name'], [])
+        if len(school_list) < SIGNAL_DETAIL_LIMIT:
+            school_list.append({'type': d['signal_type'], 'title': d['signal_title'], 'score': d['signal_score']})
+
+    target_ids = dict(zip(schools['school_name'], schools['target_id'].astype(int)))
+    results = score_schools(schools, signal_lists, get_budget_season_info()['bonus'])
+    for result in results:
+        result['target_id'] = target_ids[result['school_name']]
+    return results
+
+
+_refresh_lock = threading.Lock()
+
+
+def _recompute_and_save(names: set, as_of: str) -> tuple:
+    """names 학교만(None이면 전체) 다시 계산해 저장합니다. 반환값: (재계산 학교 수, 삭제 학교 수)"""
+    scores = compute_school_scores(names, as_of=as_of)
+    month = get_budget_season_info()['month']
+    for score in scores:
+        score['budget_month'] = month
+    removed = sorted(names - {sc['school_name'] for sc in scores}) if names else []
+    deleted = save_school_scores(scores, removed=removed, replace_all=names is None, scored_on=as_of)
+    return len(scores), deleted
+
+
+def refresh_school_scores(full: bool = False, decay: bool = True) -> dict:
+    """
+    school_scores 테이블을 최신 상태로 맞춥니다.
+      - 테이블이 비었거나 full=True, 또는 오늘 계산하지 않은 행이 있으면 (신호 감쇠, decay=True일 때) : 전체 재계산
+      - 그 외 : 구매 신호·NTIS·입찰·타겟 학교 변경으로 기록된 학교(school_score_dirty)만 재계산
+      - 달이 바뀌었으면 예산 시기 보너스·합계·등급만 SQL UPDATE 1회로 갱신
+    decay=False : 감쇠로 인한 전체 재계산은 건너뜀 (상위 K개만 필요한 get_top_schools가 후보만 다시 계산)
+    반환값: {"recomputed": 재계산 학교 수, "removed": 삭제 학교 수, "budget_updated": 시기 보너스 갱신 행 수}
+    """
+    with _refresh_lock:
+        dirty, up_to_seq = get_school_score_dirty()
+        today = datetime.today().strftime("%Y-%m-%d")
+        full = full or count_school_scores() == 0 or (decay and get_school_scores_scored_on() != today)
+        summary = {'recomputed': 0, 'removed': 0, 'budget_updated': 0}
+
+        if full or dirty:
+            names = None
+            if not full:
+                canonical = get_resolver().canonical_name
+                names = dirty | {canonical(n) for n in dirty}
+            recomputed, deleted = _recompute_and_save(names, today)
+            clear_school_score_dirty(up_to_seq)
+            summary.update(recomputed=recomputed, removed=deleted)
+
+        budget = get_budget_season_info()
+        summary['budget_updated'] = update_school_score_budget(
+            budget['month'], budget['bonus'], [(m, name) for m, name, _ in TIERS],
+        )
+        return summary
+
+
+_TIER_ACTIONS = {name: action for _, name, action in TIERS}
+
+
+def _with_action(rows: list) -> list:
+    for row in rows:
+        row['recommended_action'] = _TIER_ACTIONS.get(row['tier'], '')
+    return rows
+
+
 def calculate_school_scores() -> list:
     """
-    모든 타겟 학교의 구매 가능성 점수를 종합 산정합니다.
+    모든 타겟 학교의 구매 가능성 점수 (school_scores 테이블, 바뀐 학교만 재계산 후 조회).
     반환값: [{'school_name', 'base_score', 'signal_bonus', 'budget_bonus',
               'total_score', 'signals', 'tier', 'recommended_action'}, ...]
     """
-    target_df = get_all_target_schools()
-    if target_df.empty:
-        return []
+    refresh_school_scores()
+    return _with_action(get_school_score_rows())
+
+
+def _fold_unmatched(schools: pd.DataFrame, unmatched: list, canonical_name) -> pd.DataFrame:
+    """target_schools와 이름이 다른 집계(약칭 등)를 정규 학교명으로 바꿔 해당 학교의 최댓값·건수에 합칩니다."""
+    if not unmatched:
+        return schools
+    schools = schools.copy()
+    row_of = {name: i for i, name in enumerate(schools['school_name'])}
+    columns = {'signal': ('signal_max', 'signal_count'), 'ntis': ('ntis_max', 'ntis_count'),
+               'bid': (None, 'bid_count')}
+    for source, name, max_value, count in unmatched:
+        row = row_of.get(canonical_name(name))
+        if row is None:
+            continue    # 타겟 학교가 아닌 기관
+        max_col, count_col = columns[source]
+        idx = schools.index[row]
+        if max_col:
+            current = schools.at[idx, max_col]
+            schools.at[idx, max_col] = max_value if pd.isna(current) else max(current, max_value)
+        current = schools.at[idx, count_col]
+        schools.at[idx, count_col] = count if pd.isna(current) else current + count
+    return schools
+
+
+def aggregate_score_inputs(target_df: pd.DataFrame, signals_df: pd.DataFrame, ntis_df: pd.DataFrame,
+                           univ_bids_df: pd.DataFrame, signal_detail_limit: int = None) -> tuple:
+    """
+    원본 DataFrame(학교명 정규화 완료)으로 get_school_score_aggregates와 같은 형태의 학교별 집계를 만듭니다.
+    (벤치마크·이전 방식과의 비교·백테스트용) 반환값: (학교별 집계 DataFrame, 학교별 신호 목록)
+    signal_detail_limit: 학교별 신호 목록을 signals_df 순서 앞쪽 N건으로 제한 (없으면 전체)
+    """
+    # 같은 학교가 여러 사업으로 등록된 경우 첫 행(우선순위 점수 최고) 기준
+    schools = target_df.drop_duplicates('school_name', keep='first').reset_index(drop=True)
+    names = schools['school_name']
+    if not signals_df.empty:
+        signal_agg = signals_df.groupby('school_name')['signal_score'].agg(['max', 'size'])
+        schools['signal_max'] = names.map(signal_agg['max'])
+        schools['signal_count'] = names.map(signal_agg['size'])
+    if not ntis_df.empty:
+        ntis_agg = ntis_df.groupby('lead_agency')['relevance_score'].agg(['max', 'size'])
+        schools['ntis_max'] = names.map(ntis_agg['max'])
+        schools['ntis_count'] = names.map(ntis_agg['size'])
+    if not univ_bids_df.empty:
+        schools['bid_count'] = names.map(univ_bids_df.groupby('school_name').size())
+    if signal_detail_limit is not None and not signals_df.empty:
+        signals_df = signals_df.groupby('school_name', sort=False).head(signal_detail_limit)
+    return schools, _group_signal_lists(signals_df)
+
+
+def _group_signal_lists(signals_df: pd.DataFrame) -> dict:
+    """학교별 신호 목록 {학교명: [{'type', 'title', 'score'}, ...]} (signals_df 순서 유지, 1회 순회)."""
+    lists = {}
+    if signals_df.empty:
+        return lists
+    columns = [signals_df[c] if c in signals_df.columns else pd.Series('', index=signals_df.index)
+               for c in ('signal_type', 'signal_title', 'signal_score')]
+    for school, sig_type, title, score in zip(signals_df['school_name'], *columns):
+        lists.setdefault(school, []).append({'type': sig_type, 'title': title, 'score': score})
+    return lists
 
-    signals_df = get_purchase_signals(min_score=0, limit=500)
-    ntis_df = get_all_ntis_projects()
-    univ_bids_df = get_all_univ_bids()
 
-    budget_info = get_budget_season_info()
-    budget_bonus = budget_info['bonus']
+def _column(df: pd.DataFrame, name: str, default=0) -> pd.Series:
+    """집계 열 (없거나 NULL이면 default)."""
+    if name not in df.columns:
+        return pd.Series(default, index=df.index)
+    return df[name].fillna(default)
+
+
+def score_schools(schools: pd.DataFrame, signal_lists: dict, budget_bonus: int, params: dict = None) -> list:
+    """
+    학교별 집계(학교당 1행, 타겟 학교 순서)로 점수를 산정합니다 (calculate_school_scores의 계산부).
+    schools 열: school_name, program_name, priority_score, sales_status,
+                signal_max, ntis_max, ntis_count, bid_count (집계 열은 없거나 NULL이면 0)
+    params: 가중치 덮어쓰기 (백테스트용) — 'status_bonus', 'signal_bonus_cap', 'ntis_bonus_cap', 'univ_bid_bonus'
+    보너스 합산·상한·등급 판정은 모두 열 단위 연산.
+    """
+    params = params or {}
+    status_table = params.get('status_bonus', STATUS_BONUS)
+    signal_cap = params.get('signal_bonus_cap', SIGNAL_BONUS_CAP)
+    ntis_cap = params.get('ntis_bonus_cap', NTIS_BONUS_CAP)
+    univ_bid_bonus = params.get('univ_bid_bonus', UNIV_BID_BONUS)
+    schools = schools.reset_index(drop=True)
+    names = schools['school_name']
+    base = _column(schools, 'priority_score').astype(int)
+    status = schools['sales_status'] if 'sales_status' in schools.columns \
+        else pd.Series('미접촉', index=schools.index)
+
+    # 구매 신호 보너스 (학교별 최고 신호 점수, 상한 30)
+    signal_bonus = _column(schools, 'signal_max').astype(int).clip(upper=signal_cap)
+    # NTIS 과제 보너스 (최고 관련도, 상한 20)
+    ntis_bonus = _column(schools, 'ntis_max').astype(int).clip(upper=ntis_cap)
+    ntis_count = _column(schools, 'ntis_count').astype(int)
+    # 대학 자체 입찰 보너스 (1건 이상이면 25)
+    bid_count = _column(schools, 'bid_count').astype(int)
+    bid_bonus = bid_count.gt(0).astype(int) * univ_bid_bonus
+
+    status_bonus = status.map(status_table).fillna(0).astype(int)
+    total = (base + signal_bonus + ntis_bonus + bid_bonus + budget_bonus + status_bonus).clip(upper=100)
+
+    # 등급 판정
+    tier = pd.Series(TIERS[-1][1], index=schools.index)
+    action = pd.Series(TIERS[-1][2], index=schools.index)
+    for min_score, tier_name, tier_action in reversed(TIERS[:-1]):
+        tier = tier.mask(total >= min_score, tier_name)
+        action = action.mask(total >= min_score, tier_action)
+
+    # 점수 내림차순 정렬 (동점은 타겟 학교 순서 유지)
+    order = total.sort_values(ascending=False, kind='stable').index
+    program = schools['program_name'] if 'program_name' in schools.columns else pd.Series('', index=schools.index)
+
+    columns = zip(
+        names[order].tolist(), program[order].tolist(), base[order].tolist(),
+        (signal_bonus + ntis_bonus + bid_bonus)[order].tolist(), status_bonus[order].tolist(),
+        total[order].tolist(), tier[order].tolist(), status[order].tolist(), action[order].tolist(),
+        ntis_count[order].tolist(), ntis_bonus[order].tolist(), bid_count[order].tolist(),
+    )
 
     results = []
-    # 학교별로 집계
-    seen_schools = set()
+    for (school, program_name, base_score, bonus, s_bonus, total_score, tier_name, sales_status,
+         tier_action, n_ntis, n_ntis_bonus, n_bids) in columns:
+        signal_list = list(signal_lists.get(school, []))
+        if n_ntis:
+            signal_list.append({
+                'type': 'R&D 과제',
+                'title': f"NTIS 과제 {n_ntis}건 감지",
+                'score': n_ntis_bonus,
+            })
+        if n_bids:
+            signal_list.append({
+                'type': '대학 입찰',
+                'title': f"산학협력단 입찰 {n_bids}건 감지",
+                'score': univ_bid_bonus,
+            })
+        results.append({
+            'school_name': school,
+            'program_name': program_name,
+            'base_score': base_score,
+            'signal_bonus': bonus,
+            'budget_bonus': budget_bonus,
+            'status_bonus': s_bonus,
+            'total_score': total_score,
+            'signals': signal_list,
+            'tier': tier_name,
+            'sales_status': sales_status,
+            'recommended_action': tier_action,
+        })
+    return results
+
 
+def _score_schools_iterrows(target_df: pd.DataFrame, signals_df: pd.DataFrame, ntis_df: pd.DataFrame,
+                            univ_bids_df: pd.DataFrame, budget_bonus: int) -> list:
+    """이전 방식(학교마다 iterrows + 불리언 필터) — benchmark_school_scoring의 결과 비교·속도 기준용."""
+    results = []
+    seen_schools = set()
     for _, row in target_df.iterrows():
         school = row['school_name']
         if school in seen_schools:
@@ -99,119 +401,193 @@ def calculate_school_scores() -> list:
 
         base_score = int(row.get('priority_score', 0))
         sales_status = row.get('sales_status', '미접촉')
-
-        # 구매 신호 보너스
         signal_bonus = 0
         signal_list = []
-
         if not signals_df.empty:
             school_signals = signals_df[signals_df['school_name'] == school]
             if not school_signals.empty:
-                signal_bonus += min(int(school_signals['signal_score'].max()), 30)
+                signal_bonus += min(int(school_signals['signal_score'].max()), SIGNAL_BONUS_CAP)
                 for _, sig in school_signals.iterrows():
                     signal_list.append({
                         'type': sig.get('signal_type', ''),
                         'title': sig.get('signal_title', ''),
                         'score': sig.get('signal_score', 0),
                     })
-
-        # NTIS 과제 보너스
         ntis_bonus = 0
         if not ntis_df.empty:
             school_ntis = ntis_df[ntis_df['lead_agency'] == school]
             if not school_ntis.empty:
-                ntis_bonus = min(int(school_ntis['relevance_score'].max()), 20)
-                signal_list.append({
-                    'type': 'R&D 과제',
-                    'title': f"NTIS 과제 {len(school_ntis)}건 감지",
-                    'score': ntis_bonus,
-                })
-
-        # 대학 자체 입찰 보너스
+                ntis_bonus = min(int(school_ntis['relevance_score'].max()), NTIS_BONUS_CAP)
+                signal_list.append({'type': 'R&D 과제', 'title': f"NTIS 과제 {len(school_ntis)}건 감지",
+                                    'score': ntis_bonus})
         bid_bonus = 0
         if not univ_bids_df.empty:
             school_bids = univ_bids_df[univ_bids_df['school_name'] == school]
             if not school_bids.empty:
-                bid_bonus = 25
-                signal_list.append({
-                    'type': '대학 입찰',
-                    'title': f"산학협력단 입찰 {len(school_bids)}건 감지",
-                    'score': bid_bonus,
-                })
-
-        # 영업 상태 보너스
-        status_bonus = {
-            '접촉완료': 10, '제안서발송': 15, '협의중': 20, '수주': 0, '보류': -10,
-        }.get(sales_status, 0)
-
+                bid_bonus = UNIV_BID_BONUS
+                signal_list.append({'type': '대학 입찰', 'title': f"산학협력단 입찰 {len(school_bids)}건 감지",
+                                    'score': bid_bonus})
+        status_bonus = STATUS_BONUS.get(sales_status, 0)
         total = min(base_score + signal_bonus + ntis_bonus + bid_bonus + budget_bonus + status_bonus, 100)
-
-        # 등급 판정
-        if total >= 80:
-            tier = 'Tier 1 (즉시 영업)'
-            action = '즉시 담당자 연락. 견적/제안서 준비.'
-        elif total >= 50:
-            tier = 'Tier 2 (단기 기회)'
-            action = '이번 달 내 접촉. 교수 연구 분야 파악 후 맞춤 제안.'
-        else:
-            tier = 'Tier 3 (파이프라인)'
-            action = '분기 1회 접촉. 예산 시기에 재평가.'
-
+        tier, action = next((t, a) for m, t, a in TIERS if m is None or total >= m)
         results.append({
-            'school_name': school,
-            'program_name': row.get('program_name', ''),
-            'base_score': base_score,
-            'signal_bonus': signal_bonus + ntis_bonus + bid_bonus,
-            'budget_bonus': budget_bonus,
-            'status_bonus': status_bonus,
-            'total_score': total,
-            'signals': signal_list,
-            'tier': tier,
-            'sales_status': sales_status,
-            'recommended_action': action,
+            'school_name': school, 'program_name': row.get('program_name', ''),
+            'base_score': base_score, 'signal_bonus': signal_bonus + ntis_bonus + bid_bonus,
+            'budget_bonus': budget_bonus, 'status_bonus': status_bonus, 'total_score': total,
+            'signals': signal_list, 'tier': tier, 'sales_status': sales_status, 'recommended_action': action,
         })
-
-    # 점수 내림차순 정렬
     results.sort(key=lambda x: x['total_score'], reverse=True)
     return results
 
 
+def _synthetic_scoring_data(n_schools: int, n_signals: int, seed: int = 0) -> tuple:
+    """벤치마크용 합성 데이터 (타겟 학교 n_schools교, 구매 신호 n_signals건, NTIS·입찰 각 신호의 1/10)."""
+    import random
+    rng = random.Random(seed)
+    names = [f"테스트대학교{i:05d}" for i in range(n_schools)]
+    statuses = list(STATUS_BONUS) + ['미접촉'] * 5
+    target_df = pd.DataFrame({
+        'id': range(n_schools + n_schools // 10, 0, -1),
+        'school_name': names + rng.sample(names, n_schools // 10),   # 일부 학교는 사업 2건
+        'program_name': [f"사업{i}" for i in range(n_schools + n_schools // 10)],
+        'priority_score': [rng.randint(0, 60) for _ in range(n_schools + n_schools // 10)],
+        'sales_status': [rng.choice(statuses) for _ in range(n_schools + n_schools // 10)],
+    }).sort_values(['priority_score', 'id'], ascending=False).reset_index(drop=True)
+    signals_df = pd.DataFrame({
+        'id': range(n_signals, 0, -1),
+        'school_name': [rng.choice(names) for _ in range(n_signals)],
+        'signal_type': [rng.choice(['입찰 공고', '재정지원사업', '뉴스']) for _ in range(n_signals)],
+        'signal_title': [f"신호{i}" for i in range(n_signals)],
+        'signal_score': [rng.randint(0, 50) for _ in range(n_signals)],
+    }).sort_values(['signal_score', 'id'], ascending=False).reset_index(drop=True)
+    ntis_df = pd.DataFrame({
+        'lead_agency': [rng.choice(names) for _ in range(n_signals // 10)],
+        'relevance_score': [rng.randint(0, 40) for _ in range(n_signals // 10)],
+    })
+    univ_bids_df = pd.DataFrame({'school_name': [rng.choice(names) for _ in range(n_signals // 10)]})
+    return target_df, signals_df, ntis_df, univ_bids_df
+
+
+def benchmark_school_scoring(n_schools: int = 10000, n_signals: int = 100000,
+                             compare_legacy: bool = True) -> dict:
+    """
+    합성 데이터로 점수 산정 시간을 측정합니다 (DB·API 미사용).
+    compare_legacy=True이면 이전 방식(iterrows)도 실행해 시간과 결과 일치 여부를 함께 반환합니다.
+    반환값: {"schools", "signals", "vectorized_sec", "legacy_sec", "speedup", "identical"}
+    """
+    data = _synthetic_scoring_data(n_schools, n_signals)
+    started = time.perf_counter()
+    vectorized = score_schools(*aggregate_score_inputs(*data), budget_bonus=20)
+    result = {
+        'schools': len(vectorized),
+        'signals': n_signals,
+        'vectorized_sec': round(time.perf_counter() - started, 3),
+    }
+    if compare_legacy:
+        started = time.perf_counter()
+        legacy = _score_schools_iterrows(*data, budget_bonus=20)
+        result['legacy_sec'] = round(time.perf_counter() - started, 3)
+        result['speedup'] = round(result['legacy_sec'] / max(result['vectorized_sec'], 1e-6), 1)
+        result['identical'] = legacy == vectorized
+    return result
+
+
+def get_top_schools(k: int = 5, exclude_statuses: tuple = ('수주', '보류'), with_signals: bool = False) -> list:
+    """
+    점수 상위 K개 학교 (school_scores 인덱스 순서로 K행만 읽고, 오늘 계산되지 않은 후보만 다시 계산).
+
+    신호 점수는 시간이 지날수록 감쇠만 하므로 예전에 저장된 합계는 오늘 점수의 상한입니다.
+    상위 K행이 모두 오늘 계산된 값이면 그 아래 학교는 (상한이 K번째 점수 이하이므로) 순위에 들 수 없어
+    평가를 멈추고, 아니면 K행 중 오래된 행만 다시 계산해 저장한 뒤 반복합니다.
+    변경이 기록된 학교(school_score_dirty)는 먼저 증분 재계산합니다.
+
+    with_signals=False이면 신호 상세('signals')를 읽지 않음 → 필요할 때 expand_signals(rows)
+    재계산이 실패하면 저장된 점수를 지우지 않고 그대로 반환합니다 (반복은 최대 ceil(학교 수 / K) + 1회).
+    """
+    today = datetime.today().strftime("%Y-%m-%d")
+    try:
+        refresh_school_scores(decay=False)
+        for _ in range(math.ceil(count_school_scores() / max(k, 1)) + 1):
+            rows = get_school_score_rows(limit=k, exclude_statuses=exclude_statuses, with_signals=False)
+            stale = {row['school_name'] for row in rows if row['scored_on'] != today}
+            if not stale:
+                break
+            with _refresh_lock:
+                _recompute_and_save(stale, today)
+    except Exception as e:
+        print(f"[구매 점수] 상위 학교 재계산 실패 — 저장된 점수로 표시: {e}")
+    rows = get_school_score_rows(limit=k, exclude_statuses=exclude_statuses, with_signals=False)
+    if with_signals:
+        expand_signals(rows)
+    return _with_action(rows)
+
+
+def expand_signals(rows: list) -> list:
+    """get_top_schools(with_signals=False) 결과에 신호 상세('signals')를 한 번의 조회로 채웁니다."""
+    signals = get_school_score_signals([row['school_name'] for row in rows if 'signals' not in row])
+    for row in rows:
+        row.setdefault('signals', signals.get(row['school_name'], []))
+    return rows
+
+
 def get_weekly_action_list(top_n: int = 15) -> list:
-    """이번 주 접근해야 할 학교 목록 (상위 N개)."""
-    all_scores = calculate_school_scores()
-    # 수주/보류 제외
-    actionable = [s for s in all_scores if s['sales_status'] not in ('수주', '보류')]
-    return actionable[:top_n]
+    """이번 주 접근해야 할 학교 목록 (상위 N개, 수주/보류 제외, 신호 상세 포함)."""
+    return get_top_schools(top_n, with_signals=True)
 
 
-def get_signal_summary() -> dict:
-    """구매 신호 요약 통계."""
-    signals_df = get_purchase_signals(min_score=0, limit=500)
-    if signals_df.empty:
-        return {'total': 0, 'unacted': 0, 'by_type': {}, 'by_school_top5': []}
-
-    unacted = signals_df[signals_df['is_acted'] == 0]
-
-    by_type = {}
-    if 'signal_type' in signals_df.columns:
-        by_type = signals_df['signal_type'].value_counts().to_dict()
-
-    by_school = []
-    if 'school_name' in unacted.columns and not unacted.empty:
-        top_schools = unacted.groupby('school_name').agg(
-            count=('id', 'count'),
-            max_score=('signal_score', 'max')
-        ).sort_values('max_score', ascending=False).head(5)
-        for name, row in top_schools.iterrows():
-            by_school.append({
-                'school': name,
-                'count': int(row['count']),
-                'max_score': int(row['max_score']),
-            })
+# ──────────────────────────────────────────────
+# 일별 점수 스냅샷 · 추세
+# ──────────────────────────────────────────────
 
-    return {
-        'total': len(signals_df),
-        'unacted': len(unacted),
-        'by_type': by_type,
-        'by_school_top5': by_school,
-    }
+def snapshot_school_scores(snapshot_date: str = None) -> dict:
+    """
+    저장된 학교별 점수를 일별 스냅샷으로 남깁니다 (스케줄러가 매일 refresh_school_scores() 직후 호출).
+    전날 스냅샷과 구성요소·등급이 같은 학교는 저장하지 않으므로 평소에는 신호가 들어온 학교 수만큼만 쌓이고,
+    예산 시기 보너스가 바뀌는 매월 1일에는 전체 학교가 저장됩니다.
+    반환값: {"snapshot_date", "schools", "changed"}
+    """
+    snapshot_date = snapshot_date or datetime.today().strftime("%Y-%m-%d")
+    with _refresh_lock:
+        return save_school_score_snapshot(snapshot_date, [(m, name) for m, name, _ in TIERS])
+
+
+def _tier_name(rank: int) -> str:
+    return TIERS[rank - 1][1] if 0 < rank <= len(TIERS) else ''
+
+
+def get_score_movers(days: int = 30, limit: int = 5) -> dict:
+    """
+    최근 스냅샷과 days일 전 스냅샷을 비교한 점수 급상승·급하락·등급 변화 학교.
+    days일 전 스냅샷이 없으면 (이력이 짧으면) 가장 오래된 스냅샷과 비교합니다.
+    반환값: {"from_date", "to_date",
+            "risers": 상승폭 상위 limit개, "fallers": 하락폭 상위 limit개,
+            "tier_changes": 등급이 바뀐 전체 학교 (상향 먼저)}
+            — 각 항목은 get_score_changes() 행 + 'from_tier_name', 'to_tier_name'
+    """
+    result = {'from_date': None, 'to_date': None, 'risers': [], 'fallers': [], 'tier_changes': []}
+    dates = [d['snapshot_date'] for d in get_school_score_snapshot_days()]
+    if len(dates) < 2:
+        return result
+    to_date = dates[0]
+    cutoff = (datetime.strptime(to_date, "%Y-%m-%d") - timedelta(days=days)).strftime("%Y-%m-%d")
+    from_date = next((d for d in dates if d <= cutoff), dates[-1])
+    changes = get_score_changes(from_date, to_date)
+    for change in changes:
+        change['from_tier_name'] = _tier_name(change['from_tier'])
+        change['to_tier_name'] = _tier_name(change['to_tier'])
+    result.update(
+        from_date=from_date,
+        to_date=to_date,
+        risers=[c for c in changes if c['delta'] > 0][:limit],
+        fallers=sorted((c for c in changes if c['delta'] < 0), key=lambda c: c['delta'])[:limit],
+        tier_changes=sorted(
+            (c for c in changes if c['from_tier'] != c['to_tier']),
+            key=lambda c: (c['to_tier'] > c['from_tier'], c['to_tier'], -c['delta']),
+        ),
+    )
+    return result
+
+
+def get_signal_summary() -> dict:
+    """구매 신호 요약 통계 (전체 신호 이력, SQLite 집계)."""
+    return get_purchase_signal_summary(top_n=5)
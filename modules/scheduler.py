@@ -4,6 +4,7 @@ APScheduler를 사용해 Streamlit 앱 실행 중 백그라운드로 주기적 
 - 매일 오전 7시: 사전규격 공고 수집 (30일치)
 - 매일 오전 7시 30분: 최근 7일 입찰 공고 수집
 - 매주 월요일 오전 8시: 국고 지원사업 뉴스 수집
+- 매일 오전 9시: 학교별 구매 점수 갱신 (바뀐 학교만) + 일별 점수 스냅샷 저장
 """
 import logging
 from datetime import datetime
@@ -72,22 +73,23 @@ def _run_ntis_job():
 
 
 def _run_univ_bids_job():
-    """대학 산학협력단 자체 입찰 뉴스 자동 수집 작업."""
+    """대학 산학협력단 자체 입찰 뉴스 자동 수집 작업 (타겟 학교 전체 스윕)."""
     try:
         import modules.crawler_univ_bids as ub
-        count = ub.fetch_univ_bid_news(top_n=20)
+        count = ub.sweep_univ_bid_news()
         logger.info(f"[스케줄러] 대학 입찰 뉴스 수집 완료: {count}건 ({datetime.now().strftime('%Y-%m-%d %H:%M')})")
     except Exception as e:
         logger.error(f"[스케줄러] 대학 입찰 뉴스 수집 실패: {e}")
 
 
 def _run_cad_dept_scan_job():
-    """CAD 학과 보유 여부 자동 스캔 작업 (5교씩)."""
+    """CAD 학과 보유 여부 자동 스캔 작업 (30교씩 동시 스캔, 중단된 작업이 있으면 이어서 실행)."""
     try:
         import modules.crawler_cad_departments as cad
-        result = cad.batch_scan_cad_departments(max_schools=5)
+        result = cad.batch_scan_cad_departments(max_schools=30)
+        resumed = f"작업 #{result['job_id']} 재개, " if result.get('resumed') else ""
         logger.info(
-            f"[스케줄러] CAD 학과 스캔 완료: "
+            f"[스케줄러] CAD 학과 스캔 완료: {resumed}"
             f"{result['scanned']}교 스캔, {result['cad_found']}교 발견, "
             f"{result['professors_saved']}명 교수 저장 "
             f"({datetime.now().strftime('%Y-%m-%d %H:%M')})"
@@ -96,6 +98,24 @@ def _run_cad_dept_scan_job():
         logger.error(f"[스케줄러] CAD 학과 스캔 실패: {e}")
 
 
+def _run_school_scores_job():
+    """학교별 구매 점수 갱신 작업 (수집으로 바뀐 학교만 재계산, 달이 바뀌면 예산 시기 보너스 갱신) + 일별 스냅샷."""
+    try:
+        import modules.purchase_signal_engine as pse
+        result = pse.refresh_school_scores()
+        logger.info(
+            f"[스케줄러] 구매 점수 갱신 완료: {result['recomputed']}교 재계산, "
+            f"시기 보너스 {result['budget_updated']}교 갱신 ({datetime.now().strftime('%Y-%m-%d %H:%M')})"
+        )
+        snapshot = pse.snapshot_school_scores()
+        logger.info(
+            f"[스케줄러] 점수 스냅샷 저장: {snapshot['snapshot_date']} "
+            f"{snapshot['schools']}교 중 {snapshot['changed']}교 변경분 저장"
+        )
+    except Exception as e:
+        logger.error(f"[스케줄러] 구매 점수 갱신 실패: {e}")
+
+
 def start_scheduler():
     """
     APScheduler BackgroundScheduler를 시작합니다.
@@ -169,6 +189,14 @@ def start_scheduler():
             replace_existing=True,
         )
 
+        # 매일 오전 9:00 - 구매 점수 갱신 (오전 수집분 반영, 매월 1일에는 예산 시기 보너스 갱신) + 점수 스냅샷
+        scheduler.add_job(
+            _run_school_scores_job,
+            CronTrigger(hour=9, minute=0),
+            id="school_scores_daily",
+            replace_existing=True,
+        )
+
         scheduler.start()
         st.session_state["_scheduler_started"] = True
         st.session_state["_scheduler"] = scheduler
@@ -0,0 +1,147 @@
+"""
+학교 360° 프로필 (학교 1곳에 관한 모든 수집 데이터를 한 번에 조회)
+
+■ 목적
+  - 학교 하나를 보려면 타겟 학교 DB·교수 발굴·공고·구매 신호 페이지를 돌며
+    테이블 전체를 DataFrame으로 읽고 학교명으로 거르던 방식을 API 호출 1회로 대체
+
+■ 동작 방식
+  - 입력 이름(약칭·'OO대학교 산학협력단' 표기 포함)을 school_resolver로 정규 학교명으로 해석
+  - 정규 학교명으로 해석되는 저장 표기 목록(stored_forms)으로 테이블별 학교명 인덱스를 IN 조회
+    → target_schools·contacts·bid_history·grants·ntis_projects·univ_bids·purchase_signals·sales_status_history
+      + school_scores·일별 점수 스냅샷 (db_manager.get_school_profile_rows, 읽기 트랜잭션 1개)
+  - 결과는 정규 학교명 기준 메모리 캐시 (PROFILE_CACHE_TTL_SEC초, 최대 PROFILE_CACHE_SIZE교 LRU)
+    → 화면에서 학교 데이터를 바꾸면 clear_school_profile_cache(학교명)
+
+■ 측정
+  - benchmark_school_profile() → 이전 방식(테이블 전체 로드 + pandas 필터)·캐시 미적중·적중 조회 시간 비교
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from utils.db_manager import (
+    get_school_profile_rows,
+    get_school_score_rows,
+    get_all_target_schools,
+    get_all_contacts,
+    get_all_bids,
+    get_all_grants,
+    get_all_ntis_projects,
+    get_all_univ_bids,
+    get_purchase_signals,
+)
+from modules.school_resolver import get_resolver
+
+# 캐시 유지 시간(초)·최대 학교 수 (환경변수로 조정)
+PROFILE_CACHE_TTL_SEC = int(os.getenv('SCHOOL_PROFILE_CACHE_TTL_SEC', '60'))
+PROFILE_CACHE_SIZE = int(os.getenv('SCHOOL_PROFILE_CACHE_SIZE', '128'))
+
+# 테이블별 최대 행 수 (전체 건수는 'counts'에 별도 반환)
+PROFILE_ROW_LIMIT = 100
+
+_cache_lock = threading.Lock()
+_cache = OrderedDict()    # 정규 학교명 → (저장 시각, 프로필)
+
+
+def get_school_profile(name: str, use_cache: bool = True) -> dict:
+    """
+    학교 1곳의 360° 프로필을 반환합니다.
+    name: 정식 명칭·약칭·산학협력단 표기 모두 가능 (타겟 DB에 없는 학교는 입력 이름 그대로 조회)
+    반환값: get_school_profile_rows() 결과 +
+            {'school_name': 정규 학교명, 'query': 입력 이름, 'is_target': 타겟 학교 DB 학교 여부,
+             'stored_forms': 조회한 저장 표기, 'cached': 캐시 적중 여부, 'elapsed_ms': 조회 시간}
+            타겟 학교가 아니고 관련 데이터도 없으면 {'error': 메시지}
+            DB 조회 실패 시 {'error': 메시지, 'db_error': True} (캐시하지 않음)
+    """
+    query = (name or '').strip()
+    if not query:
+        return {'error': '학교명을 입력하세요.'}
+    started = time.perf_counter()
+    resolver = get_resolver()
+    canonical = resolver.resolve_name(query)
+    school_name = canonical or query
+
+    if use_cache:
+        with _cache_lock:
+            entry = _cache.get(school_name)
+            if entry and time.monotonic() - entry[0] < PROFILE_CACHE_TTL_SEC:
+                _cache.move_to_end(school_name)
+                return {**entry[1], 'query': query, 'cached': True,
+                        'elapsed_ms': round((time.perf_counter() - started) * 1000, 2)}
+
+    forms = resolver.stored_forms(school_name)
+    profile = get_school_profile_rows(school_name, forms, limit=PROFILE_ROW_LIMIT)
+    if 'error' in profile:
+        return {'error': profile['error'], 'db_error': True}
+    if canonical is None and not any(profile['counts'].values()):
+        return {'error': f"'{query}' 학교를 찾을 수 없습니다. (타겟 학교 DB·수집 데이터에 없음)"}
+    profile.update(school_name=school_name, is_target=canonical is not None, stored_forms=forms)
+
+    with _cache_lock:
+        _cache[school_name] = (time.monotonic(), profile)
+        _cache.move_to_end(school_name)
+        while len(_cache) > PROFILE_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return {**profile, 'query': query, 'cached': False,
+            'elapsed_ms': round((time.perf_counter() - started) * 1000, 2)}
+
+
+def clear_school_profile_cache(school_name: str = None) -> None:
+    """학교 1곳(약칭 가능) 또는 전체(None)의 프로필 캐시를 비웁니다."""
+    with _cache_lock:
+        if school_name is None:
+            _cache.clear()
+        else:
+            _cache.pop(get_resolver().canonical_name(school_name.strip()), None)
+
+
+# ──────────────────────────────────────────────
+# 성능 측정
+# ──────────────────────────────────────────────
+
+def _legacy_profile(school_name: str) -> dict:
+    """이전 방식: 페이지마다 테이블 전체를 DataFrame으로 읽고 학교명으로 필터."""
+    sources = {
+        'targets': (get_all_target_schools, 'school_name'),
+        'contacts': (get_all_contacts, 'school_name'),
+        'bids': (get_all_bids, 'demand_agency'),
+        'grants': (get_all_grants, 'selected_school'),
+        'ntis_projects': (get_all_ntis_projects, 'lead_agency'),
+        'univ_bids': (get_all_univ_bids, 'school_name'),
+        'signals': (lambda: get_purchase_signals(limit=-1), 'school_name'),    # LIMIT -1 = 전체
+    }
+    result = {}
+    for key, (load, column) in sources.items():
+        df = load()
+        result[key] = df[df[column] == school_name] if column in df.columns else df.iloc[0:0]
+    return result
+
+
+def benchmark_school_profile(school_names: list = None, sample: int = 20) -> dict:
+    """
+    현재 DB로 학교 프로필 조회 시간을 측정합니다 (학교당 평균 ms).
+    school_names가 없으면 점수 상위 sample개 학교를 사용합니다.
+    반환값: {"schools", "legacy_ms", "uncached_ms", "cached_ms", "speedup"}
+    """
+    names = school_names or [r['school_name'] for r in get_school_score_rows(limit=sample, with_signals=False)]
+    if not names:
+        return {'schools': 0}
+
+    def mean_ms(fn) -> float:
+        started = time.perf_counter()
+        for name in names:
+            fn(name)
+        return round((time.perf_counter() - started) * 1000 / len(names), 2)
+
+    legacy_ms = mean_ms(_legacy_profile)
+    uncached_ms = mean_ms(lambda n: get_school_profile(n, use_cache=False))
+    cached_ms = mean_ms(get_school_profile)    # 직전 호출로 캐시가 채워진 상태
+    return {
+        'schools': len(names),
+        'legacy_ms': legacy_ms,
+        'uncached_ms': uncached_ms,
+        'cached_ms': cached_ms,
+        'speedup': round(legacy_ms / max(uncached_ms, 1e-6), 1),
+    }
@@ -0,0 +1,287 @@
+"""
+학교명 엔티티 해석기 (target_schools 기반)
+
+■ 목적
+  - 뉴스/공고 텍스트에서 '타겟 학교 DB에 있는 학교'만 정확히 식별
+  - 정규식(…대학/대학교/고등학교)이 잡던 '국립대학', '지방대학' 같은 일반명사 오탐 제거
+  - '부산대', 'POSTECH', '한양대 ERICA', 'OO대학교 산학협력단' 등 약칭·캠퍼스 표기도 인식
+  - 결과는 정규 학교명 + 대표 school_id(target_schools 최소 id)로 통일 → 신호 매칭 일관성 확보
+
+■ 동작 방식
+  - target_schools 학교명 + 자동 생성 별칭 + SCHOOL_ALIASES → Aho-Corasick 오토마톤
+  - 텍스트 1회 스캔으로 모든 학교 후보를 찾고, 겹치면 가장 긴 표기를 채택
+  - 앞뒤 경계 검사로 '경남대표', '동부산대' 같은 오탐 차단 (정식 명칭은 앞쪽만 검사)
+  - target_schools 변경 시: 새 해석기를 만들어(오토마톤 빌드까지 완료) 공용 참조를 교체
+    → 다른 스레드가 스캔 중인 기존 해석기는 수정하지 않음
+"""
+import re
+import threading
+import time
+
+from utils.aho_corasick import AhoCorasick
+from utils.db_manager import get_target_school_keys, get_target_schools_fingerprint
+
+# 학교 토큰 정규식 (타겟 DB에 없는 신규 학교 후보 추출용 — 해석기 보조 경로)
+SCHOOL_TOKEN_PATTERN = re.compile(
+    r'([가-힣A-Za-z0-9]+(?:대학교|대학|고등학교|마이스터고|폴리텍|전문대학|직업전문학교))'
+)
+
+# 정규식이 잡지만 특정 학교가 아닌 일반명사
+GENERIC_SCHOOL_TERMS = {
+    '국립대학', '국립대학교', '사립대학', '사립대학교', '지방대학', '지방대학교',
+    '지역대학', '거점대학', '거점국립대학', '전문대학', '일반대학', '4년제대학',
+    '혁신대학', '선도대학', '참여대학', '주관대학', '참여대학교', '연합대학',
+    '글로컬대학', '첨단대학', '우수대학', '해당대학', '각대학', '신규대학',
+    '사이버대학', '방송통신대학', '특성화고등학교', '마이스터고등학교', '고등학교',
+    '공업고등학교', '직업전문학교', '한국폴리텍', '폴리텍',
+}
+
+# 수동 별칭 테이블 (정규 학교명 → 약칭/영문/옛 이름)
+SCHOOL_ALIASES = {
+    '포항공과대학교': ['포스텍', 'POSTECH', '포항공대'],
+    '한국기술교육대학교': ['코리아텍', 'KOREATECH', '한기대'],
+    '서울과학기술대학교': ['서울과기대', '서울테크'],
+    '한국공학대학교': ['한국공대', '한국산업기술대학교', '산기대'],
+    '금오공과대학교': ['금오공대'],
+    '경상국립대학교': ['경상대', '경상대학교', '경남과기대'],
+    '한양대학교(ERICA)': ['한양대 ERICA', '한양대ERICA', '한양대 에리카', '에리카캠퍼스', 'ERICA캠퍼스'],
+    '한국해양대학교': ['해양대'],
+    '가톨릭관동대학교': ['관동대'],
+    '한국교통대학교': ['교통대'],
+}
+
+# 약칭 뒤에 붙어도 되는 조사/접미 (이외의 한글이 붙으면 다른 단어로 판단)
+_ALLOWED_SUFFIX_CHARS = set('가는은의에와과도를을이로서측랑및')
+
+# 별칭 생성 시 제거할 접미어 (부속 조직명)
+_ORG_SUFFIXES = ('산학협력단', '사업단', '캠퍼스', '본교')
+
+# 정식 명칭 앞에 붙어도 되는 설립 구분 (국립부경대학교 등)
+_ALLOWED_PREFIXES = ('국립', '사립', '시립', '도립', '공립')
+
+_CAMPUS_PATTERN = re.compile(r'^(.+?)\s*\((.+)\)$')
+
+_REFRESH_INTERVAL_SEC = 30
+
+
+def _is_hangul(ch: str) -> bool:
+    return '가' <= ch <= '힣'
+
+
+def _short_form(name: str) -> str:
+    """정식 명칭의 약칭을 만듭니다 (부산대학교 → 부산대, 마산공업고등학교 → 마산공고)."""
+    if name.endswith('대학교') and len(name) >= 5:
+        return name[:-2]
+    if name.endswith('대학') and len(name) >= 4:
+        return name[:-1]
+    if name.endswith('공업고등학교') and len(name) >= 8:
+        return name[:-6] + '공고'
+    if name.endswith('고등학교') and len(name) >= 6:
+        return name[:-3]
+    return ''
+
+
+def _generate_aliases(name: str) -> list:
+    """학교명에서 자동 별칭(약칭, 캠퍼스 표기)을 생성합니다."""
+    aliases = []
+    m = _CAMPUS_PATTERN.match(name)
+    if m:
+        base, campus = m.group(1).strip(), m.group(2).strip()
+        short = _short_form(base)
+        for b in filter(None, [base, short]):
+            aliases += [f'{b} {campus}', f'{b}{campus}', f'{b} {campus}캠퍼스', f'{b}({campus})']
+    else:
+        short = _short_form(name)
+        if short:
+            aliases.append(short)
+    aliases += SCHOOL_ALIASES.get(name, [])
+    return [a for a in aliases if a and a != name]
+
+
+def _normalize_name(name: str) -> str:
+    name = (name or '').strip()
+    for suffix in _ORG_SUFFIXES:
+        if name.endswith(suffix):
+            name = name[:-len(suffix)].strip()
+    return name
+
+
+class SchoolResolver:
+    """target_schools 학교명/별칭 오토마톤으로 텍스트 속 학교를 식별합니다."""
+
+    def __init__(self):
+        self._ac = AhoCorasick()
+        self._schools = {}        # school_name → school_id
+        self._official = set()    # 정식 명칭 패턴 (뒤쪽 경계 검사 생략)
+        self._alias_owner = {}    # alias → school_name (충돌 별칭 제외용)
+        self._aliases = {}        # school_name → [alias, ...]
+        self._ambiguous = set()
+
+    def __len__(self) -> int:
+        return len(self._schools)
+
+    @property
+    def school_names(self) -> set:
+        return set(self._schools)
+
+    def add_school(self, school_id: int, school_name: str) -> None:
+        """학교 1건을 오토마톤에 추가합니다 (공유 전 구성용 — 스캔 중인 해석기에는 호출 금지)."""
+        if not school_name or school_name in self._schools:
+            return
+        self._schools[school_name] = school_id
+        self._official.add(school_name)
+        self._ac.add(school_name, school_name)
+
+        for alias in _generate_aliases(school_name):
+            owner = self._alias_owner.get(alias)
+            if alias in self._schools or alias in self._ambiguous:
+                continue
+            if owner and owner != school_name:
+                # 두 학교가 같은 약칭을 공유하면 오탐 위험 → 별칭에서 제외
+                self._ambiguous.add(alias)
+                continue
+            self._alias_owner[alias] = school_name
+            self._aliases.setdefault(school_name, []).append(alias)
+            self._ac.add(alias, school_name)
+
+    def _accept(self, text: str, start: int, end: int, pattern: str) -> bool:
+        """매칭 앞뒤 경계를 검사합니다 (정식 명칭은 앞쪽만, 약칭은 앞뒤 모두)."""
+        if pattern in self._ambiguous:
+            return False
+        if start > 0 and _is_hangul(text[start - 1]) and not text[:start].endswith(_ALLOWED_PREFIXES):
+            return False
+        if pattern in self._official:
+            return True
+        if end < len(text) and _is_hangul(text[end]) and text[end] not in _ALLOWED_SUFFIX_CHARS:
+            return False
+        return True
+
+    def scan(self, text: str) -> list:
+        """
+        텍스트를 1회 스캔해 등장한 타겟 학교를 모두 반환합니다.
+        반환값: [{'school_id', 'school_name', 'matched', 'start', 'end'}, ...] (등장 순)
+        """
+        if not text or not self._schools:
+            return []
+        result = []
+        for start, end, pattern, values in self._ac.find_longest(text, self._accept):
+            name = values[0]
+            result.append({
+                'school_id': self._schools[name],
+                'school_name': name,
+                'matched': pattern,
+                'start': start,
+                'end': end,
+            })
+        return result
+
+    def school_ids(self, text: str) -> list:
+        """텍스트에 등장한 학교의 대표 ID 목록 (중복 제거, 등장 순)."""
+        seen = []
+        for m in self.scan(text):
+            if m['school_id'] not in seen:
+                seen.append(m['school_id'])
+        return seen
+
+    def primary_match(self, text: str):
+        """가장 많이 언급된 학교 1건 (동률이면 먼저 등장한 학교). 없으면 None."""
+        matches = self.scan(text)
+        if not matches:
+            return None
+        counts = {}
+        for m in matches:
+            counts[m['school_name']] = counts.get(m['school_name'], 0) + 1
+        best = max(counts, key=lambda n: (counts[n], -next(
+            m['start'] for m in matches if m['school_name'] == n)))
+        return next(m for m in matches if m['school_name'] == best)
+
+    def resolve_name(self, name: str):
+        """학교명 1개를 정규 학교명으로 변환합니다. 타겟 DB에 없으면 None."""
+        name = _normalize_name(name)
+        if not name:
+            return None
+        if name in self._schools:
+            return name
+        owner = self._alias_owner.get(name)
+        if owner and name not in self._ambiguous:
+            return owner
+        matches = self.scan(name)
+        if len(matches) == 1 and matches[0]['end'] - matches[0]['start'] == len(name):
+            return matches[0]['school_name']
+        return None
+
+    def canonical_name(self, name: str) -> str:
+        """정규 학교명으로 변환하되, 해석되지 않으면 원래 이름을 그대로 반환합니다."""
+        return self.resolve_name(name) or name
+
+    def stored_forms(self, school_name: str) -> list:
+        """
+        resolve_name()이 school_name으로 해석하는 저장 표기 목록
+        (정규 학교명·별칭 × 부속 조직 접미어 '산학협력단' 등) — 학교명 컬럼 인덱스 IN 조회용.
+        타겟 DB에 없는 이름이면 [정리한 이름]만 반환합니다.
+        """
+        name = _normalize_name(school_name)
+        if name not in self._schools:
+            return [name] if name else []
+        forms = []
+        for base in [name] + [a for a in self._aliases.get(name, []) if a not in self._ambiguous]:
+            forms.append(base)
+            for suffix in _ORG_SUFFIXES:
+                forms += [base + suffix, f'{base} {suffix}']
+        return forms
+
+
+# ──────────────────────────────────────────────
+# 모듈 공용 인스턴스 (target_schools 변경 시 자동 갱신)
+# ──────────────────────────────────────────────
+
+_lock = threading.Lock()
+_resolver = None
+_fingerprint = None
+_checked_at = 0.0
+
+
+def build_resolver(school_keys: list) -> SchoolResolver:
+    """[(school_id, school_name), ...]로 새 해석기를 만듭니다."""
+    resolver = SchoolResolver()
+    for school_id, name in sorted(school_keys, key=lambda r: r[0]):
+        resolver.add_school(school_id, name)
+    resolver._ac.build()    # 공유 전에 빌드 (첫 스캔 스레드가 빌드하지 않게)
+    return resolver
+
+
+def get_resolver(force_refresh: bool = False) -> SchoolResolver:
+    """
+    공용 해석기를 반환합니다.
+    target_schools 지문을 최대 30초에 한 번 확인하고, 바뀌었으면 새 해석기로 교체합니다.
+    (기존 해석기는 그대로 두므로 이미 받아 간 스레드는 이전 학교 목록으로 안전하게 스캔)
+    """
+    global _resolver, _fingerprint, _checked_at
+
+    with _lock:
+        now = time.monotonic()
+        if _resolver is not None and not force_refresh and now - _checked_at < _REFRESH_INTERVAL_SEC:
+            return _resolver
+        _checked_at = now
+
+        fingerprint = get_target_schools_fingerprint()
+        if _resolver is not None and fingerprint == _fingerprint:
+            return _resolver
+
+        _resolver = build_resolver(get_target_school_keys())
+        _fingerprint = fingerprint
+        return _resolver
+
+
+def extract_school_candidates(text: str) -> list:
+    """
+    타겟 DB 밖의 학교 후보를 정규식으로 추출합니다 (일반명사 제외, 중복 제거).
+    신규 선정교 발굴처럼 DB에 없는 학교도 필요한 경우에만 사용합니다.
+    """
+    seen = []
+    for token in SCHOOL_TOKEN_PATTERN.findall(text or ''):
+        if token in GENERIC_SCHOOL_TERMS or len(token) < 4:
+            continue
+        if token not in seen:
+            seen.append(token)
+    return seen
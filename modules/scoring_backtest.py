@@ -0,0 +1,291 @@
+"""
+구매 점수 백테스트 / 벤치마크 하네스 (오프라인)
+
+■ 목적
+  - BUDGET_MONTH_BONUS·STATUS_BONUS·신호 상한·반감기 설정이 실제 수주를 미리 짚어냈는지 검증
+  - 설정별 점수 재현 시간·메모리를 함께 측정 → 정확도와 비용을 보고 가중치 조정
+
+■ 방식
+  - get_scoring_history()로 이력 테이블을 1회 읽고, 과거 기준일(as_of)마다 그 시점에 알 수 있던 데이터만으로 점수 재현
+    · 타겟 학교: created_at ≤ 기준일 / 구매 신호: detected_at ≤ 기준일, 기준일 기준 감쇠
+    · NTIS·대학 입찰: crawled_at ≤ 기준일 / 영업 상태: sales_status_history로 기준일 당시 상태 복원
+    · 예산 시기 보너스: 기준일의 월
+    · 점수 계산은 운영과 같은 aggregate_score_inputs → score_schools (params로 가중치만 교체)
+  - 정답: 기준일 이후 horizon_days 안에
+    · 수주 — 영업 상태가 '수주'로 바뀐 학교 + 낙찰업체가 자사(OUR_BIDDER_NAMES)인 입찰의 수요기관 학교
+    · 구매 — 낙찰업체가 확인된 입찰이 있는 학교 (경쟁사 낙찰 포함, 보조 지표)
+  - 지표: 수주·보류 제외 상위 K개의 수주 적중률(precision@K)·재현율(recall@K)·구매 적중률,
+          무작위 선택 대비 배수(lift)
+
+■ 사용법
+  run_backtest()                                    → 기본 설정 묶음(BACKTEST_CONFIGS) 비교
+  run_backtest(configs={'상한 40': {'signal_bonus_cap': 40}}, k=10, horizon_days=60)
+  run_backtest(history=_synthetic_history(5000, 100000))   → 합성 이력으로 규모별 시간·메모리만 확인
+
+  설정 키: budget_month_bonus(dict), status_bonus(dict), signal_bonus_cap, ntis_bonus_cap,
+          univ_bid_bonus, half_lives(dict, 빈 dict + default_half_life=None이면 감쇠 없음), default_half_life
+"""
+import os
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from utils.db_manager import get_scoring_history
+from modules.school_resolver import get_resolver
+from modules.purchase_signal_engine import (
+    BUDGET_MONTH_BONUS,
+    SIGNAL_HALF_LIFE_DAYS,
+    DEFAULT_HALF_LIFE_DAYS,
+    SIGNAL_DETAIL_LIMIT,
+    aggregate_score_inputs,
+    score_schools,
+)
+
+# 자사 낙찰로 보는 낙찰업체명 (쉼표 구분)
+OUR_BIDDER_NAMES = [n.strip() for n in os.getenv('OUR_BIDDER_NAMES', '하나티에스,HANATS').split(',') if n.strip()]
+
+# 상위 K개 평가에서 뺄 영업 상태 (이번 주 접근 대상과 같은 기준)
+EXCLUDED_STATUSES = ('수주', '보류')
+
+# 기본 비교 설정 (현재 가중치 + 항목별 제거)
+BACKTEST_CONFIGS = {
+    '현재 설정': {},
+    '예산 시기 제외': {'budget_month_bonus': {}},
+    '영업 상태 제외': {'status_bonus': {}},
+    '신호 감쇠 없음': {'half_lives': {}, 'default_half_life': None},
+    '신호 상한 50': {'signal_bonus_cap': 50},
+}
+
+_UNAWARDED_BIDDERS = ('', '미상(공고 단계)')
+
+
+# ──────────────────────────────────────────────
+# 이력 준비 (1회)
+# ──────────────────────────────────────────────
+
+def _school_of(resolver, name: str):
+    """기관명 → 정규 학교명 (해석 안 되면 본문 최다 언급 학교, 그래도 없으면 None)."""
+    if not name:
+        return None
+    resolved = resolver.resolve_name(name)
+    if resolved:
+        return resolved
+    match = resolver.primary_match(name)
+    return match['school_name'] if match else None
+
+
+def _prepare(history: dict) -> dict:
+    """날짜 열 변환 + 학교명 정규화 (고유 이름마다 1회 해석)."""
+    resolver = get_resolver()
+    h = {name: df.copy() for name, df in history.items()}
+
+    def canonical(series, strict=False):
+        mapping = {n: (_school_of(resolver, n) if strict else resolver.canonical_name(n))
+                   for n in series.dropna().unique()}
+        return series.map(mapping)
+
+    for key, column in (('targets', 'created_at'), ('signals', 'detected_at'), ('ntis', 'crawled_at'),
+                        ('univ_bids', 'crawled_at'), ('bids', 'contract_date'), ('status_history', 'changed_at')):
+        h[key]['at'] = pd.to_datetime(h[key][column], errors='coerce')
+    h['targets'] = h['targets'].sort_values(['priority_score', 'id'], ascending=False)
+    h['signals']['school_name'] = canonical(h['signals']['school_name'])
+    h['ntis']['lead_agency'] = canonical(h['ntis']['lead_agency'])
+    h['univ_bids']['school_name'] = canonical(h['univ_bids']['school_name'])
+    h['bids']['school'] = canonical(h['bids']['demand_agency'], strict=True)
+    h['bids']['awarded'] = ~h['bids']['successful_bidder'].fillna('').isin(_UNAWARDED_BIDDERS)
+    ours = h['bids']['successful_bidder'].fillna('')
+    h['bids']['ours'] = ours.apply(lambda b: any(n in b for n in OUR_BIDDER_NAMES))
+    return h
+
+
+def _default_dates(h: dict, horizon_days: int, max_dates: int) -> list:
+    """데이터 시작 월부터 (오늘 - horizon) 까지 매월 1일 (최근 max_dates개)."""
+    starts = [df['at'].min() for df in h.values() if 'at' in df.columns and not df.empty]
+    starts = [s for s in starts if pd.notna(s)]
+    if not starts:
+        return []
+    end = pd.Timestamp(datetime.today() - timedelta(days=horizon_days))
+    dates = list(pd.date_range(min(starts).normalize() + pd.offsets.MonthBegin(1), end, freq='MS'))
+    return dates[-max_dates:]
+
+
+# ──────────────────────────────────────────────
+# 시점별 점수 재현 / 정답
+# ──────────────────────────────────────────────
+
+def _status_as_of(h: dict, as_of) -> pd.Series:
+    """기준일 당시 학교별 영업 상태 (그 전 마지막 변경 → 없으면 그 후 첫 변경의 이전 상태 → 없으면 현재 상태)."""
+    status = h['targets'].drop_duplicates('school_name').set_index('school_name')['sales_status'].copy()
+    hist = h['status_history']
+    if hist.empty:
+        return status
+    before = hist[hist['at'] <= as_of].groupby('school_name')['new_status'].last()
+    after = hist[hist['at'] > as_of].groupby('school_name')['old_status'].first()
+    status.update(after)
+    status.update(before)
+    return status
+
+
+def _decayed(signals: pd.DataFrame, as_of, config: dict) -> pd.Series:
+    half_lives = config.get('half_lives', SIGNAL_HALF_LIFE_DAYS)
+    default = config.get('default_half_life', DEFAULT_HALF_LIFE_DAYS)
+    if not half_lives and not default:
+        return signals['signal_score']
+    hl = signals['signal_type'].map(half_lives or {}).fillna(default or 0).astype(float)
+    age = ((as_of - signals['at']).dt.total_seconds() / 86400).clip(lower=0).fillna(0)
+    weight = (0.5 ** (age / hl.where(hl > 0))).fillna(1.0)
+    return (signals['signal_score'] * weight).round().astype(int)
+
+
+def score_as_of(h: dict, as_of, config: dict = None) -> list:
+    """_prepare()된 이력으로 기준일 시점의 점수를 재현합니다 (score_schools 결과와 같은 형태)."""
+    config = config or {}
+    targets = h['targets']
+    targets = targets[targets['at'].isna() | (targets['at'] <= as_of)].copy()
+    status = _status_as_of(h, as_of)
+    targets['sales_status'] = targets['school_name'].map(status).fillna(targets['sales_status'])
+
+    signals = h['signals']
+    signals = signals[signals['at'].isna() | (signals['at'] <= as_of)]
+    signals = signals.assign(signal_score=_decayed(signals, as_of, config)) \
+        .sort_values('signal_score', ascending=False, kind='stable')
+    ntis = h['ntis'][h['ntis']['at'].isna() | (h['ntis']['at'] <= as_of)]
+    univ_bids = h['univ_bids'][h['univ_bids']['at'].isna() | (h['univ_bids']['at'] <= as_of)]
+
+    schools, signal_lists = aggregate_score_inputs(targets, signals, ntis, univ_bids, SIGNAL_DETAIL_LIMIT)
+    budget_bonus = config.get('budget_month_bonus', BUDGET_MONTH_BONUS).get(as_of.month, 0)
+    return score_schools(schools, signal_lists, budget_bonus, params=config)
+
+
+def outcomes_after(h: dict, as_of, horizon_days: int) -> dict:
+    """기준일 이후 horizon_days 안의 정답 {"won": 수주 학교 집합, "purchased": 낙찰 확인 입찰 학교 집합}."""
+    end = as_of + pd.Timedelta(days=horizon_days)
+    hist = h['status_history']
+    window = hist[(hist['at'] > as_of) & (hist['at'] <= end)]
+    won = set(window.loc[window['new_status'] == '수주', 'school_name'])
+    bids = h['bids']
+    bids = bids[(bids['at'] > as_of) & (bids['at'] <= end) & bids['awarded'] & bids['school'].notna()]
+    won |= set(bids.loc[bids['ours'], 'school'])
+    return {'won': won, 'purchased': set(bids['school'])}
+
+
+def _evaluate(scores: list, outcome: dict, k: int) -> dict:
+    candidates = [s['school_name'] for s in scores if s['sales_status'] not in EXCLUDED_STATUSES]
+    top = set(candidates[:k])
+    won = outcome['won'] & set(candidates)
+    base_rate = len(won) / len(candidates) if candidates else 0.0
+    precision = len(top & won) / len(top) if top else 0.0
+    return {
+        'candidates': len(candidates),
+        'wins': len(won),
+        'precision_at_k': precision,
+        'recall_at_k': len(top & won) / len(won) if won else None,
+        'purchase_precision_at_k': len(top & outcome['purchased']) / len(top) if top else 0.0,
+        'base_rate': base_rate,
+    }
+
+
+# ──────────────────────────────────────────────
+# 실행
+# ──────────────────────────────────────────────
+
+def run_backtest(configs: dict = None, as_of_dates: list = None, horizon_days: int = 90, k: int = 20,
+                 history: dict = None, max_dates: int = 12, measure_memory: bool = True) -> list:
+    """
+    설정별로 과거 기준일마다 점수를 재현해 이후 수주 적중률과 시간·메모리를 측정합니다.
+    반환값: [{"config", "dates", "precision_at_k", "recall_at_k", "purchase_precision_at_k", "base_rate",
+              "lift", "wins", "seconds", "ms_per_date", "peak_mb", "per_date": [...]}, ...]
+            (precision 내림차순, 지표는 기준일 평균 — recall은 수주가 있던 기준일만)
+    """
+    configs = configs if configs is not None else BACKTEST_CONFIGS
+    h = _prepare(history if history is not None else get_scoring_history())
+    dates = [pd.Timestamp(d) for d in as_of_dates] if as_of_dates else _default_dates(h, horizon_days, max_dates)
+    if not dates:
+        return []
+    outcomes = {d: outcomes_after(h, d, horizon_days) for d in dates}
+
+    report = []
+    for name, config in configs.items():
+        started = time.perf_counter()
+        per_date = []
+        for d in dates:
+            metrics = _evaluate(score_as_of(h, d, config), outcomes[d], k)
+            per_date.append({'as_of': d.strftime('%Y-%m-%d'), **metrics})
+        seconds = time.perf_counter() - started
+
+        peak_mb = None
+        if measure_memory:
+            # 시간 측정과 분리 (tracemalloc은 할당마다 부가 비용이 있음)
+            tracemalloc.start()
+            for d in dates:
+                score_as_of(h, d, config)
+            peak_mb = round(tracemalloc.get_traced_memory()[1] / 1024 / 1024, 2)
+            tracemalloc.stop()
+
+        def mean(key):
+            values = [m[key] for m in per_date if m[key] is not None]
+            return round(sum(values) / len(values), 4) if values else None
+
+        precision, base_rate = mean('precision_at_k'), mean('base_rate')
+        report.append({
+            'config': name,
+            'dates': len(dates),
+            'precision_at_k': precision,
+            'recall_at_k': mean('recall_at_k'),
+            'purchase_precision_at_k': mean('purchase_precision_at_k'),
+            'base_rate': base_rate,
+            'lift': round(precision / base_rate, 2) if base_rate else None,
+            'wins': sum(m['wins'] for m in per_date),
+            'seconds': round(seconds, 3),
+            'ms_per_date': round(seconds / len(dates) * 1000, 1),
+            'peak_mb': peak_mb,
+            'per_date': per_date,
+        })
+    return sorted(report, key=lambda r: -(r['precision_at_k'] or 0))
+
+
+def _synthetic_history(n_schools: int = 2000, n_signals: int = 50000, days: int = 365, seed: int = 0) -> dict:
+    """
+    규모별 시간·메모리 확인용 합성 이력 (get_scoring_history와 같은 형태).
+    학교 이름은 타겟 DB에 없으므로 해석기는 원래 이름을 그대로 사용합니다.
+    """
+    import random
+    rng = random.Random(seed)
+    start = datetime.today() - timedelta(days=days)
+
+    def stamp():
+        return (start + timedelta(days=rng.uniform(0, days))).strftime('%Y-%m-%d %H:%M:%S')
+
+    names = [f"합성대학교{i:05d}" for i in range(n_schools)]
+    statuses = ['미접촉', '접촉완료', '제안서발송', '협의중']
+    targets = pd.DataFrame({
+        'id': range(1, n_schools + 1), 'school_name': names, 'program_name': '합성사업',
+        'priority_score': [rng.randint(0, 60) for _ in names], 'sales_status': [rng.choice(statuses) for _ in names],
+        'created_at': (start - timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S'), 'updated_at': None,
+    })
+    signals = pd.DataFrame({
+        'school_name': [rng.choice(names) for _ in range(n_signals)],
+        'signal_type': [rng.choice(list(SIGNAL_HALF_LIFE_DAYS)) for _ in range(n_signals)],
+        'signal_title': '합성 신호', 'signal_score': [rng.randint(0, 90) for _ in range(n_signals)],
+        'detected_at': [stamp() for _ in range(n_signals)],
+    })
+    ntis = pd.DataFrame({
+        'lead_agency': [rng.choice(names) for _ in range(n_signals // 10)],
+        'relevance_score': [rng.randint(20, 90) for _ in range(n_signals // 10)],
+        'crawled_at': [stamp() for _ in range(n_signals // 10)],
+    })
+    univ_bids = pd.DataFrame({
+        'school_name': [rng.choice(names) for _ in range(n_signals // 20)],
+        'crawled_at': [stamp() for _ in range(n_signals // 20)],
+    })
+    changes = n_schools // 5
+    status_history = pd.DataFrame({
+        'target_id': range(1, changes + 1), 'school_name': rng.sample(names, changes),
+        'old_status': '협의중', 'new_status': [rng.choice(['수주', '보류', '제안서발송']) for _ in range(changes)],
+        'changed_at': [stamp() for _ in range(changes)],
+    })
+    bids = pd.DataFrame(columns=['bid_title', 'demand_agency', 'successful_bidder', 'contract_date'])
+    return {'targets': targets, 'signals': signals, 'ntis': ntis, 'univ_bids': univ_bids,
+            'bids': bids, 'status_history': status_history}
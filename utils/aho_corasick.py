@@ -0,0 +1,132 @@
+"""
+Aho-Corasick 다중 패턴 매칭 오토마톤 (순수 파이썬, 외부 의존성 없음)
+
+■ 용도
+  - 수백 개 학교명/별칭, 키워드 목록을 텍스트 1회 스캔으로 모두 찾기
+  - any(k in text for k in KEYWORDS) 반복을 대체
+
+■ 사용법
+  ac = AhoCorasick()
+  ac.add('부산대학교', value)     # 패턴 추가 (언제든 추가 가능, 검색 시 자동 재빌드)
+  ac.build()                       # 여러 스레드가 공유할 인스턴스는 미리 빌드
+  for start, end, pattern, values in ac.iter_matches(text): ...
+
+■ 스레드 안전성
+  - 검색(iter_matches)은 여러 스레드에서 동시에 해도 안전 (지연 빌드는 잠금으로 1회만 실행)
+  - add()는 검색과 동시에 호출하면 안 됨 → 공유 인스턴스는 새로 만들어 build() 후 참조를 교체
+"""
+import threading
+from collections import deque
+
+
+class AhoCorasick:
+    """문자열 패턴 집합에 대한 Aho-Corasick 오토마톤."""
+
+    def __init__(self):
+        self._goto = [{}]      # 상태별 전이 {문자: 다음 상태}
+        self._fail = [0]       # 실패 링크
+        self._out = [[]]       # 상태에서 끝나는 패턴 목록 [(pattern, values)]
+        self._values = {}      # pattern → 값 목록
+        self._dirty = False
+        self._build_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, pattern: str) -> bool:
+        return pattern in self._values
+
+    def add(self, pattern: str, value=None) -> None:
+        """패턴을 추가합니다. 같은 패턴에 여러 값을 연결할 수 있습니다."""
+        if not pattern:
+            return
+        if pattern in self._values:
+            if value not in self._values[pattern]:
+                self._values[pattern].append(value)
+            return
+
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._values[pattern] = [value]
+        self._out[state].append(pattern)
+        self._dirty = True
+
+    def values(self, pattern: str) -> list:
+        """패턴에 연결된 값 목록을 반환합니다."""
+        return self._values.get(pattern, [])
+
+    def build(self) -> None:
+        """실패 링크를 미리 계산합니다 (패턴 추가 후 첫 검색 때 자동 실행되지만, 공유 전에 호출 권장)."""
+        if self._dirty:
+            with self._build_lock:
+                if self._dirty:
+                    self._build()
+
+    def _build(self) -> None:
+        """BFS로 실패 링크를 계산합니다 (build()의 잠금 안에서 호출)."""
+        queue = deque()
+        for nxt in self._goto[0].values():
+            self._fail[nxt] = 0
+            queue.append(nxt)
+
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(ch, 0)
+        self._dirty = False
+
+    def iter_matches(self, text: str):
+        """
+        텍스트 안의 모든 패턴 출현(겹침 포함)을 순서대로 반환합니다.
+        yield: (start, end, pattern, values)
+        """
+        self.build()
+
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+
+            s = state
+            while s:
+                for pattern in out[s]:
+                    yield i - len(pattern) + 1, i + 1, pattern, self._values[pattern]
+                s = fail[s]
+
+    def find_all(self, text: str) -> set:
+        """텍스트에 등장하는 패턴 집합을 반환합니다."""
+        return {m[2] for m in self.iter_matches(text)}
+
+    def find_longest(self, text: str, accept=None) -> list:
+        """
+        겹치지 않는 가장 긴 매칭(leftmost-longest)만 골라 반환합니다.
+        accept: (text, start, end, pattern) → bool 필터 (경계 검사 등)
+        반환값: [(start, end, pattern, values), ...]
+        """
+        candidates = []
+        for m in self.iter_matches(text):
+            if accept is None or accept(text, m[0], m[1], m[2]):
+                candidates.append(m)
+        candidates.sort(key=lambda m: (m[0], -(m[1] - m[0])))
+
+        result = []
+        last_end = 0
+        for m in candidates:
+            if m[0] >= last_end:
+                result.append(m)
+                last_end = m[1]
+        return result
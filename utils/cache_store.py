@@ -0,0 +1,307 @@
+"""
+SQLite 기반 디스크 캐시 저장소 (외부 API 응답 캐시 공용)
+
+■ 목적
+  - 외부 API(NEIS, 네이버, 나라장터 등) 응답을 디스크에 저장해 재호출을 줄임
+  - 영업 데이터 DB(sales_data.db)와 분리된 별도 파일(db/api_cache.db) 사용
+    → 캐시를 지워도 영업 데이터에는 영향 없음
+
+■ 구조
+  - cache_entries : (namespace, cache_key) → 값(text) + 메타(JSON) + 만료 시각
+  - cache_stats   : (namespace, source)별 적중/미적중/재검증 횟수
+
+■ 용량 관리
+  - 전체 크기가 CACHE_MAX_BYTES를 넘으면 마지막 사용 시각이 오래된 항목부터 삭제(LRU)
+  - 만료 항목은 바로 지우지 않고 조건부 재검증(ETag/Last-Modified)에 재사용
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_DB_PATH = os.path.join(BASE_DIR, 'db', 'api_cache.db')
+
+# 캐시 최대 용량 (기본 64MB, 환경변수 CACHE_MAX_MB로 조정)
+CACHE_MAX_BYTES = int(os.getenv('CACHE_MAX_MB', '64')) * 1024 * 1024
+
+# 용량 초과 시 이 비율까지 줄임 (매 저장마다 정리가 반복되지 않도록 여유 확보)
+_EVICT_TARGET_RATIO = 0.9
+
+_STAT_FIELDS = ('hits', 'misses', 'revalidated', 'stale', 'stores')
+
+
+class CacheStore:
+    """namespace별 키-값 캐시 (TTL + LRU 용량 제한)."""
+
+    def __init__(self, path: str = None, max_bytes: int = None):
+        self.path = path or CACHE_DB_PATH
+        self.max_bytes = max_bytes or CACHE_MAX_BYTES
+        self._ready = False
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._ready:
+            with self._lock:
+                if not self._ready:
+                    self._init_schema()
+                    self._ready = True
+        return sqlite3.connect(self.path, timeout=10)
+
+    def _init_schema(self) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                namespace TEXT NOT NULL,
+                cache_key TEXT NOT NULL,
+                source TEXT,
+                value TEXT,
+                meta TEXT,
+                size INTEGER DEFAULT 0,
+                stored_at REAL,
+                expires_at REAL,
+                last_access REAL,
+                PRIMARY KEY (namespace, cache_key)
+            )
+        ''')
+        conn.execute(
+            'CREATE INDEX IF NOT EXISTS idx_cache_last_access ON cache_entries(last_access)'
+        )
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS cache_stats (
+                namespace TEXT NOT NULL,
+                source TEXT NOT NULL,
+                hits INTEGER DEFAULT 0,
+                misses INTEGER DEFAULT 0,
+                revalidated INTEGER DEFAULT 0,
+                stale INTEGER DEFAULT 0,
+                stores INTEGER DEFAULT 0,
+                saved_tokens INTEGER DEFAULT 0,
+                saved_ms REAL DEFAULT 0,
+                updated_at TEXT,
+                PRIMARY KEY (namespace, source)
+            )
+        ''')
+        # 절감량 컬럼 추가 (이전 버전 캐시 파일 대비)
+        for column in ('saved_tokens INTEGER DEFAULT 0', 'saved_ms REAL DEFAULT 0'):
+            try:
+                conn.execute(f'ALTER TABLE cache_stats ADD COLUMN {column}')
+            except sqlite3.OperationalError:
+                pass  # 컬럼이 이미 존재하면 무시
+        conn.commit()
+        conn.close()
+
+    # ──────────────────────────────────────────────
+    # 조회 / 저장
+    # ──────────────────────────────────────────────
+
+    def get(self, namespace: str, key: str):
+        """
+        캐시 항목을 반환합니다 (만료 항목도 반환 — 재검증용).
+        반환값: {'value', 'meta', 'stored_at', 'expires_at', 'expired'} 또는 None
+        """
+        now = time.time()
+        conn = self._connect()
+        row = conn.execute(
+            'SELECT value, meta, stored_at, expires_at FROM cache_entries '
+            'WHERE namespace = ? AND cache_key = ?',
+            (namespace, key),
+        ).fetchone()
+        if row:
+            conn.execute(
+                'UPDATE cache_entries SET last_access = ? WHERE namespace = ? AND cache_key = ?',
+                (now, namespace, key),
+            )
+            conn.commit()
+        conn.close()
+
+        if not row:
+            return None
+        return {
+            'value': row[0],
+            'meta': json.loads(row[1]) if row[1] else {},
+            'stored_at': row[2],
+            'expires_at': row[3],
+            'expired': row[3] is not None and row[3] <= now,
+        }
+
+    def put(self, namespace: str, key: str, value: str, ttl: float,
+            meta: dict = None, source: str = None) -> None:
+        """항목을 저장(덮어쓰기)하고 용량을 초과하면 오래된 항목을 정리합니다."""
+        now = time.time()
+        meta_json = json.dumps(meta or {}, ensure_ascii=False)
+        size = len((value or '').encode('utf-8')) + len(meta_json.encode('utf-8'))
+
+        conn = self._connect()
+        conn.execute('''
+            INSERT INTO cache_entries
+                (namespace, cache_key, source, value, meta, size, stored_at, expires_at, last_access)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(namespace, cache_key) DO UPDATE SET
+                source = excluded.source, value = excluded.value, meta = excluded.meta, size = excluded.size,
+                stored_at = excluded.stored_at, expires_at = excluded.expires_at,
+                last_access = excluded.last_access
+        ''', (namespace, key, source or 'default', value, meta_json, size, now, now + ttl, now))
+        conn.commit()
+        self._evict(conn)
+        conn.close()
+
+    def touch(self, namespace: str, key: str, ttl: float) -> None:
+        """만료 시각을 연장합니다 (304 Not Modified 재검증 성공 시)."""
+        now = time.time()
+        conn = self._connect()
+        conn.execute(
+            'UPDATE cache_entries SET stored_at = ?, expires_at = ?, last_access = ? '
+            'WHERE namespace = ? AND cache_key = ?',
+            (now, now + ttl, now, namespace, key),
+        )
+        conn.commit()
+        conn.close()
+
+    def delete(self, namespace: str, key: str) -> None:
+        conn = self._connect()
+        conn.execute(
+            'DELETE FROM cache_entries WHERE namespace = ? AND cache_key = ?',
+            (namespace, key),
+        )
+        conn.commit()
+        conn.close()
+
+    def clear(self, namespace: str = None) -> int:
+        """캐시를 비웁니다 (namespace 지정 시 해당 영역만). 반환값: 삭제 건수"""
+        conn = self._connect()
+        if namespace:
+            cur = conn.execute('DELETE FROM cache_entries WHERE namespace = ?', (namespace,))
+        else:
+            cur = conn.execute('DELETE FROM cache_entries')
+        conn.commit()
+        deleted = cur.rowcount
+        conn.close()
+        return deleted
+
+    def purge_expired(self, namespace: str = None, grace_sec: float = 0) -> int:
+        """만료 후 grace_sec가 지난 항목을 삭제합니다. 반환값: 삭제 건수"""
+        cutoff = time.time() - grace_sec
+        conn = self._connect()
+        if namespace:
+            cur = conn.execute(
+                'DELETE FROM cache_entries WHERE namespace = ? AND expires_at <= ?',
+                (namespace, cutoff),
+            )
+        else:
+            cur = conn.execute('DELETE FROM cache_entries WHERE expires_at <= ?', (cutoff,))
+        conn.commit()
+        deleted = cur.rowcount
+        conn.close()
+        return deleted
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """전체 크기가 상한을 넘으면 마지막 사용이 오래된 항목부터 삭제합니다 (LRU)."""
+        total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM cache_entries').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        target = int(self.max_bytes * _EVICT_TARGET_RATIO)
+        victims = []
+        for namespace, key, size in conn.execute(
+            'SELECT namespace, cache_key, size FROM cache_entries ORDER BY last_access ASC'
+        ):
+            if total <= target:
+                break
+            victims.append((namespace, key))
+            total -= size or 0
+
+        conn.executemany(
+            'DELETE FROM cache_entries WHERE namespace = ? AND cache_key = ?', victims
+        )
+        conn.commit()
+
+    # ──────────────────────────────────────────────
+    # 통계
+    # ──────────────────────────────────────────────
+
+    def record(self, namespace: str, source: str, event: str,
+               saved_tokens: int = 0, saved_ms: float = 0) -> None:
+        """
+        적중/미적중 등 이벤트 1건을 (namespace, source) 통계에 누적합니다.
+        saved_tokens / saved_ms: 캐시 적중으로 아낀 토큰 수·응답 시간 (LLM 캐시용)
+        """
+        if event not in _STAT_FIELDS:
+            return
+        conn = self._connect()
+        conn.execute(f'''
+            INSERT INTO cache_stats (namespace, source, {event}, saved_tokens, saved_ms, updated_at)
+            VALUES (?, ?, 1, ?, ?, datetime('now', 'localtime'))
+            ON CONFLICT(namespace, source) DO UPDATE SET
+                {event} = {event} + 1,
+                saved_tokens = saved_tokens + excluded.saved_tokens,
+                saved_ms = saved_ms + excluded.saved_ms,
+                updated_at = excluded.updated_at
+        ''', (namespace, source or 'default', saved_tokens or 0, saved_ms or 0))
+        conn.commit()
+        conn.close()
+
+    def stats(self, namespace: str = None) -> list:
+        """
+        (namespace, source)별 캐시 통계를 반환합니다.
+        반환값: [{'namespace', 'source', 'hits', 'misses', 'revalidated', 'stale',
+                  'stores', 'requests', 'hit_ratio', 'saved_tokens', 'saved_ms',
+                  'entries', 'bytes'}, ...]
+        hit_ratio = (적중 + 재검증 + 오류 시 만료본 사용) / 전체 요청
+        """
+        conn = self._connect()
+        query = (
+            'SELECT namespace, source, hits, misses, revalidated, stale, stores, '
+            'saved_tokens, saved_ms FROM cache_stats'
+        )
+        params = ()
+        if namespace:
+            query += ' WHERE namespace = ?'
+            params = (namespace,)
+        rows = conn.execute(query + ' ORDER BY namespace, source', params).fetchall()
+        sizes = {
+            (ns, src): (cnt, size) for ns, src, cnt, size in conn.execute(
+                'SELECT namespace, source, COUNT(*), COALESCE(SUM(size), 0) '
+                'FROM cache_entries GROUP BY namespace, source'
+            )
+        }
+        conn.close()
+
+        result = []
+        for ns, source, hits, misses, revalidated, stale, stores, saved_tokens, saved_ms in rows:
+            served = hits + revalidated + stale
+            total = served + misses
+            entries, size = sizes.get((ns, source), (0, 0))
+            result.append({
+                'namespace': ns,
+                'source': source,
+                'hits': hits,
+                'misses': misses,
+                'revalidated': revalidated,
+                'stale': stale,
+                'stores': stores,
+                'requests': total,
+                'hit_ratio': round(served / total, 3) if total else 0.0,
+                'saved_tokens': saved_tokens or 0,
+                'saved_ms': round(saved_ms or 0, 1),
+                'entries': entries,
+                'bytes': size,
+            })
+        return result
+
+
+# 모듈 공용 저장소
+_default_store = None
+_default_lock = threading.Lock()
+
+
+def get_cache_store() -> CacheStore:
+    """공용 캐시 저장소(db/api_cache.db)를 반환합니다."""
+    global _default_store
+    with _default_lock:
+        if _default_store is None:
+            _default_store = CacheStore()
+        return _default_store
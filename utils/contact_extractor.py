@@ -0,0 +1,328 @@
+"""
+연락처 규칙 기반 사전 추출 (Gemini 호출 전 단계 — 교수 추출·담당자 추출 공용)
+
+■ 목적
+  - "홍길동 교수 / 이메일: hong@abc.ac.kr / 전화: 02-123-4567"처럼 형식이 뚜렷한 검색 결과까지
+    Gemini에 보내 이름·이메일·전화번호를 뽑던 비용 제거
+  - 정규식으로 먼저 추출하고, 신뢰도가 기준 이상이면 LLM 호출을 생략
+    기준 미달이면 애매한 문장(누구의 연락처인지 정하지 못한 줄과 그 앞 줄)만 Gemini에 전달
+
+■ 추출 규칙
+  - 이메일 : ac.kr / hs.kr 도메인 (그 외 도메인 이메일은 애매한 연락처로 분류)
+  - 전화   : 국내 지역번호·휴대폰·070 형식, +82 표기 포함 (팩스 번호 제외), 0XX-XXX-XXXX로 정규화
+  - 이름   : 성씨로 시작하는 한글 2~4자 + 교수·교사·부장·학과장 등 직함 (직함이 앞에 오는 표기 포함)
+             학과사무실·행정실 등이 있는 줄의 연락처는 '학과사무실' 항목
+  - 같은 줄에서는 이름 뒤에 나오는 연락처를 그 이름에 연결, 이름 없는 줄은 바로 앞 줄의 이름에 연결
+  - 대상 필터 : 항목의 줄에 다른 학과명이 있거나, 줄·출처 본문 어디에도 대상 학과명·분야 키워드
+               (FIELD_KEYWORDS — 기계·설계·CAD·산학협력 등)가 없으면 규칙 결과에서 빼고 LLM 판단에 넘김
+               (LLM 프롬프트의 대상 학과·직무 필터를 규칙 경로에서도 건너뛰지 않도록)
+
+■ 신뢰도
+  - 검색 결과에서 찾은 연락처(이메일·전화) 중 대상 학과·분야의 사람·사무실에 연결된 비율
+  - PREEXTRACT_MIN_CONFIDENCE(기본 0.8) 이상이고 추출 항목이 있으면 LLM 생략
+    (대상 필터에서 빠진 항목이 하나라도 있으면 기준 미만으로 낮춰 LLM 경로 실행)
+
+■ 측정
+  - get_preextract_stats() → 프로세스 누적 LLM 생략률(hit_rate)·부분 처리·추출 소요 시간·
+    생략으로 절감한 LLM 시간 추정치(같은 경로의 평균 LLM 응답 시간 × 생략 횟수)
+  - 환경변수 CONTACT_PREEXTRACT=0 이면 사전 추출하지 않음 (비교·문제 확인용)
+"""
+import os
+import re
+import threading
+import time
+
+from utils.evidence_condenser import EMAIL_RE, DEPARTMENT_KEYWORDS, split_sources
+
+ENABLED = os.getenv('CONTACT_PREEXTRACT', '1') != '0'
+
+MIN_CONFIDENCE = float(os.getenv('PREEXTRACT_MIN_CONFIDENCE', '0.8'))
+
+# 학교 도메인 이메일 (ac.kr 대학, hs.kr 고등학교)
+SCHOOL_EMAIL_RE = re.compile(r'[A-Za-z0-9._%+-]+@(?:[A-Za-z0-9-]+\.)*(?:ac|hs)\.kr\b', re.IGNORECASE)
+
+# 국내 전화번호 (지역번호 02·0XX, 070, 휴대폰 010, +82 표기)
+KR_PHONE_RE = re.compile(
+    r'(?<![\d-])(?:\+82[-.\s]?|0)(2|[3-6][1-5]|70|1[016789])[-.)\s]\s?(\d{3,4})[-.\s](\d{4})(?![\d-])'
+)
+_FAX_RE = re.compile(r'(?:팩스|FAX|Fax|fax)\s*[:：.)]?\s*$')
+
+# 주요 성씨 (이름 오탐 방지)
+_SURNAMES = set(
+    '김이박최정강조윤장임한오서신권황안송류유전홍고문양손배백허남심노하곽성차주우구민진나지엄채원천방공현함변염여추도소석선설마길연위표명기반왕금옥육인맹제모탁국어은편용예봉경'
+)
+_TITLES = r'(?:교수|부교수|조교수|명예교수|겸임교수|초빙교수|교사|교감|교장|학과장|학부장|부장|실장|팀장|주임|담당자?|장학사)'
+_NAME_AFTER_RE = re.compile(r'(?<![가-힣])([가-힣]{2,4})\s*' + _TITLES + r'(?:님)?')
+_NAME_BEFORE_RE = re.compile(_TITLES + r'\s*[:：]?\s*([가-힣]{2,4})(?![가-힣])')
+
+# 이름 자리에 오는 일반 명사 (직함 앞 수식어 등)
+_NOT_NAMES = {
+    '전임', '명예', '겸임', '초빙', '석좌', '조교', '부교', '정교', '담당', '지도', '전공', '학과', '학부',
+    '기계', '실습', '교무', '취업', '연구', '산학', '주임', '책임', '대학', '학교', '소속', '신임', '전체',
+    '소개', '현황', '명단', '정보', '안내', '채용', '임용', '이메일', '전화', '연락처', '성명', '이름', '직위',
+    '공고', '공학', '전자', '정보통신', '기술', '설계', '안전', '자동화', '교육', '진로', '방과후',
+}
+_NOT_NAME_ENDINGS = ('과', '부', '실', '팀', '학', '원', '교', '터', '소', '회', '처', '단')
+
+# 학과사무실 등 대표 연락처 문맥
+_OFFICE_RE = re.compile(r'학과\s*사무실|과\s*사무실|학부\s*사무실|행정실|교학팀|교무실|학과\s*대표')
+
+_DEPT_RE = re.compile(r'([가-힣A-Za-z]{2,20}(?:학과|학부|계열|전공|과|처|단))(?![가-힣])')
+
+# 대상 분야 키워드 (DEPARTMENT_KEYWORDS 중 학과·과목 같은 일반어를 뺀 분야명 + 산학협력 담당 문맥)
+_GENERIC_DEPT_TERMS = {'학과', '학부', '전공', '계열', '교육과정', '교과목', '과목', '실습', '이수', '커리큘럼'}
+FIELD_KEYWORDS = [k for k in DEPARTMENT_KEYWORDS if k not in _GENERIC_DEPT_TERMS] + [
+    'CAD', 'CAM', '산업공학', '디지털트윈', '산학협력', '사업단', 'LINC', 'RISE',
+]
+
+_stats_lock = threading.Lock()
+_stats = {'calls': 0, 'skipped': 0, 'partial': 0, 'llm': 0, 'records': 0,
+          'rule_ms': 0.0, 'llm_ms': 0.0, 'llm_timed': 0}
+
+
+def normalize_phone(match) -> str:
+    area, mid, last = match.group(1), match.group(2), match.group(3)
+    return f"0{area}-{mid}-{last}"
+
+
+def _is_name(token: str) -> bool:
+    return token[0] in _SURNAMES and token not in _NOT_NAMES and not token.endswith(_NOT_NAME_ENDINGS)
+
+
+def _find_names(line: str) -> list:
+    """줄 안의 (위치, 이름) 목록 (직함 뒤·앞 표기 모두)."""
+    found = {}
+    for regex in (_NAME_AFTER_RE, _NAME_BEFORE_RE):
+        for m in regex.finditer(line):
+            name = m.group(1)
+            if _is_name(name) and not any(abs(m.start() - pos) < 2 for pos in found):
+                found[m.start()] = name
+    return sorted(found.items())
+
+
+def _find_contacts(line: str) -> list:
+    """줄 안의 (위치, 종류, 값) 목록. 종류: email / phone / other_email (학교 도메인 외)."""
+    contacts = []
+    for m in EMAIL_RE.finditer(line):
+        kind = 'email' if SCHOOL_EMAIL_RE.fullmatch(m.group(0)) else 'other_email'
+        contacts.append((m.start(), kind, m.group(0).lower()))
+    for m in KR_PHONE_RE.finditer(line):
+        if _FAX_RE.search(line[:m.start()]):
+            continue
+        if any(start <= m.start() < start + len(value) for start, kind, value in contacts if 'email' in kind):
+            continue
+        contacts.append((m.start(), 'phone', normalize_phone(m)))
+    return sorted(contacts)
+
+
+def _target_terms(department: str) -> list:
+    """대상 판별 키워드: 분야 키워드 + 대상 학과명과 그 어간 (기계공학과 → 기계공학)."""
+    terms = list(FIELD_KEYWORDS)
+    if department:
+        terms.append(department)
+        stem = re.sub(r'(?:학과|학부|전공|계열|과)$', '', department)
+        if len(stem) >= 2:
+            terms.append(stem)
+    return [t.lower() for t in terms]
+
+
+def _mentions(text: str, terms: list) -> bool:
+    text = text.lower()
+    return any(t in text for t in terms)
+
+
+def pre_extract(content: str, department: str = '') -> dict:
+    """
+    검색 결과에서 이름·이메일·전화번호를 규칙으로 추출합니다.
+
+    파라미터:
+        content: "[출처: URL]\\n본문" 블록을 이어 붙인 검색 결과
+        department: 대상 학과 (항목 소속 기본값, 줄에 학과명이 있으면 그 학과명) — 없으면 분야 키워드로만 판별
+    반환값:
+        {"records": [{"name", "department", "email", "phone", "research_area", "source_url"}, ...],
+         "ambiguous": 연결하지 못한 연락처가 있는 줄(+앞 줄)과 대상 필터에서 빠진 항목의 줄을 출처별로 모은 텍스트,
+         "confidence": 연결된 연락처 비율 (0~1), "contacts_found", "contacts_assigned", "off_target": 빠진 항목 수}
+    """
+    records = {}        # 이름 → 항목
+    context = {}        # 이름 → {'lines': [줄, ...], 'body': 출처 본문, 'assigned': 연결 수}
+    ambiguous = []      # (출처 URL, [줄, ...])
+    found = assigned = 0
+
+    def upsert(name, line, url, body, kind, value):
+        rec = records.get(name)
+        if rec is None:
+            rec = records[name] = {
+                'name': name, 'department': '', 'email': '', 'phone': '',
+                'research_area': '', 'source_url': url,
+            }
+            context[name] = {'lines': [], 'body': body, 'assigned': 0}
+        if line not in context[name]['lines']:
+            context[name]['lines'].append(line)
+        if kind and not rec[kind]:
+            rec[kind] = value
+            context[name]['assigned'] += 1
+            return True
+        return kind is not None and rec[kind] == value
+
+    for url, body in split_sources(content or ''):
+        lines = [line.strip() for line in body.splitlines() if line.strip()]
+        block_ambiguous = []
+        prev_name = None
+        for i, line in enumerate(lines):
+            names = _find_names(line)
+            contacts = _find_contacts(line)
+            for _, name in names:
+                upsert(name, line, url, body, None, None)
+
+            unassigned = []
+            for pos, kind, value in contacts:
+                found += 1
+                if kind == 'other_email':
+                    unassigned.append(value)
+                    continue
+                owner = None
+                for name_pos, name in names:
+                    if name_pos <= pos:
+                        owner = name
+                if owner is None and _OFFICE_RE.search(line):
+                    owner = '학과사무실'
+                elif owner is None and names and len(names) == 1:
+                    owner = names[0][1]       # "hong@abc.ac.kr 홍길동 교수" 처럼 연락처가 앞에 온 경우
+                elif owner is None and not names and prev_name:
+                    owner = prev_name         # 이름 다음 줄에 연락처만 있는 경우
+                if owner and upsert(owner, line, url, body, kind, value):
+                    assigned += 1
+                else:
+                    unassigned.append(value)
+
+            if unassigned:
+                if i > 0 and lines[i - 1] not in block_ambiguous:
+                    block_ambiguous.append(lines[i - 1])
+                block_ambiguous.append(line)
+            if names:
+                prev_name = names[-1][1]
+            elif not contacts:
+                prev_name = None
+        if block_ambiguous:
+            ambiguous.append((url, block_ambiguous))
+
+    # 연락처가 하나도 없는 이름은 직함이 붙은 일반 문장일 수 있어 제외 (LLM 경로에서 처리)
+    # 대상 학과·분야가 아닌 항목은 규칙 결과에서 빼고 그 줄을 LLM 판단에 넘김
+    terms = _target_terms(department)
+    result_records = []
+    off_target = 0
+    for name, rec in records.items():
+        if not (rec['email'] or rec['phone']):
+            continue
+        ctx = context[name]
+        own = ' '.join(ctx['lines'])
+        line_dept = _DEPT_RE.search(own)
+        line_dept = line_dept.group(1) if line_dept else ''
+        if line_dept and not _mentions(line_dept, terms):
+            on_target = False       # 다른 학과 소속으로 적힌 사람
+        else:
+            on_target = _mentions(own, terms) or _mentions(ctx['body'], terms)
+        if on_target:
+            rec['department'] = line_dept or department
+            result_records.append(rec)
+            continue
+        off_target += 1
+        assigned -= ctx['assigned']
+        ambiguous.append((rec['source_url'], ctx['lines']))
+
+    confidence = round(assigned / found, 3) if found else 0.0
+    if off_target:
+        confidence = min(confidence, round(MIN_CONFIDENCE - 0.01, 3))
+    return {
+        'records': result_records,
+        'ambiguous': "\n\n".join(
+            (f"[출처: {url}]\n" if url else "") + "\n".join(lines) for url, lines in ambiguous
+        ),
+        'confidence': confidence,
+        'contacts_found': found,
+        'contacts_assigned': assigned,
+        'off_target': off_target,
+    }
+
+
+def _contact_keys(rec: dict) -> set:
+    keys = set()
+    if rec.get('email'):
+        keys.add(('email', rec['email'].strip().lower()))
+    if rec.get('phone'):
+        keys.add(('phone', re.sub(r'\D', '', rec['phone'])))
+    if rec.get('name') and rec.get('name') != '학과사무실':
+        keys.add(('name', rec['name'].strip()))
+    return keys
+
+
+def merge_contacts(primary: list, extra: list) -> list:
+    """규칙 추출 결과(primary)에 LLM 결과(extra)를 합칩니다 (이름·이메일·전화번호가 겹치면 빈 칸만 보충)."""
+    merged = [dict(r) for r in primary]
+    for rec in extra:
+        keys = _contact_keys(rec)
+        match = next((m for m in merged if keys & _contact_keys(m)), None)
+        if match is None:
+            merged.append(rec)
+            continue
+        for field, value in rec.items():
+            if value and not match.get(field):
+                match[field] = value
+    return merged
+
+
+def extract_with_fallback(content: str, llm_extract, department: str = '') -> list:
+    """
+    규칙 추출 → 신뢰도 기준 이상이면 그대로 반환, 아니면 LLM 호출 후 합칩니다.
+
+    llm_extract(text) → [항목, ...] : Gemini 추출 함수
+        규칙으로 찾은 항목이 있으면 애매한 줄만, 하나도 없으면 검색 결과 전체를 전달
+    """
+    if not ENABLED or not content:
+        return llm_extract(content) if content else []
+
+    started = time.perf_counter()
+    pre = pre_extract(content, department)
+    rule_ms = (time.perf_counter() - started) * 1000
+
+    if pre['records'] and pre['confidence'] >= MIN_CONFIDENCE:
+        _track(rule_ms, 'skipped', len(pre['records']))
+        return pre['records']
+
+    partial = bool(pre['records'] and pre['ambiguous'])
+    text = pre['ambiguous'] if partial else content
+    started = time.perf_counter()
+    extracted = llm_extract(text) if (text or not pre['records']) else []
+    llm_ms = (time.perf_counter() - started) * 1000
+
+    merged = merge_contacts(pre['records'], [r for r in extracted or [] if isinstance(r, dict)])
+    _track(rule_ms, 'partial' if partial else 'llm', len(merged), llm_ms)
+    return merged
+
+
+def _track(rule_ms: float, outcome: str, records: int, llm_ms: float = None) -> None:
+    with _stats_lock:
+        _stats['calls'] += 1
+        _stats[outcome] += 1
+        _stats['records'] += records
+        _stats['rule_ms'] += rule_ms
+        if llm_ms is not None and outcome == 'llm':
+            _stats['llm_ms'] += llm_ms
+            _stats['llm_timed'] += 1
+
+
+def get_preextract_stats() -> dict:
+    """
+    프로세스 시작 후 누적 사전 추출 통계.
+    {"calls", "skipped"(LLM 생략), "partial"(애매한 줄만 LLM), "llm"(전체 LLM),
+     "hit_rate"(생략 비율), "records", "rule_ms"(규칙 추출 누적), "avg_llm_ms", "saved_ms"(절감 추정)}
+    """
+    with _stats_lock:
+        stats = dict(_stats)
+    avg_llm_ms = stats.pop('llm_ms') / stats['llm_timed'] if stats['llm_timed'] else 0.0
+    stats.pop('llm_timed')
+    stats['hit_rate'] = round(stats['skipped'] / stats['calls'], 3) if stats['calls'] else 0.0
+    stats['avg_llm_ms'] = round(avg_llm_ms, 1)
+    stats['rule_ms'] = round(stats['rule_ms'], 1)
+    stats['saved_ms'] = round(max(0.0, stats['skipped'] * avg_llm_ms - stats['rule_ms']), 1)
+    return stats
@@ -97,6 +97,8 @@ def init_db() -> None:
             cursor.execute(col_def)
         except Exception:
             pass
+    # 학교별 연락처 유무 조회 (일괄 교수 발굴 대상 선정)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_contacts_school_name ON contacts(school_name)")
 
     # 5. bid_history 낙찰결과 컬럼 추가 (마이그레이션)
     for col_def in [
@@ -191,9 +193,29 @@ def init_db() -> None:
             source_url TEXT,
             detected_at TEXT,
             is_acted INTEGER DEFAULT 0,
-            action_memo TEXT
+            action_memo TEXT,
+            signal_key TEXT,
+            last_seen TEXT
         )
     ''')
+    # 자연키(학교, 신호 유형, 출처 URL 또는 내용 해시) 컬럼 추가 (마이그레이션)
+    for col_def in [
+        "ALTER TABLE purchase_signals ADD COLUMN signal_key TEXT",
+        "ALTER TABLE purchase_signals ADD COLUMN last_seen TEXT",
+    ]:
+        try:
+            cursor.execute(col_def)
+        except Exception:
+            pass
+    # 자연키 유니크 인덱스는 16. (중복 압축 마이그레이션 후 생성)
+    # 학교별 점수 집계 (get_school_score_aggregates) 인덱스
+    for index_sql in [
+        "CREATE INDEX IF NOT EXISTS idx_purchase_signals_school ON purchase_signals(school_name, signal_score)",
+        "CREATE INDEX IF NOT EXISTS idx_ntis_projects_agency ON ntis_projects(lead_agency, relevance_score)",
+        "CREATE INDEX IF NOT EXISTS idx_univ_bids_school ON univ_bids(school_name)",
+        "CREATE INDEX IF NOT EXISTS idx_target_schools_name ON target_schools(school_name, priority_score)",
+    ]:
+        cursor.execute(index_sql)
 
     # 11. target_schools에 CAD 학과 관련 컬럼 추가 (마이그레이션)
     for col_def in [
@@ -205,6 +227,188 @@ def init_db() -> None:
         except Exception:
             pass
 
+    # 12. univ_bid_sweep_state (산학협력단 입찰 스윕 — 학교별 마지막 검색 시각)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS univ_bid_sweep_state (
+            school_name TEXT PRIMARY KEY,
+            last_checked_at TEXT,
+            last_hit_count INTEGER DEFAULT 0
+        )
+    ''')
+
+    # 13. scan_jobs / scan_tasks (재개 가능한 CAD 스캔 작업 — 학교별 단계·중간 산출물)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS scan_jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            job_type TEXT DEFAULT 'cad_scan',
+            status TEXT DEFAULT 'running',
+            collect_professors INTEGER DEFAULT 1,
+            total INTEGER DEFAULT 0,
+            created_at TEXT,
+            updated_at TEXT,
+            finished_at TEXT
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS scan_tasks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            job_id INTEGER NOT NULL,
+            school_name TEXT NOT NULL,
+            school_type TEXT,
+            stage TEXT DEFAULT 'pending',
+            status TEXT DEFAULT 'queued',
+            claimed_by TEXT,
+            claimed_at TEXT,
+            attempts INTEGER DEFAULT 0,
+            search_content TEXT,
+            classification TEXT,
+            dept_artifacts TEXT DEFAULT '{}',
+            professors_count INTEGER DEFAULT 0,
+            error TEXT,
+            updated_at TEXT,
+            UNIQUE(job_id, school_name)
+        )
+    ''')
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_scan_tasks_job_status ON scan_tasks(job_id, status)"
+    )
+
+    # 14. llm_call_metrics (Gemini 실제 호출별 지연 시간·토큰·오류 — utils/llm_client)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS llm_call_metrics (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            called_at TEXT,
+            source TEXT,
+            model TEXT,
+            status TEXT,
+            http_status INTEGER,
+            attempts INTEGER DEFAULT 1,
+            latency_ms REAL DEFAULT 0,
+            wait_ms REAL DEFAULT 0,
+            first_chunk_ms REAL,
+            prompt_tokens INTEGER DEFAULT 0,
+            output_tokens INTEGER DEFAULT 0,
+            total_tokens INTEGER DEFAULT 0,
+            error TEXT
+        )
+    ''')
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_llm_call_metrics_called_at ON llm_call_metrics(called_at)"
+    )
+    # 스트리밍 첫 조각 도착 시간 컬럼 추가 (마이그레이션)
+    try:
+        cursor.execute("ALTER TABLE llm_call_metrics ADD COLUMN first_chunk_ms REAL")
+    except Exception:
+        pass
+
+    # 15. school_scores (학교별 구매 점수 — 입력이 바뀐 학교만 재계산, purchase_signal_engine)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS school_scores (
+            school_name TEXT PRIMARY KEY,
+            program_name TEXT,
+            target_id INTEGER,
+            base_score INTEGER DEFAULT 0,
+            signal_bonus INTEGER DEFAULT 0,
+            budget_bonus INTEGER DEFAULT 0,
+            budget_month INTEGER,
+            status_bonus INTEGER DEFAULT 0,
+            total_score INTEGER DEFAULT 0,
+            tier TEXT,
+            sales_status TEXT,
+            signals_json TEXT,
+            updated_at TEXT
+        )
+    ''')
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_school_scores_rank "
+        "ON school_scores(total_score DESC, base_score DESC, target_id DESC)"
+    )
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS school_score_dirty (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            school_name TEXT NOT NULL,
+            marked_at TEXT
+        )
+    ''')
+
+    # 16. purchase_signals 자연키 — 유니크 인덱스가 없으면 (최초 1회) 키를 채우고 같은 키의 중복 신호를 1행으로 압축
+    #     (압축된 학교는 school_score_dirty에 기록되므로 점수 테이블 생성 이후에 실행)
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'uq_purchase_signals_key'")
+    if cursor.fetchone() is None:
+        _compact_purchase_signals(cursor)
+    cursor.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_purchase_signals_key "
+        "ON purchase_signals(school_name, signal_type, signal_key)"
+    )
+
+    # 17. sales_status_history (영업 상태 변경 이력 — 시점별 점수 재현·백테스트용)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS sales_status_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            target_id INTEGER,
+            school_name TEXT NOT NULL,
+            old_status TEXT,
+            new_status TEXT,
+            changed_at TEXT
+        )
+    ''')
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_sales_status_history_school "
+        "ON sales_status_history(school_name, changed_at)"
+    )
+
+    # 18. school_score_snapshots (일별 점수 스냅샷 — 전날과 달라진 학교만 1행, 시점별 점수·추세 조회용)
+    #     tier: 등급 순위 (1 = 최상위 등급), 0 = 그날 점수 테이블에서 빠진 학교
+    #     키는 school_scores와 같은 학교명 (대표 사업 행 target_id가 바뀌어도 이력 유지)
+    cursor.execute("PRAGMA table_info(school_score_snapshots)")
+    snapshot_columns = {r[1] for r in cursor.fetchall()}
+    if snapshot_columns and 'school_name' not in snapshot_columns:
+        # target_id 키로 만들어진 기존 스냅샷 → 학교명 키로 옮김
+        cursor.execute("ALTER TABLE school_score_snapshots RENAME TO school_score_snapshots_by_target")
+        cursor.execute("DROP INDEX IF EXISTS idx_school_score_snapshots_date")
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS school_score_snapshots (
+            school_name TEXT NOT NULL,
+            snapshot_date TEXT NOT NULL,
+            base_score INTEGER NOT NULL,
+            signal_bonus INTEGER NOT NULL,
+            budget_bonus INTEGER NOT NULL,
+            status_bonus INTEGER NOT NULL,
+            total_score INTEGER NOT NULL,
+            tier INTEGER NOT NULL,
+            PRIMARY KEY (school_name, snapshot_date)
+        ) WITHOUT ROWID
+    ''')
+    if snapshot_columns and 'school_name' not in snapshot_columns:
+        cursor.execute('''
+            INSERT OR REPLACE INTO school_score_snapshots
+            SELECT t.school_name, o.snapshot_date, o.base_score, o.signal_bonus, o.budget_bonus,
+                   o.status_bonus, o.total_score, o.tier
+            FROM school_score_snapshots_by_target o
+            JOIN target_schools t ON t.id = o.target_id
+            ORDER BY o.snapshot_date
+        ''')
+        cursor.execute("DROP TABLE school_score_snapshots_by_target")
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_school_score_snapshots_date "
+        "ON school_score_snapshots(snapshot_date)"
+    )
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS school_score_snapshot_days (
+            snapshot_date TEXT PRIMARY KEY,
+            school_count INTEGER,
+            changed_count INTEGER,
+            created_at TEXT
+        )
+    ''')
+
+    # 19. 학교 360° 프로필 (get_school_profile_rows) — 학교명 컬럼 인덱스가 없던 테이블
+    for index_sql in [
+        "CREATE INDEX IF NOT EXISTS idx_bid_history_agency ON bid_history(demand_agency)",
+        "CREATE INDEX IF NOT EXISTS idx_grants_selected_school ON grants(selected_school)",
+    ]:
+        cursor.execute(index_sql)
+
     conn.commit()
     conn.close()
 
@@ -213,26 +417,32 @@ def insert_bids(bids: list) -> int:
     수집된 공고 리스트를 bid_history 테이블에 삽입합니다.
     새로 삽입된 레코드 수를 반환합니다.
     """
+    derive = _signal_deriver('bid_history')
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
     count = 0
+    seen = []   # 구매 신호 규칙 평가 대상 (이미 저장된 공고도 포함 → 기존 신호 last_seen 갱신)
     for bid in bids:
+        bid_type = bid.get('bid_type') or '입찰공고'
+        seen.append({**bid, 'bid_type': bid_type})
         # 중복 방지를 위한 단순 방어 로직 (공고명과 기관명이 같으면 생략)
         cursor.execute("SELECT id FROM bid_history WHERE bid_title = ? AND demand_agency = ?", 
                        (bid.get('bid_title', ''), bid.get('demand_agency', '')))
         if cursor.fetchone() is None:
             cursor.execute('''
-                INSERT INTO bid_history (bid_title, demand_agency, successful_bidder, bid_price, introduced_items, contract_date)
-                VALUES (?, ?, ?, ?, ?, ?)
+                INSERT INTO bid_history (bid_title, demand_agency, successful_bidder, bid_price, introduced_items, contract_date, bid_type)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
             ''', (
                 bid.get('bid_title', ''),
                 bid.get('demand_agency', ''),
                 bid.get('successful_bidder', ''),
                 bid.get('bid_price', ''),
                 bid.get('introduced_items', ''),
-                bid.get('contract_date', '')
+                bid.get('contract_date', ''),
+                bid_type
             ))
             count += 1
+    _derive_signals(cursor, derive, seen)
     conn.commit()
     conn.close()
     return count
@@ -296,10 +506,13 @@ def insert_grants(grants_data: list) -> int:
     """
     수집된 국고 지원 사업 리스트를 grants 테이블에 삽입합니다. 중복은 제외합니다.
     """
+    derive = _signal_deriver('grants')
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
     count = 0
+    seen = []   # 구매 신호 규칙 평가 대상 (이미 저장된 사업도 포함 → 기존 신호 last_seen 갱신)
     for g in grants_data:
+        seen.append(g)
         # 뉴스/공고명이 동일하면 건너뜀 (단순 중복 방지)
         cursor.execute("SELECT id FROM grants WHERE notice_url = ? OR project_name = ?", 
                        (g.get('notice_url', ''), g.get('project_name', '')))
@@ -317,6 +530,7 @@ def insert_grants(grants_data: list) -> int:
                 g.get('crawled_at', '')
             ))
             count += 1
+    _derive_signals(cursor, derive, seen)
     conn.commit()
     conn.close()
     return count
@@ -473,7 +687,7 @@ def fetch_bid_result(bid_title: str) -> dict:
     낙찰결과 API를 호출하여 낙찰업체 및 낙찰금액을 조회합니다.
     공공데이터포털 계약정보 API 사용.
     """
-    import requests
+    from utils.http_cache import cached_get, is_data_go_kr_success
     api_key = os.getenv("KONEPS_API_KEY", "")
     if not api_key:
         return {}
@@ -487,7 +701,8 @@ def fetch_bid_result(bid_title: str) -> dict:
         "bidNtceNm": bid_title[:20] if bid_title else "",
     }
     try:
-        res = requests.get(url, params=params, timeout=10)
+        res = cached_get(url, params=params, source='koneps', timeout=10,
+                         cacheable=is_data_go_kr_success)
         if res.status_code == 200:
             data = res.json()
             items = data.get('response', {}).get('body', {}).get('items', [])
@@ -514,6 +729,7 @@ def insert_target_schools(schools_data: list) -> int:
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
     count = 0
+    touched = set()     # 점수 재계산 대상 학교명
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     for s in schools_data:
@@ -537,9 +753,11 @@ def insert_target_schools(schools_data: list) -> int:
             )
             if cursor.rowcount > 0:
                 count += 1
+                touched.add(s.get('school_name', ''))
         except Exception:
             continue
 
+    _mark_scores_dirty(cursor, touched)
     conn.commit()
     conn.close()
     return count
@@ -559,6 +777,34 @@ def get_all_target_schools() -> pd.DataFrame:
         return pd.DataFrame()
 
 
+def get_target_school_keys() -> list:
+    """학교명별 대표 ID(최소 id) 목록을 반환합니다. [(school_id, school_name), ...]"""
+    try:
+        conn = sqlite3.connect(DB_PATH)
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT MIN(id), school_name FROM target_schools GROUP BY school_name"
+        )
+        rows = cursor.fetchall()
+        conn.close()
+        return rows
+    except Exception:
+        return []
+
+
+def get_target_schools_fingerprint() -> tuple:
+    """target_schools 변경 감지용 지문 (행 수, 최대 id, 최종 수정 시각)."""
+    try:
+        conn = sqlite3.connect(DB_PATH)
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*), MAX(id), MAX(updated_at) FROM target_schools")
+        row = cursor.fetchone()
+        conn.close()
+        return tuple(row)
+    except Exception:
+        return (0, None, None)
+
+
 def get_target_schools_summary() -> pd.DataFrame:
     """사업별 선정교 통계."""
     try:
@@ -578,15 +824,25 @@ def get_target_schools_summary() -> pd.DataFrame:
 
 
 def update_target_school_status(school_id: int, status: str, memo: str) -> bool:
-    """타겟 학교의 영업 상태를 업데이트."""
+    """타겟 학교의 영업 상태를 업데이트 (상태가 바뀌면 sales_status_history에 기록)."""
     from datetime import datetime
     try:
         conn = sqlite3.connect(DB_PATH)
         cursor = conn.cursor()
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        cursor.execute("SELECT school_name, sales_status FROM target_schools WHERE id = ?", (school_id,))
+        row = cursor.fetchone()
         cursor.execute(
             "UPDATE target_schools SET sales_status=?, memo=?, updated_at=? WHERE id=?",
-            (status, memo, datetime.now().strftime("%Y-%m-%d %H:%M:%S"), school_id)
+            (status, memo, now, school_id)
         )
+        if row and row[1] != status:
+            cursor.execute(
+                "INSERT INTO sales_status_history (target_id, school_name, old_status, new_status, changed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (school_id, row[0], row[1], status, now)
+            )
+        _mark_scores_dirty(cursor, [row[0]] if row else [])
         conn.commit()
         conn.close()
         return True
@@ -613,6 +869,8 @@ def insert_target_school_manual(school_name: str, school_type: str, region: str,
              annual_budget, program_period, priority_score, now, now)
         )
         inserted = cursor.rowcount > 0
+        if inserted:
+            _mark_scores_dirty(cursor, [school_name])
         conn.commit()
         conn.close()
         return inserted
@@ -625,6 +883,8 @@ def delete_target_school(school_id: int) -> bool:
     try:
         conn = sqlite3.connect(DB_PATH)
         cursor = conn.cursor()
+        cursor.execute("SELECT school_name FROM target_schools WHERE id = ?", (school_id,))
+        _mark_scores_dirty(cursor, [r[0] for r in cursor.fetchall()])
         cursor.execute("DELETE FROM target_schools WHERE id = ?", (school_id,))
         conn.commit()
         conn.close()
@@ -736,11 +996,14 @@ def get_competitor_analysis() -> dict:
 # ──────────────────────────────────────────────
 
 def insert_ntis_projects(projects: list) -> int:
-    """NTIS 연구과제 목록을 DB에 삽입합니다."""
+    """NTIS 연구과제 목록을 DB에 삽입합니다 (이미 있던 과제 포함 전체를 구매 신호 규칙으로 평가)."""
     from datetime import datetime
+    derive = _signal_deriver('ntis_projects')
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
     count = 0
+    seen = []           # 구매 신호 규칙 평가 대상 (다시 수집된 행 → 기존 신호 last_seen 갱신)
+    touched = set()     # 점수 재계산 대상 학교명
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     for p in projects:
         try:
@@ -756,10 +1019,14 @@ def insert_ntis_projects(projects: list) -> int:
                  p.get('project_period', ''), p.get('keywords', ''),
                  p.get('relevance_score', 0), p.get('source_url', ''), now)
             )
+            seen.append(p)
             if cursor.rowcount > 0:
                 count += 1
+                touched.add(p.get('lead_agency', ''))
         except Exception:
             continue
+    _derive_signals(cursor, derive, seen)
+    _mark_scores_dirty(cursor, touched)
     conn.commit()
     conn.close()
     return count
@@ -783,11 +1050,14 @@ def get_all_ntis_projects() -> pd.DataFrame:
 # ──────────────────────────────────────────────
 
 def insert_univ_bids(bids: list) -> int:
-    """대학 자체 입찰 공고를 DB에 삽입합니다."""
+    """대학 자체 입찰 공고를 DB에 삽입합니다 (이미 있던 공고 포함 전체를 구매 신호 규칙으로 평가)."""
     from datetime import datetime
+    derive = _signal_deriver('univ_bids')
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
     count = 0
+    seen = []           # 구매 신호 규칙 평가 대상 (다시 수집된 행 → 기존 신호 last_seen 갱신)
+    touched = set()     # 점수 재계산 대상 학교명
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     for b in bids:
         try:
@@ -801,15 +1071,48 @@ def insert_univ_bids(bids: list) -> int:
                  b.get('deadline', ''), b.get('budget', ''),
                  b.get('bid_type', ''), b.get('is_relevant', 0), now)
             )
+            seen.append(b)
             if cursor.rowcount > 0:
                 count += 1
+                touched.add(b.get('school_name', ''))
         except Exception:
             continue
+    _derive_signals(cursor, derive, seen)
+    _mark_scores_dirty(cursor, touched)
     conn.commit()
     conn.close()
     return count
 
 
+def get_univ_bid_sweep_state() -> dict:
+    """학교별 마지막 입찰 스윕 시각을 반환합니다. {school_name: last_checked_at}"""
+    try:
+        conn = sqlite3.connect(DB_PATH)
+        cursor = conn.cursor()
+        cursor.execute("SELECT school_name, last_checked_at FROM univ_bid_sweep_state")
+        rows = cursor.fetchall()
+        conn.close()
+        return {r[0]: r[1] for r in rows}
+    except Exception:
+        return {}
+
+
+def update_univ_bid_sweep_state(hit_counts: dict) -> None:
+    """스윕한 학교들의 마지막 검색 시각과 감지 건수를 기록합니다. {school_name: hit_count}"""
+    from datetime import datetime
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    conn = sqlite3.connect(DB_PATH)
+    conn.executemany(
+        "INSERT INTO univ_bid_sweep_state (school_name, last_checked_at, last_hit_count) "
+        "VALUES (?, ?, ?) "
+        "ON CONFLICT(school_name) DO UPDATE SET "
+        "last_checked_at = excluded.last_checked_at, last_hit_count = excluded.last_hit_count",
+        [(name, now, cnt) for name, cnt in hit_counts.items()]
+    )
+    conn.commit()
+    conn.close()
+
+
 def get_all_univ_bids() -> pd.DataFrame:
     """대학 자체 입찰 공고 전체 조회."""
     try:
@@ -827,25 +1130,158 @@ def get_all_univ_bids() -> pd.DataFrame:
 # 구매 신호 통합
 # ──────────────────────────────────────────────
 
+def purchase_signal_key(source_url: str, signal_title: str, signal_detail: str = '') -> str:
+    """구매 신호 자연키의 출처 부분: 출처 URL, 없으면 제목·상세 내용 해시 ('sha1:...')."""
+    import hashlib
+    if source_url and source_url.strip():
+        return source_url.strip()
+    content = ' '.join(f"{signal_title or ''} {signal_detail or ''}".split())
+    return 'sha1:' + hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
+def _compact_purchase_signals(cursor) -> int:
+    """
+    purchase_signals 자연키 마이그레이션 (init_db에서 유니크 인덱스 생성 전 1회 실행).
+    signal_key가 없는 행에 키를 채우고, 같은 (학교, 유형, 키)의 중복 행을 가장 먼저 수집된 행 1개로 합칩니다
+    (최초 감지 시각·마지막 감지 시각·최고 점수·조치 여부·메모 보존).
+    반환값: 삭제된 중복 행 수
+    """
+    cursor.execute(
+        "SELECT id, source_url, signal_title, signal_detail FROM purchase_signals WHERE signal_key IS NULL"
+    )
+    cursor.executemany(
+        "UPDATE purchase_signals SET signal_key = ? WHERE id = ?",
+        [(purchase_signal_key(url, title, detail), row_id) for row_id, url, title, detail in cursor.fetchall()]
+    )
+    cursor.execute('''
+        CREATE TEMP TABLE signal_groups AS
+        SELECT MIN(id) AS keep_id, MIN(detected_at) AS first_seen,
+               MAX(COALESCE(last_seen, detected_at)) AS last_seen, MAX(signal_score) AS max_score,
+               MAX(is_acted) AS acted, MAX(action_memo) AS memo
+        FROM purchase_signals
+        GROUP BY school_name, signal_type, signal_key
+        HAVING COUNT(*) > 1
+    ''')
+    cursor.execute('''
+        UPDATE purchase_signals SET
+            detected_at = (SELECT first_seen FROM signal_groups WHERE keep_id = purchase_signals.id),
+            last_seen = (SELECT last_seen FROM signal_groups WHERE keep_id = purchase_signals.id),
+            signal_score = (SELECT max_score FROM signal_groups WHERE keep_id = purchase_signals.id),
+            is_acted = (SELECT acted FROM signal_groups WHERE keep_id = purchase_signals.id),
+            action_memo = COALESCE(action_memo, (SELECT memo FROM signal_groups WHERE keep_id = purchase_signals.id))
+        WHERE id IN (SELECT keep_id FROM signal_groups)
+    ''')
+    cursor.execute('''
+        SELECT DISTINCT school_name FROM purchase_signals WHERE id IN (SELECT keep_id FROM signal_groups)
+    ''')
+    touched = [row[0] for row in cursor.fetchall()]
+    cursor.execute('''
+        DELETE FROM purchase_signals
+        WHERE id NOT IN (SELECT MIN(id) FROM purchase_signals GROUP BY school_name, signal_type, signal_key)
+    ''')
+    deleted = cursor.rowcount
+    cursor.execute("DROP TABLE signal_groups")
+    _mark_scores_dirty(cursor, touched)
+    return deleted
+
+
+def _upsert_purchase_signals(cursor, signals: list) -> dict:
+    """구매 신호 upsert (호출 측 트랜잭션 안에서 실행, 새 신호의 학교는 점수 재계산 대상으로 기록)."""
+    from datetime import datetime
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    result = {'inserted': 0, 'updated': 0}
+    touched = set()     # 점수 재계산 대상 학교명
+    for sig in signals:
+        school_name, signal_type = sig.get('school_name', ''), sig.get('signal_type', '')
+        key = purchase_signal_key(sig.get('source_url', ''), sig.get('signal_title', ''), sig.get('signal_detail', ''))
+        try:
+            cursor.execute(
+                "INSERT OR IGNORE INTO purchase_signals "
+                "(school_name, signal_type, signal_title, signal_detail, "
+                " signal_score, source, source_url, detected_at, signal_key, last_seen) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (school_name, signal_type, sig.get('signal_title', ''), sig.get('signal_detail', ''),
+                 sig.get('signal_score', 0), sig.get('source', ''), sig.get('source_url', ''),
+                 sig.get('detected_at') or now, key, now)
+            )
+            if cursor.rowcount > 0:
+                result['inserted'] += 1
+                touched.add(school_name)
+                continue
+            cursor.execute(
+                "UPDATE purchase_signals SET last_seen = ? "
+                "WHERE school_name = ? AND signal_type = ? AND signal_key = ?",
+                (now, school_name, signal_type, key)
+            )
+            result['updated'] += cursor.rowcount
+        except Exception:
+            continue
+    _mark_scores_dirty(cursor, touched)
+    return result
+
+
+def insert_purchase_signals(signals: list) -> dict:
+    """
+    구매 신호 여러 건을 한 트랜잭션으로 저장합니다.
+    자연키 (school_name, signal_type, source_url 또는 내용 해시)가 이미 있으면 새 행을 만들지 않고
+    last_seen만 갱신합니다 (최초 감지 시각 detected_at·점수·조치 여부는 유지).
+    signals: [{'school_name', 'signal_type', 'signal_title', 'signal_detail', 'signal_score',
+               'source', 'source_url', 'detected_at'(선택, 없으면 저장 시각)}, ...]
+    반환값: {"inserted": 새 신호 수, "updated": 이미 있던 신호 수}
+    """
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    result = _upsert_purchase_signals(cursor, signals)
+    conn.commit()
+    conn.close()
+    return result
+
+
+# 수집 데이터 → 구매 신호 (utils.signal_rules 규칙을 저장 트랜잭션 안에서 평가)
+def _signal_deriver(source: str):
+    """출처 테이블의 신호 규칙 평가 함수 (규칙이 없거나 엔진을 불러오지 못하면 None) — 연결을 열기 전에 호출."""
+    try:
+        from utils.signal_rules import get_signal_deriver
+        return get_signal_deriver(source)
+    except Exception as e:
+        print(f"[신호 규칙] {source} 규칙 로드 실패: {e}")
+        return None
+
+
+def _derive_signals(cursor, derive, rows: list) -> dict:
+    """
+    수집된 행을 규칙으로 평가해 같은 트랜잭션에서 구매 신호로 upsert합니다.
+    이미 저장돼 있던 행(재수집)도 넘겨야 기존 신호의 last_seen이 갱신됩니다.
+    """
+    if derive is None or not rows:
+        return {'inserted': 0, 'updated': 0}
+    try:
+        return _upsert_purchase_signals(cursor, derive(rows))
+    except Exception as e:
+        print(f"[신호 규칙] 평가 오류: {e}")
+        return {'inserted': 0, 'updated': 0}
+
+
+def derive_signals_in_transaction(cursor, source: str, rows: list, derive=None) -> dict:
+    """
+    db_manager 밖에서 직접 저장하는 출처(edu_policy_news 등)용: 호출 측 트랜잭션 안에서 수집 행을 신호로 변환·저장
+    (이미 저장돼 있던 행도 넘기면 기존 신호의 last_seen 갱신).
+    derive: 트랜잭션 전에 get_signal_deriver(source)로 받아 둔 함수 (없으면 여기서 가져옴)
+    반환값: {"inserted", "updated"}
+    """
+    return _derive_signals(cursor, derive or _signal_deriver(source), rows)
+
+
 def insert_purchase_signal(school_name: str, signal_type: str, signal_title: str,
                            signal_detail: str, signal_score: int,
                            source: str, source_url: str) -> bool:
-    """구매 신호 1건을 추가합니다."""
-    from datetime import datetime
+    """구매 신호 1건을 저장합니다 (이미 있는 신호면 last_seen만 갱신, insert_purchase_signals 참고)."""
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute(
-            "INSERT INTO purchase_signals "
-            "(school_name, signal_type, signal_title, signal_detail, "
-            " signal_score, source, source_url, detected_at) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-            (school_name, signal_type, signal_title, signal_detail,
-             signal_score, source, source_url,
-             datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-        )
-        conn.commit()
-        conn.close()
+        insert_purchase_signals([{
+            'school_name': school_name, 'signal_type': signal_type, 'signal_title': signal_title,
+            'signal_detail': signal_detail, 'signal_score': signal_score,
+            'source': source, 'source_url': source_url,
+        }])
         return True
     except Exception:
         return False
@@ -868,6 +1304,625 @@ def get_purchase_signals(min_score: int = 0, limit: int = 50) -> pd.DataFrame:
         return pd.DataFrame()
 
 
+def get_purchase_signal_summary(top_n: int = 5) -> dict:
+    """
+    구매 신호 요약 통계 (전체 이력 SQL 집계, 행을 가져오지 않음).
+    반환값: {"total", "unacted", "by_type": {유형: 건수}, "by_school_top5": [{"school", "count", "max_score"}, ...]}
+            by_school_top5는 미조치 신호의 학교별 최고 점수 상위 top_n개
+    """
+    empty = {'total': 0, 'unacted': 0, 'by_type': {}, 'by_school_top5': []}
+    try:
+        conn = sqlite3.connect(DB_PATH)
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT COUNT(*), COALESCE(SUM(is_acted = 0), 0) FROM purchase_signals WHERE signal_score >= 0"
+        )
+        total, unacted = cursor.fetchone()
+        cursor.execute(
+            "SELECT signal_type, COUNT(*) FROM purchase_signals WHERE signal_score >= 0 "
+            "GROUP BY signal_type ORDER BY COUNT(*) DESC"
+        )
+        by_type = dict(cursor.fetchall())
+        cursor.execute(
+            "SELECT school_name, COUNT(*), MAX(signal_score) FROM purchase_signals "
+            "WHERE signal_score >= 0 AND is_acted = 0 "
+            "GROUP BY school_name ORDER BY MAX(signal_score) DESC, school_name LIMIT ?",
+            (top_n,)
+        )
+        by_school = [
+            {'school': name, 'count': count, 'max_score': max_score}
+            for name, count, max_score in cursor.fetchall()
+        ]
+        conn.close()
+    except Exception:
+        return empty
+    return {'total': total, 'unacted': unacted, 'by_type': by_type, 'by_school_top5': by_school}
+
+
+# 학교별 집계 (구매 점수 산정용) — 출처 테이블별 GROUP BY 결과만 가져옴
+def _decay_weight(age_days, half_life_days):
+    """지수 감쇠 가중치 0.5^(경과일/반감기) — SQLite 사용자 함수 decay_weight."""
+    if age_days is None or not half_life_days:
+        return 1.0
+    return 0.5 ** (max(age_days, 0.0) / half_life_days)
+
+
+def _sql_text(value: str) -> str:
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _decayed_score_sql(half_lives: dict = None, default_half_life: float = None, as_of: str = None) -> str:
+    """
+    신호 1건의 감쇠 점수 SQL 식: signal_score × 0.5^(detected_at부터 as_of까지 경과일 / 신호 유형별 반감기)
+    half_lives가 없으면 감쇠 없이 signal_score (detected_at이 없는 과거 행은 감쇠하지 않음)
+    """
+    if not half_lives and not default_half_life:
+        return "signal_score"
+    as_of_sql = f"julianday({_sql_text(as_of)})" if as_of else "julianday('now', 'localtime')"
+    cases = " ".join(
+        f"WHEN {_sql_text(sig_type)} THEN {float(days)}" for sig_type, days in (half_lives or {}).items()
+    )
+    half_life = f"CASE signal_type {cases} ELSE {float(default_half_life or 0)} END" if cases \
+        else str(float(default_half_life or 0))
+    return (
+        f"(signal_score * decay_weight({as_of_sql} - julianday(COALESCE(detected_at, {as_of_sql})), "
+        f"{half_life}))"
+    )
+
+
+def _connect_scoring():
+    conn = sqlite3.connect(DB_PATH)
+    conn.create_function('decay_weight', 2, _decay_weight, deterministic=True)
+    return conn
+
+
+def _score_aggregates_sql(name_filter: str = "") -> str:
+    """출처별 집계 CTE (name_filter: 각 출처의 학교명 컬럼에 붙일 'IN (...)' 조건, 신호는 임시 테이블 scored_signals)."""
+    sig_filter = f"WHERE school_name {name_filter}" if name_filter else ""
+    ntis_filter = f"AND lead_agency {name_filter}" if name_filter else ""
+    bid_filter = f"WHERE school_name {name_filter}" if name_filter else ""
+    return f"""
+    sig AS (
+        SELECT school_name, CAST(ROUND(MAX(decayed)) AS INTEGER) AS signal_max, COUNT(*) AS signal_count
+        FROM scored_signals {sig_filter} GROUP BY school_name
+    ),
+    ntis AS (
+        SELECT lead_agency AS school_name, MAX(relevance_score) AS ntis_max, COUNT(*) AS ntis_count
+        FROM ntis_projects WHERE COALESCE(lead_agency, '') != '' {ntis_filter} GROUP BY lead_agency
+    ),
+    bids AS (
+        SELECT school_name, COUNT(*) AS bid_count FROM univ_bids {bid_filter} GROUP BY school_name
+    )
+"""
+
+
+def get_school_score_aggregates(signal_detail_limit: int = 5, school_names: list = None,
+                                half_lives: dict = None, default_half_life: float = None,
+                                as_of: str = None) -> dict:
+    """
+    학교별 구매 점수 산정 입력을 SQLite 집계로 반환합니다 (원본 테이블 전체를 읽지 않음).
+    school_names: 이 학교들만 집계 (없으면 전체, 증분 갱신용)
+    half_lives·default_half_life: 신호 유형별 반감기(일) — 신호 점수를 detected_at 기준으로 지수 감쇠
+                                  (전체 신호 이력 사용, signal_max·상세 점수는 감쇠 후 반올림 값)
+    as_of: 감쇠 기준 시각 'YYYY-MM-DD[ HH:MM:SS]' (없으면 현재)
+
+    반환값:
+        {"schools": DataFrame — 학교당 1행 (같은 학교의 여러 사업 중 priority_score 최고 행),
+                    school_name, program_name, priority_score, sales_status, target_id,
+                    signal_max, signal_count, ntis_max, ntis_count, bid_count (없으면 NULL),
+         "unmatched": [(출처 'signal'/'ntis'/'bid', 학교명, 최댓값, 건수), ...]
+                      — target_schools에 같은 이름이 없는 집계 (약칭·캠퍼스 표기 등, 호출 측에서 정규화, 항상 전체),
+         "signal_details": [{"school_name", "signal_type", "signal_title", "signal_score", "id"}, ...]
+                      — 학교명별 상위 signal_detail_limit건 (감쇠 점수·최신순, school_names와 target_schools 밖 이름,
+                        signal_score는 감쇠 후 점수, raw_score는 원래 점수)}
+    """
+    decayed = _decayed_score_sql(half_lives, default_half_life, as_of)
+    empty = {'schools': pd.DataFrame(), 'unmatched': [], 'signal_details': []}
+    names = list(school_names) if school_names is not None else None
+    name_filter = f"IN ({','.join('?' * len(names))})" if names else ""
+    if names is not None and not names:
+        return empty
+    conn = _connect_scoring()    # 조회 오류는 호출 측으로 전달 (빈 결과로 오인해 저장된 점수를 지우지 않도록)
+    try:
+        cursor = conn.cursor()
+        # 감쇠 점수는 신호 1건당 한 번만 계산 (집계·미매칭·상세 조회가 공유하는 연결 전용 임시 테이블)
+        name_scope = (
+            f"AND (school_name {name_filter} OR school_name NOT IN (SELECT school_name FROM target_schools))"
+            if names else ""
+        )
+        cursor.execute(f'''
+            CREATE TEMP TABLE scored_signals AS
+            SELECT id, school_name, signal_type, signal_title, signal_score, {decayed} AS decayed
+            FROM purchase_signals
+            WHERE signal_score >= 0 {name_scope}
+        ''', names or [])
+
+        schools = pd.read_sql_query(f'''
+            WITH {_score_aggregates_sql(name_filter)},
+            ts AS (
+                SELECT id, school_name, program_name, priority_score, sales_status,
+                       ROW_NUMBER() OVER (PARTITION BY school_name ORDER BY priority_score DESC, id DESC) AS rn
+                FROM target_schools {f"WHERE school_name {name_filter}" if names else ""}
+            )
+            SELECT ts.school_name, ts.program_name, ts.priority_score, ts.sales_status, ts.id AS target_id,
+                   sig.signal_max, sig.signal_count, ntis.ntis_max, ntis.ntis_count, bids.bid_count
+            FROM ts
+            LEFT JOIN sig ON sig.school_name = ts.school_name
+            LEFT JOIN ntis ON ntis.school_name = ts.school_name
+            LEFT JOIN bids ON bids.school_name = ts.school_name
+            WHERE ts.rn = 1
+            ORDER BY ts.priority_score DESC, ts.id DESC
+        ''', conn, params=(names or []) * 4)
+
+        cursor.execute(f'''
+            WITH {_score_aggregates_sql()}
+            SELECT 'signal', school_name, signal_max, signal_count FROM sig
+            WHERE school_name NOT IN (SELECT school_name FROM target_schools)
+            UNION ALL
+            SELECT 'ntis', school_name, ntis_max, ntis_count FROM ntis
+            WHERE school_name NOT IN (SELECT school_name FROM target_schools)
+            UNION ALL
+            SELECT 'bid', school_name, NULL, bid_count FROM bids
+            WHERE school_name NOT IN (SELECT school_name FROM target_schools)
+        ''')
+        unmatched = cursor.fetchall()
+
+        # 학교명별 감쇠 점수 상위 N건
+        cursor.execute('''
+            SELECT school_name, signal_type, signal_title, CAST(ROUND(decayed) AS INTEGER) AS signal_score,
+                   signal_score AS raw_score, id
+            FROM (
+                SELECT *, ROW_NUMBER() OVER (PARTITION BY school_name ORDER BY decayed DESC, id DESC) AS rn
+                FROM scored_signals
+            )
+            WHERE rn <= ?
+            ORDER BY decayed DESC, id DESC
+        ''', (signal_detail_limit,))
+        columns = [d[0] for d in cursor.description]
+        details = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        return {'schools': schools, 'unmatched': unmatched, 'signal_details': details}
+    finally:
+        conn.close()
+
+
+def get_scoring_history() -> dict:
+    """
+    점수 백테스트용 원본 이력을 한 번에 읽어 DataFrame으로 반환합니다 (읽기 전용 트랜잭션 1회).
+    반환값: {"targets", "signals", "ntis", "univ_bids", "bids", "status_history"}
+    """
+    queries = {
+        'targets': "SELECT id, school_name, program_name, priority_score, sales_status, created_at, updated_at "
+                   "FROM target_schools",
+        'signals': "SELECT school_name, signal_type, signal_title, signal_score, detected_at "
+                   "FROM purchase_signals WHERE signal_score >= 0",
+        'ntis': "SELECT lead_agency, relevance_score, crawled_at FROM ntis_projects "
+                "WHERE COALESCE(lead_agency, '') != ''",
+        'univ_bids': "SELECT school_name, crawled_at FROM univ_bids",
+        'bids': "SELECT bid_title, demand_agency, successful_bidder, contract_date FROM bid_history",
+        'status_history': "SELECT target_id, school_name, old_status, new_status, changed_at "
+                          "FROM sales_status_history ORDER BY changed_at, id",
+    }
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        conn.execute("BEGIN")
+        return {name: pd.read_sql_query(sql, conn) for name, sql in queries.items()}
+    finally:
+        conn.rollback()
+        conn.close()
+
+
+# ──────────────────────────────────────────────
+# 학교별 구매 점수 (school_scores — 입력이 바뀐 학교만 다시 계산)
+#   구매 신호·NTIS·대학 입찰·타겟 학교 변경 시 school_score_dirty에 학교명 기록
+#   → purchase_signal_engine.refresh_school_scores()가 해당 학교만 재계산
+# ──────────────────────────────────────────────
+
+def _mark_scores_dirty(cursor, school_names) -> None:
+    """점수 재계산 대상 학교명을 기록합니다 (호출 측 트랜잭션 안에서 실행)."""
+    from datetime import datetime
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    cursor.executemany(
+        "INSERT INTO school_score_dirty (school_name, marked_at) VALUES (?, ?)",
+        [(name, now) for name in {n for n in school_names if n}]
+    )
+
+
+def get_school_score_dirty() -> tuple:
+    """재계산 대상 (학교명 집합, 마지막 기록 번호) — 처리 후 clear_school_score_dirty(마지막 번호)."""
+    try:
+        conn = sqlite3.connect(DB_PATH)
+        cursor = conn.cursor()
+        cursor.execute("SELECT seq, school_name FROM school_score_dirty")
+        rows = cursor.fetchall()
+        conn.close()
+        return {r[1] for r in rows}, max((r[0] for r in rows), default=0)
+    except Exception:
+        return set(), 0
+
+
+def clear_school_score_dirty(up_to_seq: int) -> None:
+    """처리한 기록까지만 지웁니다 (재계산 중 새로 기록된 학교는 다음 갱신에서 처리)."""
+    conn = sqlite3.connect(DB_PATH)
+    conn.execute("DELETE FROM school_score_dirty WHERE seq <= ?", (up_to_seq,))
+    conn.commit()
+    conn.close()
+
+
+def count_school_scores() -> int:
+    try:
+        conn = sqlite3.connect(DB_PATH)
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM school_scores")
+        count = cursor.fetchone()[0]
+        conn.close()
+        return count
+    except Exception:
+        return 0
+
+
+def get_school_scores_scored_on() -> str:
+    """저장된 점수 중 가장 오래 전에 계산된 날짜 'YYYY-MM-DD' (없으면 None) — 신호 감쇠 재계산 판단용."""
+    try:
+        conn = sqlite3.connect(DB_PATH)
+        cursor = conn.cursor()
+        cursor.execute("SELECT MIN(substr(updated_at, 1, 10)) FROM school_scores")
+        scored_on = cursor.fetchone()[0]
+        conn.close()
+        return scored_on
+    except Exception:
+        return None
+
+
+def save_school_scores(scores: list, removed: list = (), replace_all: bool = False, scored_on: str = None) -> int:
+    """
+    학교별 점수를 저장합니다 (한 트랜잭션).
+    scores : [{'school_name', 'program_name', 'target_id', 'base_score', 'signal_bonus', 'budget_bonus',
+               'budget_month', 'status_bonus', 'total_score', 'tier', 'sales_status', 'signals'}, ...]
+    removed: 타겟 학교에서 빠진 학교명 (행 삭제), replace_all: 기존 행 전체 교체
+    scored_on: 감쇠 기준 날짜 'YYYY-MM-DD' — updated_at 날짜로 기록 (없으면 오늘, 자정을 넘긴 계산도 기준일 유지)
+    반환값: removed로 실제 삭제된 행 수
+    """
+    import json
+    from datetime import datetime
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    if scored_on:
+        now = scored_on + now[10:]
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    if replace_all:
+        cursor.execute("DELETE FROM school_scores")
+    deleted = 0
+    for name in removed:
+        cursor.execute("DELETE FROM school_scores WHERE school_name = ?", (name,))
+        deleted += cursor.rowcount
+    cursor.executemany('''
+        INSERT INTO school_scores
+            (school_name, program_name, target_id, base_score, signal_bonus, budget_bonus, budget_month,
+             status_bonus, total_score, tier, sales_status, signals_json, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(school_name) DO UPDATE SET
+            program_name = excluded.program_name, target_id = excluded.target_id,
+            base_score = excluded.base_score, signal_bonus = excluded.signal_bonus,
+            budget_bonus = excluded.budget_bonus, budget_month = excluded.budget_month,
+            status_bonus = excluded.status_bonus, total_score = excluded.total_score,
+            tier = excluded.tier, sales_status = excluded.sales_status,
+            signals_json = excluded.signals_json, updated_at = excluded.updated_at
+    ''', [
+        (sc['school_name'], sc['program_name'], sc['target_id'], sc['base_score'], sc['signal_bonus'],
+         sc['budget_bonus'], sc['budget_month'], sc['status_bonus'], sc['total_score'], sc['tier'],
+         sc['sales_status'], json.dumps(sc['signals'], ensure_ascii=False, default=str), now)
+        for sc in scores
+    ])
+    conn.commit()
+    conn.close()
+    return deleted
+
+
+def update_school_score_budget(month: int, budget_bonus: int, tiers: list) -> int:
+    """
+    예산 시기 보너스가 바뀐 달이면 저장된 점수의 시기 보너스·합계·등급만 SQL로 다시 계산합니다.
+    tiers: [(하한 점수 또는 None, 등급명), ...] (높은 등급부터)
+    반환값: 갱신된 행 수 (이미 이번 달 기준이면 0)
+    """
+    total = "MIN(base_score + signal_bonus + :bonus + status_bonus, 100)"
+    cases = " ".join(f"WHEN {total} >= {int(m)} THEN '{name}'" for m, name in tiers if m is not None)
+    default = next(name for m, name in tiers if m is None)
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    cursor.execute(f'''
+        UPDATE school_scores SET
+            budget_bonus = :bonus, budget_month = :month,
+            total_score = {total},
+            tier = CASE {cases} ELSE '{default}' END
+        WHERE budget_month IS NULL OR budget_month != :month
+    ''', {'bonus': budget_bonus, 'month': month})
+    updated = cursor.rowcount
+    conn.commit()
+    conn.close()
+    return updated
+
+
+def get_school_score_rows(limit: int = None, exclude_statuses: tuple = (), with_signals: bool = True) -> list:
+    """
+    저장된 학교별 점수를 점수순(동점은 타겟 학교 순서)으로 반환합니다 (인덱스 순서 읽기 + LIMIT).
+    with_signals=False이면 신호 상세 JSON을 읽지 않음 ('signals' 키 없음)
+    반환값: [{'school_name', 'program_name', 'base_score', 'signal_bonus', 'budget_bonus',
+              'status_bonus', 'total_score', 'signals', 'tier', 'sales_status', 'scored_on'}, ...]
+    """
+    import json
+    where = f"WHERE COALESCE(sales_status, '') NOT IN ({','.join('?' * len(exclude_statuses))})" \
+        if exclude_statuses else ""
+    try:
+        conn = sqlite3.connect(DB_PATH)
+        cursor = conn.cursor()
+        cursor.execute(f'''
+            SELECT school_name, program_name, base_score, signal_bonus, budget_bonus, status_bonus,
+                   total_score, {"signals_json" if with_signals else "NULL"}, tier, sales_status,
+                   substr(updated_at, 1, 10)
+            FROM school_scores {where}
+            ORDER BY total_score DESC, base_score DESC, target_id DESC
+            {"LIMIT ?" if limit else ""}
+        ''', (*exclude_statuses, *([limit] if limit else [])))
+        rows = cursor.fetchall()
+        conn.close()
+    except Exception:
+        return []
+    results = []
+    for r in rows:
+        row = {
+            'school_name': r[0], 'program_name': r[1], 'base_score': r[2], 'signal_bonus': r[3],
+            'budget_bonus': r[4], 'status_bonus': r[5], 'total_score': r[6],
+            'tier': r[8], 'sales_status': r[9], 'scored_on': r[10],
+        }
+        if with_signals:
+            row['signals'] = json.loads(r[7] or '[]')
+        results.append(row)
+    return results
+
+
+def get_school_score_signals(school_names: list) -> dict:
+    """저장된 학교별 신호 상세 {학교명: [{'type', 'title', 'score'}, ...]} (school_names만 조회)."""
+    import json
+    names = list(school_names)
+    if not names:
+        return {}
+    try:
+        conn = sqlite3.connect(DB_PATH)
+        cursor = conn.cursor()
+        cursor.execute(
+            f"SELECT school_name, signals_json FROM school_scores WHERE school_name IN ({','.join('?' * len(names))})",
+            names
+        )
+        rows = cursor.fetchall()
+        conn.close()
+    except Exception:
+        return {}
+    return {name: json.loads(signals_json or '[]') for name, signals_json in rows}
+
+
+# ──────────────────────────────────────────────
+# 일별 점수 스냅샷 (school_score_snapshots — 전날 대비 바뀐 학교만 저장)
+#   학교의 D일 점수 = snapshot_date ≤ D 인 마지막 행 (tier 0이면 그날 점수 테이블에 없던 학교)
+#   (school_name, snapshot_date) 기본키 순서로 읽으므로 학교별 마지막 행은 GROUP BY 1회로 구함
+# ──────────────────────────────────────────────
+
+_SNAPSHOT_COMPONENTS = ('base_score', 'signal_bonus', 'budget_bonus', 'status_bonus', 'total_score', 'tier')
+
+
+def _snapshot_as_of_sql(op: str = '<=', param: str = 'as_of') -> str:
+    """날짜 파라미터(:param) 기준 학교별 마지막 스냅샷 행 (SQLite: MAX() 집계의 나머지 컬럼은 최댓값 행의 값)."""
+    return f'''
+        SELECT school_name, MAX(snapshot_date) AS snapshot_date, {', '.join(_SNAPSHOT_COMPONENTS)}
+        FROM school_score_snapshots
+        WHERE snapshot_date {op} :{param}
+        GROUP BY school_name
+    '''
+
+
+def save_school_score_snapshot(snapshot_date: str, tiers: list) -> dict:
+    """
+    현재 school_scores를 snapshot_date 스냅샷으로 저장합니다 (한 트랜잭션, INSERT ... SELECT 1회).
+    직전 스냅샷과 점수 구성요소·등급이 모두 같은 학교는 행을 쓰지 않고(델타 인코딩),
+    점수 테이블에서 빠진 학교는 tier 0 행으로 표시합니다. 같은 날짜로 다시 실행하면 그날 행을 교체합니다.
+    tiers: [(하한 점수 또는 None, 등급명), ...] (높은 등급부터 — 순서가 등급 순위 1, 2, ...)
+    반환값: {"snapshot_date", "schools": 점수 테이블 학교 수, "changed": 저장한 행 수}
+    """
+    from datetime import datetime
+    ranks = " ".join(f"WHEN '{name}' THEN {rank}" for rank, (_, name) in enumerate(tiers, start=1))
+    changed = " OR ".join(f"cur.{c} != prev.{c}" for c in _SNAPSHOT_COMPONENTS)
+    columns = ', '.join(_SNAPSHOT_COMPONENTS)
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    try:
+        cursor.execute("DELETE FROM school_score_snapshots WHERE snapshot_date = ?", (snapshot_date,))
+        cursor.execute(f'''
+            WITH prev AS ({_snapshot_as_of_sql('<')}),
+            cur AS (
+                SELECT school_name, COALESCE(base_score, 0) AS base_score, COALESCE(signal_bonus, 0) AS signal_bonus,
+                       COALESCE(budget_bonus, 0) AS budget_bonus, COALESCE(status_bonus, 0) AS status_bonus,
+                       COALESCE(total_score, 0) AS total_score,
+                       CASE tier {ranks} ELSE {len(tiers)} END AS tier
+                FROM school_scores
+            )
+            INSERT INTO school_score_snapshots (school_name, snapshot_date, {columns})
+            SELECT cur.school_name, :as_of, {', '.join('cur.' + c for c in _SNAPSHOT_COMPONENTS)}
+            FROM cur LEFT JOIN prev ON prev.school_name = cur.school_name
+            WHERE prev.school_name IS NULL OR {changed}
+            UNION ALL
+            SELECT prev.school_name, :as_of, 0, 0, 0, 0, 0, 0
+            FROM prev
+            WHERE prev.tier != 0 AND prev.school_name NOT IN (SELECT school_name FROM cur)
+        ''', {'as_of': snapshot_date})
+        cursor.execute("SELECT changes()")    # WITH로 시작하는 INSERT는 cursor.rowcount가 -1
+        written = cursor.fetchone()[0]
+        cursor.execute("SELECT COUNT(*) FROM school_scores")
+        schools = cursor.fetchone()[0]
+        cursor.execute(
+            "INSERT OR REPLACE INTO school_score_snapshot_days (snapshot_date, school_count, changed_count, created_at) "
+            "VALUES (?, ?, ?, ?)",
+            (snapshot_date, schools, written, datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    return {'snapshot_date': snapshot_date, 'schools': schools, 'changed': written}
+
+
+def get_school_score_snapshot_days(limit: int = None) -> list:
+    """저장된 스냅샷 날짜 목록 (최신순) [{'snapshot_date', 'school_count', 'changed_count'}, ...]."""
+    try:
+        conn = sqlite3.connect(DB_PATH)
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT snapshot_date, school_count, changed_count FROM school_score_snapshot_days "
+            f"ORDER BY snapshot_date DESC {'LIMIT ?' if limit else ''}",
+            (limit,) if limit else ()
+        )
+        rows = cursor.fetchall()
+        conn.close()
+    except Exception:
+        return []
+    return [{'snapshot_date': r[0], 'school_count': r[1], 'changed_count': r[2]} for r in rows]
+
+
+def get_school_score_snapshot(as_of: str) -> list:
+    """
+    as_of 날짜 기준 학교별 점수 (그날 또는 그 이전 마지막 스냅샷 행, 점수 테이블에 없던 학교 제외).
+    반환값: [{'school_name', 'program_name'(현재 대표 사업), 'base_score', 'signal_bonus', 'budget_bonus',
+              'status_bonus', 'total_score', 'tier', 'snapshot_date'}, ...] (점수순)
+    """
+    try:
+        conn = sqlite3.connect(DB_PATH)
+        cursor = conn.cursor()
+        cursor.execute(f'''
+            SELECT s.school_name, sc.program_name, {', '.join('s.' + c for c in _SNAPSHOT_COMPONENTS)},
+                   s.snapshot_date
+            FROM ({_snapshot_as_of_sql()}) s
+            LEFT JOIN school_scores sc ON sc.school_name = s.school_name
+            WHERE s.tier != 0
+            ORDER BY s.total_score DESC, s.base_score DESC, s.school_name
+        ''', {'as_of': as_of})
+        rows = cursor.fetchall()
+        conn.close()
+    except Exception:
+        return []
+    keys = ('school_name', 'program_name', *_SNAPSHOT_COMPONENTS, 'snapshot_date')
+    return [dict(zip(keys, r)) for r in rows]
+
+
+def get_score_changes(from_date: str, to_date: str) -> list:
+    """
+    두 날짜 사이 합계 점수나 등급이 바뀐 학교 (양쪽 날짜 모두 점수가 있던 학교만).
+    각 날짜의 학교별 마지막 스냅샷 행을 기본키 순서 GROUP BY로 구해 비교하므로 바뀐 학교 수만큼만 반환합니다.
+    반환값: [{'school_name', 'program_name'(현재 대표 사업), 'from_score', 'to_score', 'delta',
+              'from_tier', 'to_tier', 'signal_delta', 'status_delta', 'budget_delta'}, ...] (상승폭순)
+    """
+    try:
+        conn = sqlite3.connect(DB_PATH)
+        cursor = conn.cursor()
+        cursor.execute(f'''
+            WITH a AS ({_snapshot_as_of_sql(param='from_date')}),
+                 b AS ({_snapshot_as_of_sql(param='to_date')})
+            SELECT b.school_name, sc.program_name, a.total_score, b.total_score,
+                   b.total_score - a.total_score, a.tier, b.tier,
+                   b.signal_bonus - a.signal_bonus, b.status_bonus - a.status_bonus,
+                   b.budget_bonus - a.budget_bonus
+            FROM b
+            JOIN a ON a.school_name = b.school_name
+            LEFT JOIN school_scores sc ON sc.school_name = b.school_name
+            WHERE a.tier != 0 AND b.tier != 0
+              AND (a.total_score != b.total_score OR a.tier != b.tier)
+            ORDER BY b.total_score - a.total_score DESC, b.total_score DESC
+        ''', {'from_date': from_date, 'to_date': to_date})
+        rows = cursor.fetchall()
+        conn.close()
+    except Exception:
+        return []
+    keys = ('school_name', 'program_name', 'from_score', 'to_score', 'delta',
+            'from_tier', 'to_tier', 'signal_delta', 'status_delta', 'budget_delta')
+    return [dict(zip(keys, r)) for r in rows]
+
+
+# ──────────────────────────────────────────────
+# 학교 360° 프로필 (학교 1곳의 관련 행을 테이블별 학교명 인덱스로 조회)
+# ──────────────────────────────────────────────
+
+# 키 → (테이블, 학교명 컬럼, 정렬)
+_PROFILE_SOURCES = {
+    'targets': ('target_schools', 'school_name', 'priority_score DESC, id'),
+    'contacts': ('contacts', 'school_name', 'id DESC'),
+    'bids': ('bid_history', 'demand_agency', 'contract_date DESC, id DESC'),
+    'grants': ('grants', 'selected_school', 'crawled_at DESC, id DESC'),
+    'ntis_projects': ('ntis_projects', 'lead_agency', 'relevance_score DESC, id DESC'),
+    'univ_bids': ('univ_bids', 'school_name', 'pub_date DESC, id DESC'),
+    'signals': ('purchase_signals', 'school_name', 'detected_at DESC, id DESC'),
+    'status_history': ('sales_status_history', 'school_name', 'changed_at DESC, id DESC'),
+}
+
+
+def get_school_profile_rows(school_name: str, stored_forms: list, limit: int = 100,
+                            history_days: int = 90) -> dict:
+    """
+    학교 1곳의 관련 행을 모든 테이블에서 읽기 트랜잭션 1개로 조회합니다 (테이블별 학교명 인덱스 IN 조회).
+    stored_forms: 이 학교로 해석되는 저장 표기 (school_resolver.stored_forms — 약칭·'산학협력단' 표기 포함)
+    limit: 테이블별 최대 행 수 (최신·중요도순), history_days: 점수 스냅샷 최대 행 수
+    반환값: {'targets', 'contacts', 'bids', 'grants', 'ntis_projects', 'univ_bids', 'signals', 'status_history':
+              [행 dict, ...], 'counts': {키: 전체 건수}, 'score': school_scores 행 dict 또는 None,
+              'score_history': [{'snapshot_date', 'total_score', 'tier', ...}, ...] (최신순)}
+             조회 실패 시 {'error': 메시지} (빈 프로필과 구분)
+    """
+    import json
+    forms = list(dict.fromkeys(stored_forms)) or [school_name]
+    placeholders = ','.join('?' * len(forms))
+    profile = {key: [] for key in _PROFILE_SOURCES}
+    profile.update(counts={key: 0 for key in _PROFILE_SOURCES}, score=None, score_history=[])
+    conn = None
+    try:
+        conn = sqlite3.connect(DB_PATH, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        cursor.execute("BEGIN")    # 모든 테이블을 같은 시점 기준으로 읽음
+        for key, (table, column, order) in _PROFILE_SOURCES.items():
+            cursor.execute(
+                f"SELECT *, COUNT(*) OVER () AS _total FROM {table} WHERE {column} IN ({placeholders}) "
+                f"ORDER BY {order} LIMIT ?",
+                (*forms, limit)
+            )
+            rows = [dict(r) for r in cursor.fetchall()]
+            profile['counts'][key] = rows[0]['_total'] if rows else 0
+            for row in rows:
+                del row['_total']
+            profile[key] = rows
+
+        cursor.execute("SELECT * FROM school_scores WHERE school_name = ?", (school_name,))
+        score = cursor.fetchone()
+        if score is not None:
+            score = dict(score)
+            score['signals'] = json.loads(score.pop('signals_json') or '[]')
+        profile['score'] = score
+        cursor.execute(f'''
+            SELECT snapshot_date, {', '.join(_SNAPSHOT_COMPONENTS)}
+            FROM school_score_snapshots
+            WHERE school_name = ?
+            ORDER BY snapshot_date DESC
+            LIMIT ?
+        ''', (school_name, history_days))
+        profile['score_history'] = [dict(r) for r in cursor.fetchall() if r['tier'] != 0]
+        cursor.execute("COMMIT")
+    except Exception as e:
+        print(f"학교 프로필 조회 오류 ({school_name}): {e}")
+        if conn is not None and conn.in_transaction:
+            conn.execute("ROLLBACK")
+        return {'error': f"'{school_name}' 프로필 조회 중 DB 오류가 발생했습니다: {e}"}
+    finally:
+        if conn is not None:
+            conn.close()
+    return profile
+
+
 def mark_signal_acted(signal_id: int, memo: str) -> bool:
     """구매 신호를 '조치 완료'로 마킹합니다."""
     try:
@@ -923,6 +1978,331 @@ def get_cad_scan_pending_schools(limit: int = 50) -> list:
         return []
 
 
+def get_schools_without_contacts(limit: int = 50, cad_only: bool = True) -> list:
+    """
+    연락처(contacts)가 하나도 없는 학교 목록을 우선순위 순으로 반환합니다. (일괄 교수 발굴 대상)
+    cad_only=True이면 CAD 학과가 확인된(has_cad_dept=1) 학교만
+    """
+    try:
+        conn = sqlite3.connect(DB_PATH)
+        cursor = conn.cursor()
+        cursor.execute(f'''
+            SELECT ts.school_name, MAX(ts.school_type), MAX(ts.priority_score) AS score
+            FROM target_schools ts
+            WHERE {"ts.has_cad_dept = 1 AND" if cad_only else ""}
+                  NOT EXISTS (SELECT 1 FROM contacts c WHERE c.school_name = ts.school_name)
+            GROUP BY ts.school_name
+            ORDER BY score DESC
+            LIMIT ?
+        ''', (limit,))
+        rows = cursor.fetchall()
+        conn.close()
+        return [{'school_name': r[0], 'school_type': r[1] or '4년제', 'priority_score': r[2]}
+                for r in rows]
+    except Exception:
+        return []
+
+
+# ──────────────────────────────────────────────
+# 재개 가능한 스캔 작업 (scan_jobs / scan_tasks)
+#   stage : pending → searched → classified → professors_collected
+#   status: queued → claimed → done / failed
+# ──────────────────────────────────────────────
+
+# 작업자가 이 시간(초) 동안 체크포인트를 남기지 않으면 중단된 것으로 보고 다시 배정
+SCAN_TASK_LEASE_SEC = 600
+
+# 실패한 학교를 재개 시 다시 시도하는 최대 횟수
+SCAN_TASK_MAX_ATTEMPTS = 3
+
+_SCAN_JOB_COLUMNS = (
+    'id', 'job_type', 'status', 'collect_professors', 'total',
+    'created_at', 'updated_at', 'finished_at',
+)
+_SCAN_TASK_COLUMNS = (
+    "id, job_id, school_name, school_type, stage, status, attempts, "
+    "search_content, classification, dept_artifacts, professors_count, error"
+)
+
+
+def _scan_task_row_to_dict(row) -> dict:
+    import json
+    return {
+        'task_id': row[0],
+        'job_id': row[1],
+        'school_name': row[2],
+        'school_type': row[3] or '4년제',
+        'stage': row[4],
+        'status': row[5],
+        'attempts': row[6],
+        'search_content': row[7],
+        'classification': json.loads(row[8]) if row[8] else None,
+        'dept_artifacts': json.loads(row[9]) if row[9] else {},
+        'professors_count': row[10] or 0,
+        'error': row[11],
+    }
+
+
+def create_scan_job(schools: list, collect_professors: bool = True,
+                    job_type: str = 'cad_scan') -> int:
+    """학교 목록으로 스캔 작업을 만들고 job_id를 반환합니다. schools: [{"school_name", "school_type"}, ...]"""
+    from datetime import datetime
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    cursor.execute(
+        "INSERT INTO scan_jobs (job_type, status, collect_professors, total, created_at, updated_at) "
+        "VALUES (?, 'running', ?, 0, ?, ?)",
+        (job_type, 1 if collect_professors else 0, now, now)
+    )
+    job_id = cursor.lastrowid
+    cursor.executemany(
+        "INSERT OR IGNORE INTO scan_tasks (job_id, school_name, school_type, updated_at) "
+        "VALUES (?, ?, ?, ?)",
+        [(job_id, s['school_name'], s.get('school_type') or '4년제', now) for s in schools]
+    )
+    cursor.execute(
+        "UPDATE scan_jobs SET total = (SELECT COUNT(*) FROM scan_tasks WHERE job_id = ?) WHERE id = ?",
+        (job_id, job_id)
+    )
+    conn.commit()
+    conn.close()
+    return job_id
+
+
+def _fetch_scan_job(where: str, params: tuple) -> dict | None:
+    try:
+        conn = sqlite3.connect(DB_PATH)
+        cursor = conn.cursor()
+        cursor.execute(
+            f"SELECT {', '.join(_SCAN_JOB_COLUMNS)} FROM scan_jobs WHERE {where} "
+            f"ORDER BY id DESC LIMIT 1",
+            params
+        )
+        row = cursor.fetchone()
+        conn.close()
+        return dict(zip(_SCAN_JOB_COLUMNS, row)) if row else None
+    except Exception:
+        return None
+
+
+def get_scan_job(job_id: int) -> dict | None:
+    """스캔 작업 1건의 정보를 반환합니다."""
+    return _fetch_scan_job("id = ?", (job_id,))
+
+
+def get_unfinished_scan_job(job_type: str = 'cad_scan') -> dict | None:
+    """
+    남은 학교(대기·진행 중, 또는 재시도 가능한 실패)가 있는 가장 최근 스캔 작업을 반환합니다.
+    중단·취소된 작업도 포함되며, 없으면 None.
+    """
+    return _fetch_scan_job(
+        "job_type = ? AND status != 'completed' AND EXISTS ("
+        "SELECT 1 FROM scan_tasks t WHERE t.job_id = scan_jobs.id "
+        "AND (t.status IN ('queued', 'claimed') OR (t.status = 'failed' AND t.attempts < ?)))",
+        (job_type, SCAN_TASK_MAX_ATTEMPTS)
+    )
+
+
+def claim_scan_tasks(job_id: int, worker_id: str, limit: int = 10,
+                     lease_sec: int = SCAN_TASK_LEASE_SEC) -> list:
+    """
+    대기 중인 학교(또는 임대 시간이 지난 학교)를 작업자 이름으로 원자적으로 가져옵니다.
+    반환값: 저장된 단계·중간 산출물을 포함한 작업 목록
+        [{"task_id", "school_name", "school_type", "stage", "search_content",
+          "classification", "dept_artifacts", ...}, ...]
+    """
+    from datetime import datetime, timedelta
+    now = datetime.now()
+    expired = (now - timedelta(seconds=lease_sec)).strftime("%Y-%m-%d %H:%M:%S")
+    now = now.strftime("%Y-%m-%d %H:%M:%S")
+
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    cursor.execute(f'''
+        UPDATE scan_tasks
+        SET status = 'claimed', claimed_by = ?, claimed_at = ?, updated_at = ?,
+            attempts = attempts + 1
+        WHERE id IN (
+            SELECT id FROM scan_tasks
+            WHERE job_id = ?
+              AND (status = 'queued' OR (status = 'claimed' AND claimed_at < ?))
+            ORDER BY id
+            LIMIT ?
+        )
+        RETURNING {_SCAN_TASK_COLUMNS}
+    ''', (worker_id, now, now, job_id, expired, limit))
+    rows = cursor.fetchall()
+    conn.commit()
+    conn.close()
+    return sorted((_scan_task_row_to_dict(r) for r in rows), key=lambda t: t['task_id'])
+
+
+def save_scan_task_stage(task_id: int, stage: str = None, search_content: str = None,
+                         classification: dict = None, dept_artifacts: dict = None) -> None:
+    """
+    학교 1곳의 단계 진행과 중간 산출물을 체크포인트로 저장합니다 (임대 시간도 갱신).
+    None인 항목은 기존 값을 유지합니다.
+    """
+    import json
+    from datetime import datetime
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    sets = ["claimed_at = ?", "updated_at = ?"]
+    params = [now, now]
+    if stage is not None:
+        sets.append("stage = ?")
+        params.append(stage)
+    if search_content is not None:
+        sets.append("search_content = ?")
+        params.append(search_content)
+    if classification is not None:
+        sets.append("classification = ?")
+        params.append(json.dumps(classification, ensure_ascii=False))
+    if dept_artifacts is not None:
+        sets.append("dept_artifacts = ?")
+        params.append(json.dumps(dept_artifacts, ensure_ascii=False))
+    params.append(task_id)
+
+    conn = sqlite3.connect(DB_PATH)
+    conn.execute(f"UPDATE scan_tasks SET {', '.join(sets)} WHERE id = ?", params)
+    conn.commit()
+    conn.close()
+
+
+def finish_scan_task(task_id: int, error: str = None, professors_count: int = None,
+                     stage: str = None) -> None:
+    """학교 1곳을 완료(done) 또는 실패(failed, error 기록)로 표시합니다. 저장된 단계는 유지됩니다."""
+    from datetime import datetime
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    conn = sqlite3.connect(DB_PATH)
+    conn.execute(
+        "UPDATE scan_tasks SET status = ?, error = ?, stage = COALESCE(?, stage), "
+        "professors_count = COALESCE(?, professors_count), claimed_by = NULL, updated_at = ? "
+        "WHERE id = ?",
+        ('failed' if error else 'done', error, stage, professors_count, now, task_id)
+    )
+    conn.commit()
+    conn.close()
+
+
+def requeue_scan_tasks(job_id: int, release_claims: bool = False,
+                       max_attempts: int = SCAN_TASK_MAX_ATTEMPTS) -> int:
+    """
+    재개 준비: 시도 횟수가 남은 실패 학교를 대기 상태로 되돌리고 작업을 running으로 바꿉니다.
+    release_claims=True이면 작업자가 잡고 있던 학교도 즉시 회수합니다 (이전 실행이 죽은 경우).
+    반환값: 대기 상태로 바뀐 학교 수
+    """
+    from datetime import datetime
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    cursor.execute(
+        "UPDATE scan_tasks SET status = 'queued', claimed_by = NULL, updated_at = ? "
+        "WHERE job_id = ? AND ((status = 'failed' AND attempts < ?) "
+        "OR (status = 'claimed' AND ? = 1))",
+        (now, job_id, max_attempts, 1 if release_claims else 0)
+    )
+    count = cursor.rowcount
+    cursor.execute(
+        "UPDATE scan_jobs SET status = 'running', finished_at = NULL, updated_at = ? WHERE id = ?",
+        (now, job_id)
+    )
+    conn.commit()
+    conn.close()
+    return count
+
+
+def set_scan_job_status(job_id: int, status: str) -> None:
+    """스캔 작업 상태를 바꿉니다 (예: 'cancelled' — 실행 중인 작업자는 다음 배정 전에 멈춤)."""
+    from datetime import datetime
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    conn = sqlite3.connect(DB_PATH)
+    conn.execute("UPDATE scan_jobs SET status = ?, updated_at = ? WHERE id = ?", (status, now, job_id))
+    conn.commit()
+    conn.close()
+
+
+def finalize_scan_job(job_id: int) -> str:
+    """
+    남은(대기·진행 중) 학교가 없으면 작업을 종료 상태로 바꾸고 최종 상태를 반환합니다.
+    completed: 전부 완료 / incomplete: 실패 학교 있음 / 남은 학교가 있거나 취소된 작업은 현재 상태 유지
+    """
+    from datetime import datetime
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT SUM(status IN ('queued', 'claimed')), SUM(status = 'failed') "
+        "FROM scan_tasks WHERE job_id = ?",
+        (job_id,)
+    )
+    remaining, failed = cursor.fetchone()
+    cursor.execute("SELECT status FROM scan_jobs WHERE id = ?", (job_id,))
+    row = cursor.fetchone()
+    status = row[0] if row else None
+    if status is not None and status != 'cancelled' and not remaining:
+        status = 'incomplete' if failed else 'completed'
+        cursor.execute(
+            "UPDATE scan_jobs SET status = ?, updated_at = ?, finished_at = ? WHERE id = ?",
+            (status, now, now, job_id)
+        )
+        conn.commit()
+    conn.close()
+    return status
+
+
+def get_scan_job_progress(job_id: int) -> dict:
+    """
+    스캔 작업 진행 현황을 반환합니다.
+    반환값: {"job": {...}, "stages": {단계: 학교 수}, "statuses": {상태: 학교 수},
+             "failed": [(학교명, 오류), ...]}
+    """
+    result = {'job': get_scan_job(job_id), 'stages': {}, 'statuses': {}, 'failed': []}
+    try:
+        conn = sqlite3.connect(DB_PATH)
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT stage, COUNT(*) FROM scan_tasks WHERE job_id = ? GROUP BY stage", (job_id,)
+        )
+        result['stages'] = dict(cursor.fetchall())
+        cursor.execute(
+            "SELECT status, COUNT(*) FROM scan_tasks WHERE job_id = ? GROUP BY status", (job_id,)
+        )
+        result['statuses'] = dict(cursor.fetchall())
+        cursor.execute(
+            "SELECT school_name, error FROM scan_tasks WHERE job_id = ? AND status = 'failed'",
+            (job_id,)
+        )
+        result['failed'] = cursor.fetchall()
+        conn.close()
+    except Exception:
+        pass
+    return result
+
+
+def get_scan_task_evidence(limit: int = 100) -> dict:
+    """스캔 작업에 저장된 학교별 교육과정 검색 결과를 최근 순으로 반환합니다. {school_name: search_content}"""
+    try:
+        conn = sqlite3.connect(DB_PATH)
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT school_name, search_content
+            FROM scan_tasks
+            WHERE search_content IS NOT NULL AND search_content != ''
+            ORDER BY id DESC
+        ''')
+        evidence = {}
+        for name, content in cursor.fetchall():
+            if name not in evidence:
+                evidence[name] = content
+                if len(evidence) >= limit:
+                    break
+        conn.close()
+        return evidence
+    except Exception:
+        return {}
+
+
 def get_cad_department_stats() -> dict:
     """CAD 학과 스캔 통계를 반환합니다."""
     try:
@@ -984,3 +2364,96 @@ def get_action_required_schools(limit: int = 20) -> pd.DataFrame:
         return df
     except Exception:
         return pd.DataFrame()
+
+
+# ──────────────────────────────────────────────
+# LLM 호출 지표 (llm_call_metrics)
+# ──────────────────────────────────────────────
+
+def insert_llm_call_metric(metric: dict) -> None:
+    """
+    Gemini 호출 1건의 지표를 저장합니다.
+    metric: {"source", "model", "status"('ok'/'error'/'cancelled'), "http_status", "attempts",
+             "latency_ms", "wait_ms", "first_chunk_ms"(스트리밍만), "prompt_tokens", "output_tokens",
+             "total_tokens", "error"}
+    """
+    from datetime import datetime
+    conn = sqlite3.connect(DB_PATH)
+    conn.execute('''
+        INSERT INTO llm_call_metrics
+            (called_at, source, model, status, http_status, attempts, latency_ms, wait_ms,
+             first_chunk_ms, prompt_tokens, output_tokens, total_tokens, error)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', (
+        datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        metric.get('source', ''),
+        metric.get('model', ''),
+        metric.get('status', ''),
+        metric.get('http_status'),
+        metric.get('attempts', 1),
+        metric.get('latency_ms', 0),
+        metric.get('wait_ms', 0),
+        metric.get('first_chunk_ms'),
+        metric.get('prompt_tokens', 0),
+        metric.get('output_tokens', 0),
+        metric.get('total_tokens', 0),
+        metric.get('error'),
+    ))
+    conn.commit()
+    conn.close()
+
+
+def get_llm_call_summary(days: int = 7) -> list:
+    """
+    최근 days일 동안의 호출처별 LLM 호출 요약을 호출 시간 합계가 큰 순서로 반환합니다.
+    반환값: [{"source", "calls", "errors", "error_rate", "retries", "avg_ms", "p95_ms",
+              "total_sec", "wait_ratio", "first_chunk_ms", "prompt_tokens", "output_tokens"}, ...]
+    ※ wait_ratio: 전체 지연 시간 중 속도 제한·백오프 대기 비율
+    ※ first_chunk_ms: 스트리밍 호출의 평균 첫 조각 도착 시간 (스트리밍 호출이 없으면 None)
+    ※ 사용자가 중단한 스트리밍(cancelled)은 오류로 세지 않음
+    """
+    from datetime import datetime, timedelta
+    since = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d %H:%M:%S")
+    try:
+        conn = sqlite3.connect(DB_PATH)
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT source, status, attempts, latency_ms, wait_ms, first_chunk_ms,
+                   prompt_tokens, output_tokens
+            FROM llm_call_metrics
+            WHERE called_at >= ?
+        ''', (since,))
+        rows = cursor.fetchall()
+        conn.close()
+    except Exception:
+        return []
+
+    groups = {}
+    for (source, status, attempts, latency_ms, wait_ms, first_chunk_ms,
+         prompt_tokens, output_tokens) in rows:
+        g = groups.setdefault(source, {
+            'source': source, 'calls': 0, 'errors': 0, 'retries': 0,
+            'latencies': [], 'wait_ms': 0, 'first_chunks': [], 'prompt_tokens': 0, 'output_tokens': 0,
+        })
+        g['wait_ms'] += wait_ms or 0
+        if first_chunk_ms is not None:
+            g['first_chunks'].append(first_chunk_ms)
+        g['calls'] += 1
+        g['errors'] += 1 if status == 'error' else 0
+        g['retries'] += max((attempts or 1) - 1, 0)
+        g['latencies'].append(latency_ms or 0)
+        g['prompt_tokens'] += prompt_tokens or 0
+        g['output_tokens'] += output_tokens or 0
+
+    result = []
+    for g in groups.values():
+        latencies = sorted(g.pop('latencies'))
+        g['error_rate'] = round(g['errors'] / g['calls'], 3)
+        g['avg_ms'] = round(sum(latencies) / len(latencies), 1)
+        g['p95_ms'] = round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 1)
+        g['total_sec'] = round(sum(latencies) / 1000, 1)
+        g['wait_ratio'] = round(g.pop('wait_ms') / sum(latencies), 3) if sum(latencies) else 0.0
+        first_chunks = g.pop('first_chunks')
+        g['first_chunk_ms'] = round(sum(first_chunks) / len(first_chunks), 1) if first_chunks else None
+        result.append(g)
+    return sorted(result, key=lambda g: g['total_sec'], reverse=True)
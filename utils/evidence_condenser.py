@@ -0,0 +1,210 @@
+"""
+검색 근거 압축 단계 (Gemini 프롬프트 전송 전 Tavily 검색 결과 정리 — CAD 판별·교수 추출·담당자 추출 공용)
+
+■ 목적
+  - 검색 결과 6~8개를 그대로 이어 붙이면 겹치는 스니펫, 메뉴·저작권 같은 탐색 문구, 같은 출처의
+    반복 문장이 프롬프트 토큰 대부분을 차지 → 판별·추출에 필요한 문장만 남겨 토큰 절감
+
+■ 단계
+  1) "[출처: URL]\n본문" 블록 분리 → 문장 단위 분할
+  2) 잡음 제거 : 탐색·저작권 문구(키워드 없는 경우), 너무 짧은 문장
+  3) 중복 제거 : 정규화(공백·기호 제거)한 문장이 이미 나온 문장과 같거나 그 일부이면 제외
+  4) 신호 점수 : 키워드 출현 밀도 (keep_patterns — 이메일·전화번호 등 — 가 있으면 최우선)
+                 키워드가 하나도 없는 문장은 저신호로 제외
+  5) 토큰 예산 : 점수 높은 문장부터 예산까지 선택 → 원래 순서대로 출처별로 다시 조립 (출처 URL 유지)
+
+■ 측정
+  - condense()는 압축 전후 토큰·문장·출처 수를 함께 반환
+  - get_condense_stats() → 프로세스 누적 호출 수·압축 전후 토큰 (절감률 확인용)
+  - 환경변수 EVIDENCE_CONDENSE=0 이면 압축하지 않음 (비교·문제 확인용)
+"""
+import os
+import re
+import threading
+
+# 출처 블록 머리말 (crawler_cad_departments · crawler_contacts 검색 결과 형식)
+_SOURCE_RE = re.compile(r'^\[출처:\s*(.*?)\]\s*$', re.MULTILINE)
+
+# 문장 경계: 마침표·물음표·느낌표(+공백), 줄바꿈, 목록 구분 기호
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?。])\s+|\n+|\s+[|·•▶■□]\s+')
+
+# 정규화: 공백·기호 제거 후 대문자 (중복 판별용)
+_NORMALIZE_RE = re.compile(r'[\s\W_]+', re.UNICODE)
+
+# 탐색·저작권 등 잡음 문구 (키워드가 없을 때만 제외)
+_NOISE_RE = re.compile(
+    r'로그인|회원가입|사이트맵|바로가기|본문\s*바로|주메뉴|전체\s*메뉴|이전글|다음글|목록보기|'
+    r'공유하기|개인정보\s*처리방침|이용약관|저작권|Copyright|All rights reserved|ⓒ|©',
+    re.IGNORECASE,
+)
+
+# 연락처 패턴 (교수·담당자 추출 시 항상 우선 보존)
+EMAIL_RE = re.compile(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}')
+PHONE_RE = re.compile(r'(?<!\d)(?:\+82[-.\s]?)?0?\d{1,2}[-.)\s]\d{3,4}[-.\s]\d{4}(?!\d)')
+CONTACT_PATTERNS = (EMAIL_RE, PHONE_RE)
+
+# 학과·교육과정 문맥 키워드 (CAD 판별 시 CAD 키워드와 함께 사용)
+DEPARTMENT_KEYWORDS = [
+    '학과', '학부', '전공', '계열', '교육과정', '교과목', '과목', '실습', '이수', '커리큘럼',
+    '기계', '설계', '자동화', '메카트로닉스', '스마트팩토리',
+]
+
+# 교수·담당자 문맥 키워드 (연락처 추출 시 사용)
+CONTACT_KEYWORDS = [
+    '교수', '교사', '학과장', '부장', '담당', '사무실', '학과사무실', '연구실', '연구분야', '전공',
+    '이메일', 'E-mail', 'Email', '메일', '전화', '연락처', 'Tel', '내선',
+    '산학협력', '사업단', 'LINC', 'RISE',
+]
+
+MIN_SENTENCE_CHARS = 8
+
+ENABLED = os.getenv('EVIDENCE_CONDENSE', '1') != '0'
+
+_stats_lock = threading.Lock()
+_stats = {'calls': 0, 'tokens_before': 0, 'tokens_after': 0}
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 추정치 (한국어·영문 혼합 기준 약 2글자 ≈ 1토큰)."""
+    return len(text or '') // 2 + 1
+
+
+def split_sources(content: str) -> list:
+    """검색 결과 문자열을 [(출처 URL, 본문), ...]으로 나눕니다 (머리말이 없으면 URL은 빈 문자열)."""
+    if not content:
+        return []
+    headers = list(_SOURCE_RE.finditer(content))
+    if not headers:
+        return [('', content.strip())]
+    blocks = []
+    if content[:headers[0].start()].strip():
+        blocks.append(('', content[:headers[0].start()].strip()))
+    for i, m in enumerate(headers):
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(content)
+        body = content[m.end():end].strip()
+        if body:
+            blocks.append((m.group(1).strip(), body))
+    return blocks
+
+
+def split_sentences(text: str) -> list:
+    return [s.strip() for s in _SENTENCE_SPLIT_RE.split(text or '') if s and s.strip()]
+
+
+def _keyword_pattern(keywords: list):
+    words = sorted({k.upper() for k in keywords if k}, key=len, reverse=True)
+    return re.compile('|'.join(re.escape(w) for w in words)) if words else None
+
+
+def condense(content: str, keywords: list, token_budget: int,
+             keep_patterns: tuple = (), track: bool = True) -> dict:
+    """
+    검색 결과를 압축합니다.
+
+    파라미터:
+        content: "[출처: URL]\\n본문" 블록을 빈 줄로 이어 붙인 검색 결과
+        keywords: 신호 판단 키워드 (출현 밀도로 문장 점수 계산)
+        token_budget: 결과 텍스트의 최대 토큰 (estimate_tokens 기준)
+        keep_patterns: 일치하면 최우선으로 보존할 정규식 (예: CONTACT_PATTERNS)
+        track: False이면 누적 통계에 넣지 않음 (토큰 예산 계획용 사전 계산)
+    반환값:
+        {"text", "tokens_before", "tokens_after", "sentences_before", "sentences_after",
+         "sources_before", "sources_after"}
+    """
+    blocks = split_sources(content)
+    result = {
+        'text': content or '',
+        'tokens_before': estimate_tokens(content) if content else 0,
+        'sentences_before': 0,
+        'sources_before': len(blocks),
+    }
+
+    pattern = _keyword_pattern(keywords)
+    candidates = []     # (점수, 블록 번호, 문장 번호, 문장)
+    seen = set()
+    kept_norms = []
+    for b_idx, (_, body) in enumerate(blocks):
+        for s_idx, sentence in enumerate(split_sentences(body)):
+            result['sentences_before'] += 1
+            if len(sentence) < MIN_SENTENCE_CHARS:
+                continue
+            norm = _NORMALIZE_RE.sub('', sentence).upper()
+            if not norm or norm in seen or (len(norm) >= 15 and any(norm in k for k in kept_norms)):
+                continue
+
+            upper = sentence.upper()
+            hits = len(pattern.findall(upper)) if pattern else 0
+            must_keep = any(p.search(sentence) for p in keep_patterns)
+            if not hits and not must_keep:
+                continue    # 저신호 (탐색 문구 포함)
+            if _NOISE_RE.search(sentence) and not must_keep and hits <= 1:
+                continue
+
+            seen.add(norm)
+            kept_norms.append(norm)
+            score = hits * 100.0 / (len(sentence) + 40) + (100.0 if must_keep else 0.0)
+            candidates.append((score, b_idx, s_idx, sentence))
+
+    if not candidates:
+        # 신호 문장이 하나도 없으면 원문 앞부분을 예산만큼 사용 (빈 프롬프트 방지)
+        text = (content or '')[:token_budget * 2]
+        result.update(text=text, tokens_after=estimate_tokens(text) if text else 0,
+                      sentences_after=0, sources_after=min(len(blocks), 1))
+        return _track(result) if track else result
+
+    # 점수 순으로 예산까지 선택 (출처 머리말 토큰 포함)
+    chosen = []
+    used = 0
+    header_used = set()
+    for score, b_idx, s_idx, sentence in sorted(candidates, key=lambda c: (-c[0], c[1], c[2])):
+        cost = estimate_tokens(sentence)
+        if b_idx not in header_used:
+            cost += estimate_tokens(f"[출처: {blocks[b_idx][0]}]")
+        if used + cost > token_budget:
+            continue
+        used += cost
+        header_used.add(b_idx)
+        chosen.append((b_idx, s_idx, sentence))
+
+    parts = []
+    current = None
+    for b_idx, _, sentence in sorted(chosen):
+        if b_idx != current:
+            parts.append(f"\n[출처: {blocks[b_idx][0]}]" if blocks[b_idx][0] else "\n")
+            current = b_idx
+        parts.append(sentence)
+    text = "\n".join(parts).strip()
+
+    result.update(
+        text=text,
+        tokens_after=estimate_tokens(text),
+        sentences_after=len(chosen),
+        sources_after=len(header_used),
+    )
+    return _track(result) if track else result
+
+
+def _track(result: dict) -> dict:
+    with _stats_lock:
+        _stats['calls'] += 1
+        _stats['tokens_before'] += result['tokens_before']
+        _stats['tokens_after'] += result['tokens_after']
+    return result
+
+
+def condense_evidence(content: str, keywords: list, token_budget: int,
+                      keep_patterns: tuple = (), track: bool = True) -> str:
+    """condense()의 텍스트만 반환합니다. EVIDENCE_CONDENSE=0 이면 원문 그대로."""
+    if not ENABLED or not content:
+        return content or ''
+    return condense(content, keywords, token_budget, keep_patterns, track)['text']
+
+
+def get_condense_stats() -> dict:
+    """프로세스 시작 후 누적 압축 통계 {"calls", "tokens_before", "tokens_after", "reduction"}."""
+    with _stats_lock:
+        stats = dict(_stats)
+    stats['reduction'] = (
+        round(1 - stats['tokens_after'] / stats['tokens_before'], 3) if stats['tokens_before'] else 0.0
+    )
+    return stats
@@ -0,0 +1,161 @@
+"""
+Gemini 응답 캐시 (프롬프트 지문 기반, 크롤러·문서 생성 공용)
+
+■ 목적
+  - 같은 학교·같은 Tavily 검색 결과로 만든 CAD 판별 프롬프트, 같은 레퍼런스 카드 입력처럼
+    재실행마다 동일한 저온도(temperature) 프롬프트를 다시 보내던 비용 제거
+  - 응답은 api_cache.db(utils/cache_store)에 저장, 용량 초과 시 LRU 정리
+
+■ 캐시 키
+  - sha256(모델명 + generationConfig + 프롬프트) — 설정이 하나라도 다르면 별도 항목
+
+■ 캐시 적용 기준
+  - temperature ≤ CACHE_MAX_TEMPERATURE(기본 0.3)이면 자동 적용
+  - 그보다 높으면(다양한 결과가 목적) 호출 시 cache=True로 명시한 경우에만 적용
+  - cache=False이면 항상 새로 생성
+
+■ API 호출
+  - 캐시 미적중 시 utils/llm_client.generate_content로 호출 (연결 재사용·재시도·마감 시간·호출 지표)
+  - stream_text: 스트리밍 생성 (조각 단위 yield), 끝까지 받은 최종 텍스트만 같은 캐시 키로 저장
+    → 이후 generate_text·stream_text 어느 쪽으로 요청해도 재사용
+
+■ 절감 통계
+  - 적중 시 원 응답의 토큰 수(usageMetadata)와 응답 시간을 절감량으로 누적
+  - get_gemini_cache_stats() → 호출처(source)별 적중률·절감 토큰·절감 시간
+"""
+import hashlib
+import json
+import os
+import time
+
+from utils.cache_store import get_cache_store
+from utils.llm_client import DEFAULT_MODEL, GeminiError, extract_text, generate_content, stream_content
+
+CACHE_NAMESPACE = 'gemini'
+
+# 이 온도 이하의 생성만 자동 캐시 (환경변수 GEMINI_CACHE_MAX_TEMPERATURE)
+CACHE_MAX_TEMPERATURE = float(os.getenv('GEMINI_CACHE_MAX_TEMPERATURE', '0.3'))
+
+# 캐시 보관 기간 (기본 30일, 환경변수 GEMINI_CACHE_TTL_DAYS)
+CACHE_TTL = int(os.getenv('GEMINI_CACHE_TTL_DAYS', '30')) * 24 * 3600
+
+
+def prompt_fingerprint(model: str, generation_config: dict, prompt: str) -> str:
+    """(모델, generationConfig, 프롬프트)의 내용 지문(sha256)을 반환합니다."""
+    raw = json.dumps(
+        {'model': model, 'config': generation_config or {}, 'prompt': prompt},
+        ensure_ascii=False, sort_keys=True,
+    )
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def is_cacheable(generation_config: dict, cache: bool = None) -> bool:
+    """캐시 적용 여부: cache 명시값 우선, 없으면 temperature 기준."""
+    if cache is not None:
+        return cache
+    temperature = (generation_config or {}).get('temperature', 1.0)
+    return temperature <= CACHE_MAX_TEMPERATURE
+
+
+def generate_text(prompt: str, api_key: str, generation_config: dict,
+                  model: str = DEFAULT_MODEL, timeout: float = 60,
+                  source: str = 'default', cache: bool = None, deadline: float = None) -> str:
+    """
+    Gemini generateContent를 호출하고 응답 텍스트를 반환합니다 (캐시 경유).
+    source  : 통계·호출 지표 구분용 호출처 이름 (예: 'cad_departments', 'contacts')
+    cache   : None이면 temperature 기준 자동, True/False로 강제 가능
+    timeout : 시도 1회 응답 대기 한도, deadline: 재시도 포함 전체 한도 (utils.llm_client 참조)
+    200 이외 응답은 GeminiError, 네트워크 오류는 requests 예외를 그대로 전달합니다.
+    """
+    use_cache = is_cacheable(generation_config, cache)
+    key = prompt_fingerprint(model, generation_config, prompt) if use_cache else None
+
+    if use_cache:
+        cached = _cached_response(key, source)
+        if cached is not None:
+            return cached
+
+    started = time.perf_counter()
+    data = generate_content(prompt, api_key, generation_config, model=model,
+                            timeout=timeout, deadline=deadline, source=source)
+    latency_ms = (time.perf_counter() - started) * 1000
+    text = extract_text(data)
+    if not use_cache:
+        return text
+
+    _store_response(key, text, model, data.get('usageMetadata', {}), latency_ms, source)
+    return text
+
+
+def _cached_response(key: str, source: str) -> str | None:
+    """캐시 적중 시 응답 텍스트를 반환하고 절감량을 기록합니다. 미적중이면 None."""
+    store = get_cache_store()
+    entry = store.get(CACHE_NAMESPACE, key)
+    if entry and not entry['expired']:
+        meta = entry['meta']
+        store.record(
+            CACHE_NAMESPACE, source, 'hits',
+            saved_tokens=meta.get('total_tokens', 0),
+            saved_ms=meta.get('latency_ms', 0),
+        )
+        return entry['value']
+    return None
+
+
+def _store_response(key: str, text: str, model: str, usage: dict, latency_ms: float, source: str) -> None:
+    store = get_cache_store()
+    store.record(CACHE_NAMESPACE, source, 'misses')
+    if text:
+        store.put(CACHE_NAMESPACE, key, text, CACHE_TTL, meta={
+            'model': model,
+            'prompt_tokens': usage.get('promptTokenCount', 0),
+            'output_tokens': usage.get('candidatesTokenCount', 0),
+            'total_tokens': usage.get('totalTokenCount', 0),
+            'latency_ms': round(latency_ms, 1),
+        }, source=source)
+        store.record(CACHE_NAMESPACE, source, 'stores')
+
+
+def stream_text(prompt: str, api_key: str, generation_config: dict,
+                model: str = DEFAULT_MODEL, timeout: float = 60,
+                source: str = 'default', cache: bool = None, deadline: float = None,
+                cancel_event=None):
+    """
+    Gemini 응답을 조각 단위로 yield합니다 (st.write_stream 등에 바로 전달 가능).
+    캐시 적중 시 저장된 전체 텍스트를 한 번에 yield하고, 미적중 시 스트리밍으로 받은 뒤
+    끝까지 받은 경우에만 최종 텍스트를 캐시에 저장합니다 (중단·취소된 부분 응답은 저장하지 않음).
+    cache·timeout·deadline은 generate_text와 같고, cancel_event(threading.Event)로 중단할 수 있습니다.
+    """
+    use_cache = is_cacheable(generation_config, cache)
+    key = prompt_fingerprint(model, generation_config, prompt) if use_cache else None
+
+    if use_cache:
+        cached = _cached_response(key, source)
+        if cached is not None:
+            yield cached
+            return
+
+    started = time.perf_counter()
+    stream = stream_content(prompt, api_key, generation_config, model=model, timeout=timeout,
+                            deadline=deadline, source=source, cancel_event=cancel_event)
+    chunks = []
+    try:
+        while True:
+            try:
+                chunk = next(stream)
+            except StopIteration as stop:
+                result = stop.value
+                break
+            chunks.append(chunk)
+            yield chunk
+    finally:
+        stream.close()   # 소비자가 중단하면 HTTP 스트림도 바로 닫음
+
+    if use_cache and result['completed']:
+        _store_response(key, ''.join(chunks), model, result['usage'],
+                        (time.perf_counter() - started) * 1000, source)
+
+
+def get_gemini_cache_stats() -> list:
+    """호출처별 Gemini 캐시 통계 (적중률, 절감 토큰 saved_tokens, 절감 시간 saved_ms)."""
+    return get_cache_store().stats(CACHE_NAMESPACE)
@@ -0,0 +1,191 @@
+"""
+외부 API GET 요청 디스크 캐시 (NEIS · 네이버 검색 · 나라장터 공용)
+
+■ 목적
+  - 학교알리미 재조회, 스케줄러 재시도처럼 몇 분 전에 받은 응답을 다시 요청하는 낭비 제거
+  - 소스별 TTL(유효 시간) 적용, 만료 후에는 ETag/Last-Modified가 있으면 조건부 재검증
+  - 요청 실패 시 STALE_IF_ERROR_SEC 이내의 만료 응답으로 대체 (스케줄러 작업 안정성)
+
+■ 캐시 키
+  - URL(쿼리스트링 포함) + params를 합쳐 파라미터 이름순 정렬
+  - serviceKey 등 인증 파라미터와 요청 헤더는 키에서 제외 → 키 교체 시에도 캐시 유지
+
+■ 사용법
+  res = cached_get(url, params=params, headers=headers, source='naver', timeout=10)
+  res.raise_for_status(); data = res.json()      # requests.Response와 같은 방식
+  get_http_cache_stats()                          # 소스별 적중률
+"""
+import hashlib
+import json
+import os
+import time
+import urllib.parse
+
+import requests
+
+from utils.cache_store import get_cache_store
+
+CACHE_NAMESPACE = 'http'
+
+# 소스별 TTL (초) — 환경변수 HTTP_CACHE_TTL_<SOURCE>로 조정 (0이면 캐시 미사용)
+SOURCE_TTL = {
+    'neis':   24 * 3600,   # 학교 기본정보·학과: 하루 단위로 거의 변하지 않음
+    'naver':  30 * 60,     # 뉴스 검색: 30분
+    'koneps': 60 * 60,     # 나라장터 공고/낙찰: 1시간
+}
+DEFAULT_TTL = 10 * 60
+
+# 요청 실패 시 만료된 응답을 대신 사용할 수 있는 최대 경과 시간
+STALE_IF_ERROR_SEC = 24 * 3600
+
+# 캐시 키에서 제외할 인증 파라미터 (소문자 비교)
+_EXCLUDED_PARAMS = {'servicekey', 'key', 'apikey', 'api_key', 'access_token'}
+
+
+class CachedResponse:
+    """requests.Response 대체 객체 (status_code, text, headers, json(), raise_for_status())."""
+
+    def __init__(self, status_code: int, text: str, headers: dict = None,
+                 url: str = '', from_cache: bool = False):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+        self.url = url
+        self.from_cache = from_cache
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}")
+
+
+def get_source_ttl(source: str) -> int:
+    """소스의 TTL(초)을 반환합니다 (환경변수 우선)."""
+    env = os.getenv(f"HTTP_CACHE_TTL_{(source or '').upper()}")
+    if env is not None and env.strip().lstrip('-').isdigit():
+        return int(env)
+    return SOURCE_TTL.get(source, DEFAULT_TTL)
+
+
+def normalize_request_key(url: str, params: dict = None) -> str:
+    """
+    요청을 정규화된 문자열로 변환합니다 (캐시 키 원문, 인증 파라미터 제외).
+    예: 'https://open.neis.go.kr/hub/schoolInfo?SCHUL_NM=인하대학교&Type=json&pIndex=1&pSize=100'
+    """
+    parsed = urllib.parse.urlsplit(url)
+    pairs = urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)
+    pairs += [(k, str(v)) for k, v in (params or {}).items() if v is not None]
+    pairs = sorted(
+        (k, v) for k, v in pairs if k.lower() not in _EXCLUDED_PARAMS
+    )
+    query = '&'.join(f"{k}={v}" for k, v in pairs)
+    return f"{parsed.scheme}://{parsed.netloc}{parsed.path}?{query}"
+
+
+def _cache_key(normalized: str) -> str:
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+
+def is_data_go_kr_success(res: CachedResponse) -> bool:
+    """공공데이터포털(나라장터) 응답이 정상(resultCode '00')인지 확인합니다 (오류 응답 캐시 방지)."""
+    try:
+        return res.json().get('response', {}).get('header', {}).get('resultCode') == '00'
+    except Exception:
+        return False
+
+
+def is_neis_success(res: CachedResponse) -> bool:
+    """
+    NEIS 응답이 정상(head RESULT CODE 'INFO-000')인지 확인합니다 (오류 응답 캐시 방지).
+    NEIS는 자료 없음(INFO-200)·일일 한도 초과(ERROR-337)·서버 오류도 HTTP 200 + 최상위 'RESULT'로 반환
+    """
+    try:
+        data = res.json()
+        if not isinstance(data, dict) or 'RESULT' in data:
+            return False
+        for val in data.values():
+            if isinstance(val, list) and val:
+                for item in val[0].get('head', []):
+                    if 'RESULT' in item:
+                        return item['RESULT'].get('CODE') == 'INFO-000'
+        return False
+    except Exception:
+        return False
+
+
+def cached_get(url: str, params: dict = None, headers: dict = None,
+               source: str = 'default', ttl: int = None, timeout: float = 10,
+               cacheable=None) -> CachedResponse:
+    """
+    캐시를 거쳐 GET 요청을 보냅니다.
+    source   : 'neis' / 'naver' / 'koneps' 등 — TTL·통계 구분 단위
+    ttl      : 지정 시 소스 기본 TTL 대신 사용 (0 이하면 캐시 미사용)
+    cacheable: (CachedResponse) → bool, 200 응답 중 저장할 응답 판별 (기본: 모두 저장)
+    요청 자체가 실패하고 쓸 수 있는 캐시도 없으면 requests 예외를 그대로 전달합니다.
+    """
+    ttl = get_source_ttl(source) if ttl is None else ttl
+    if ttl <= 0:
+        res = requests.get(url, params=params, headers=headers, timeout=timeout)
+        return CachedResponse(res.status_code, res.text, dict(res.headers), res.url)
+
+    store = get_cache_store()
+    normalized = normalize_request_key(url, params)
+    key = _cache_key(normalized)
+
+    entry = store.get(CACHE_NAMESPACE, key)
+    if entry and not entry['expired']:
+        store.record(CACHE_NAMESPACE, source, 'hits')
+        return _from_entry(entry, url)
+
+    req_headers = dict(headers or {})
+    if entry:
+        validators = entry['meta'].get('validators', {})
+        if validators.get('etag'):
+            req_headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            req_headers['If-Modified-Since'] = validators['last_modified']
+
+    try:
+        res = requests.get(url, params=params, headers=req_headers, timeout=timeout)
+    except requests.RequestException:
+        if entry and entry['expires_at'] + STALE_IF_ERROR_SEC > time.time():
+            store.record(CACHE_NAMESPACE, source, 'stale')
+            return _from_entry(entry, url)
+        raise
+
+    if res.status_code == 304 and entry:
+        store.touch(CACHE_NAMESPACE, key, ttl)
+        store.record(CACHE_NAMESPACE, source, 'revalidated')
+        return _from_entry(entry, url)
+
+    store.record(CACHE_NAMESPACE, source, 'misses')
+    response = CachedResponse(res.status_code, res.text, dict(res.headers), res.url)
+    if res.status_code == 200 and (cacheable is None or cacheable(response)):
+        store.put(CACHE_NAMESPACE, key, res.text, ttl, meta={
+            'source': source,
+            'request': normalized,
+            'content_type': res.headers.get('Content-Type', ''),
+            'validators': {
+                'etag': res.headers.get('ETag', ''),
+                'last_modified': res.headers.get('Last-Modified', ''),
+            },
+        }, source=source)
+        store.record(CACHE_NAMESPACE, source, 'stores')
+    return response
+
+
+def _from_entry(entry: dict, url: str) -> CachedResponse:
+    headers = {'Content-Type': entry['meta'].get('content_type', '')}
+    return CachedResponse(200, entry['value'], headers, url, from_cache=True)
+
+
+def get_http_cache_stats() -> list:
+    """소스별 HTTP 캐시 통계 (적중률 포함) — CacheStore.stats 참조."""
+    return get_cache_store().stats(CACHE_NAMESPACE)
+
+
+def clear_http_cache() -> int:
+    """HTTP 캐시 항목을 모두 삭제합니다. 반환값: 삭제 건수"""
+    return get_cache_store().clear(CACHE_NAMESPACE)
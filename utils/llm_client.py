@@ -0,0 +1,285 @@
+"""
+공용 LLM(Gemini) 클라이언트 — 연결 재사용 · 재시도 · 마감 시간 · JSON 스키마 응답 · 호출 지표
+
+■ 목적
+  - 호출처(레퍼런스 카드, Spec-in 문서, CAD 학과 판별, 담당자 추출)마다 요청마다 새 TCP/TLS 연결을
+    맺고 재시도 없이 제각각 타임아웃을 쓰던 Gemini REST 호출을 한 곳으로 통합
+  - 응답 캐시는 utils/gemini_cache.generate_text가 담당하고, 실제 API 호출은 이 모듈을 거침
+
+■ 연결 재사용
+  - 프로세스 공용 requests.Session (HTTPAdapter 연결 풀, 동시 스캔 스레드가 함께 사용)
+
+■ 재시도 (LLM_MAX_RETRIES, 기본 3회)
+  - 429 : 제공자 토큰 버킷(utils.rate_limiter)을 지수 백오프(+지터)만큼 멈춘 뒤 재시도 → 다른 스레드도 함께 감속
+  - 5xx·연결 오류·타임아웃 : 이 호출만 지수 백오프(+지터) 후 재시도
+  - 그 외 4xx : 재시도 없이 GeminiError
+
+■ 마감 시간 (deadline, 기본 LLM_DEADLINE_SEC=120초)
+  - 재시도·대기를 포함한 호출 전체 한도, 매 시도의 타임아웃은 min(timeout, 남은 시간)
+
+■ 스트리밍 (stream_content)
+  - streamGenerateContent(SSE)로 받은 텍스트 조각을 바로 yield → st.write_stream 등에서 즉시 표시
+  - 재시도는 첫 조각을 받기 전까지만, cancel_event 설정·소비 중단(generator close) 시 연결을 닫고 종료
+  - 첫 조각까지 걸린 시간(first_chunk_ms)도 호출 지표에 기록
+
+■ JSON 스키마 응답
+  - json_generation_config(schema) → responseMimeType=application/json + responseSchema
+  - generate_json() → 파싱된 dict/list 반환
+
+■ 호출 지표
+  - 실제 API 호출마다 llm_call_metrics 테이블에 호출처·모델·지연 시간(그중 속도 제한·백오프 대기 시간)·
+    토큰·시도 횟수·오류 기록
+  - db_manager.get_llm_call_summary() → 호출처별 호출 수·오류율·평균/p95 지연·대기 비율·토큰 합계
+"""
+import json
+import os
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils.rate_limiter import get_bucket
+
+GEMINI_API_BASE = "https://generativelanguage.googleapis.com/v1beta/models"
+DEFAULT_MODEL = "gemini-2.5-flash"
+
+PROVIDER = 'gemini'
+
+MAX_RETRIES = int(os.getenv('LLM_MAX_RETRIES', '3'))
+DEFAULT_DEADLINE_SEC = float(os.getenv('LLM_DEADLINE_SEC', '120'))
+BASE_BACKOFF_SEC = 1.0
+MAX_BACKOFF_SEC = 30.0
+
+POOL_SIZE = int(os.getenv('LLM_POOL_SIZE', '10'))
+
+# 재시도 대상 상태 코드 (429는 버킷 전체 감속, 나머지는 해당 호출만 대기)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class GeminiError(RuntimeError):
+    """Gemini API가 200 이외의 상태 코드를 반환했을 때 발생합니다."""
+
+    def __init__(self, status_code: int, body: str):
+        super().__init__(f"Gemini API 에러 [{status_code}]: {body[:200]}")
+        self.status_code = status_code
+        self.body = body
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """프로세스 공용 Session을 반환합니다 (최초 호출 시 연결 풀 생성)."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+            session.mount("https://", adapter)
+            session.headers.update({"Content-Type": "application/json"})
+            _session = session
+        return _session
+
+
+def json_generation_config(schema: dict, temperature: float = 0.1, max_tokens: int = 4096) -> dict:
+    """
+    JSON 스키마 응답 모드용 generationConfig를 만듭니다.
+    schema: Gemini responseSchema (OpenAPI 부분집합, 예: {"type": "ARRAY", "items": {...}})
+    """
+    return {
+        "temperature": temperature,
+        "maxOutputTokens": max_tokens,
+        "responseMimeType": "application/json",
+        "responseSchema": schema,
+    }
+
+
+def extract_text(data: dict) -> str:
+    """generateContent 응답에서 첫 번째 후보의 텍스트를 꺼냅니다."""
+    parts = (
+        data.get("candidates", [{}])[0]
+        .get("content", {})
+        .get("parts", [])
+    )
+    return parts[0].get("text", "") if parts else ""
+
+
+def _backoff(attempt: int) -> float:
+    delay = min(MAX_BACKOFF_SEC, BASE_BACKOFF_SEC * (2 ** attempt))
+    return delay + random.uniform(0, delay / 2)
+
+
+def _record(source: str, model: str, status: str, http_status: int, attempts: int,
+            latency_ms: float, wait_ms: float, usage: dict, error: str = None,
+            first_chunk_ms: float = None) -> None:
+    """호출 지표를 저장합니다 (지표 기록 실패가 호출 결과에 영향을 주지 않도록 예외 무시)."""
+    try:
+        from utils.db_manager import insert_llm_call_metric
+        insert_llm_call_metric({
+            'source': source,
+            'model': model,
+            'status': status,
+            'http_status': http_status,
+            'attempts': attempts,
+            'latency_ms': round(latency_ms, 1),
+            'wait_ms': round(wait_ms, 1),
+            'first_chunk_ms': round(first_chunk_ms, 1) if first_chunk_ms is not None else None,
+            'prompt_tokens': usage.get('promptTokenCount', 0),
+            'output_tokens': usage.get('candidatesTokenCount', 0),
+            'total_tokens': usage.get('totalTokenCount', 0),
+            'error': error,
+        })
+    except Exception as e:
+        print(f"[LLM 지표 기록 오류] {e}")
+
+
+def _post_with_retry(url: str, api_key: str, body: dict, timeout: float, ends_at: float, source: str,
+                     model: str, max_retries: int, started: float, stream: bool = False) -> tuple:
+    """
+    재시도 규칙(429 버킷 감속, 5xx·연결 오류 백오프, 마감 시간)에 따라 POST하고
+    (200 응답, 시도 횟수, 대기 시간 ms)를 반환합니다. 최종 실패 시 지표를 기록하고 예외를 전달합니다.
+    API 키는 x-goog-api-key 헤더로 보냄 (URL에 넣으면 예외 메시지 → llm_call_metrics·로그에 키가 남음)
+    """
+    session = get_session()
+    bucket = get_bucket(PROVIDER)
+    max_retries = MAX_RETRIES if max_retries is None else max_retries
+
+    attempt = 0
+    wait_ms = 0.0   # 속도 제한·백오프 대기 시간 (지연 시간 중 API 외 시간)
+    while True:
+        attempt += 1
+        remaining = ends_at - time.perf_counter()
+        error = None
+        status = None
+        wait_started = time.perf_counter()
+        acquired = remaining > 0 and bucket.acquire(timeout=remaining)
+        wait_ms += (time.perf_counter() - wait_started) * 1000
+        if acquired:
+            try:
+                res = session.post(url, json=body, stream=stream, headers={'x-goog-api-key': api_key},
+                                   timeout=max(1.0, min(timeout, ends_at - time.perf_counter())))
+                status = res.status_code
+                if status == 200:
+                    return res, attempt, wait_ms
+                error = GeminiError(status, res.text)
+                res.close()
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                error = e
+        else:
+            error = TimeoutError(f"LLM 호출 마감 시간 초과 ({(ends_at - started):.0f}초)")
+
+        retryable = (status in RETRY_STATUS) if status is not None else not isinstance(error, TimeoutError)
+        delay = _backoff(attempt - 1)
+        if not retryable or attempt > max_retries or time.perf_counter() + delay >= ends_at:
+            _record(source, model, 'error', status, attempt,
+                    (time.perf_counter() - started) * 1000, wait_ms, {}, str(error)[:300])
+            raise error
+
+        if status == 429:
+            bucket.pause(delay)     # 같은 제공자를 쓰는 다른 스레드도 함께 대기 (다음 acquire에서 대기)
+        else:
+            time.sleep(delay)
+            wait_ms += delay * 1000
+
+
+def _request_body(prompt: str, generation_config: dict) -> dict:
+    return {
+        "contents": [{"parts": [{"text": prompt}]}],
+        "generationConfig": generation_config,
+    }
+
+
+def generate_content(prompt: str, api_key: str, generation_config: dict,
+                     model: str = DEFAULT_MODEL, timeout: float = 60,
+                     deadline: float = None, source: str = 'default',
+                     max_retries: int = None) -> dict:
+    """
+    Gemini generateContent를 호출하고 응답 JSON 전체를 반환합니다 (캐시 없음).
+    timeout : 시도 1회의 응답 대기 한도(초)
+    deadline: 재시도·대기를 포함한 전체 한도(초, 기본 LLM_DEADLINE_SEC)
+    200 이외 응답은 GeminiError, 네트워크 오류는 requests 예외를 그대로 전달합니다.
+    """
+    started = time.perf_counter()
+    ends_at = started + (deadline or DEFAULT_DEADLINE_SEC)
+    res, attempts, wait_ms = _post_with_retry(
+        f"{GEMINI_API_BASE}/{model}:generateContent", api_key,
+        _request_body(prompt, generation_config),
+        timeout, ends_at, source, model, max_retries, started,
+    )
+    data = res.json()
+    _record(source, model, 'ok', 200, attempts, (time.perf_counter() - started) * 1000, wait_ms,
+            data.get('usageMetadata', {}))
+    return data
+
+
+def _iter_sse_data(res):
+    """SSE 응답에서 'data:' 줄의 JSON 객체를 차례로 반환합니다."""
+    # text/event-stream에 charset이 없으면 requests가 ISO-8859-1로 디코딩 → 한글 깨짐 (SSE는 항상 UTF-8)
+    res.encoding = 'utf-8'
+    for line in res.iter_lines(chunk_size=None, decode_unicode=True):
+        if line and line.startswith('data:'):
+            payload = line[5:].strip()
+            if payload and payload != '[DONE]':
+                yield json.loads(payload)
+
+
+def stream_content(prompt: str, api_key: str, generation_config: dict,
+                   model: str = DEFAULT_MODEL, timeout: float = 60,
+                   deadline: float = None, source: str = 'default',
+                   max_retries: int = None, cancel_event: threading.Event = None):
+    """
+    Gemini streamGenerateContent를 호출하고 텍스트 조각을 받는 대로 yield합니다 (캐시 없음).
+    cancel_event가 설정되거나 소비자가 중단(close)하면 연결을 닫고 멈춥니다.
+    반환값(StopIteration.value, 'yield from'으로 받음):
+        {"usage": usageMetadata, "completed": 끝까지 받았는지 여부}
+    """
+    started = time.perf_counter()
+    ends_at = started + (deadline or DEFAULT_DEADLINE_SEC)
+    res, attempts, wait_ms = _post_with_retry(
+        f"{GEMINI_API_BASE}/{model}:streamGenerateContent?alt=sse", api_key,
+        _request_body(prompt, generation_config),
+        timeout, ends_at, source, model, max_retries, started, stream=True,
+    )
+
+    usage = {}
+    first_chunk_ms = None
+    status = 'cancelled'
+    error = None
+    try:
+        for data in _iter_sse_data(res):
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            usage = data.get('usageMetadata', usage)
+            text = extract_text(data)
+            if text:
+                if first_chunk_ms is None:
+                    first_chunk_ms = (time.perf_counter() - started) * 1000
+                yield text
+        else:
+            status = 'ok'
+    except Exception as e:
+        status = 'error'
+        error = str(e)[:300]
+        raise
+    finally:
+        res.close()
+        _record(source, model, status, 200, attempts, (time.perf_counter() - started) * 1000,
+                wait_ms, usage, error, first_chunk_ms=first_chunk_ms)
+    return {'usage': usage, 'completed': status == 'ok'}
+
+
+def generate_json(prompt: str, api_key: str, schema: dict, temperature: float = 0.1,
+                  max_tokens: int = 4096, **kwargs):
+    """
+    JSON 스키마 응답 모드로 호출하고 파싱된 결과(dict/list)를 반환합니다 (캐시 없음).
+    응답이 JSON이 아니면 ValueError.
+    """
+    data = generate_content(prompt, api_key, json_generation_config(schema, temperature, max_tokens), **kwargs)
+    text = extract_text(data)
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"JSON 응답 파싱 실패: {e} — {text[:200]}")
@@ -0,0 +1,132 @@
+"""
+외부 API 제공자별 토큰 버킷 속도 제한 + 429 백오프
+
+■ 목적
+  - 동시 스캔(여러 스레드)에서도 Tavily·Gemini 호출 속도를 제공자별 한도 안으로 유지
+  - 고정 sleep(학교 간 2초, 학과 간 1초) 대신 필요한 만큼만 대기
+
+■ 설정 (환경변수, 제공자 이름은 대문자)
+  - RATE_LIMIT_<PROVIDER>_PER_MIN : 분당 허용 요청 수
+  - RATE_LIMIT_<PROVIDER>_BURST   : 순간 최대 요청 수 (버킷 크기)
+  예) RATE_LIMIT_GEMINI_PER_MIN=60, RATE_LIMIT_TAVILY_BURST=10
+
+■ 429 처리
+  - call_with_backoff가 429(요청 한도 초과)를 감지하면 해당 제공자 버킷 전체를
+    지수 백오프(+지터) 시간만큼 멈춘 뒤 재시도 → 다른 스레드도 함께 감속
+"""
+import os
+import random
+import threading
+import time
+
+# 제공자별 기본 한도 (분당 요청 수, 버킷 크기)
+DEFAULT_LIMITS = {
+    'tavily': (60, 5),
+    'gemini': (15, 3),
+}
+_FALLBACK_LIMIT = (30, 3)
+
+MAX_RETRIES = 4
+BASE_BACKOFF_SEC = 2.0
+MAX_BACKOFF_SEC = 60.0
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷 (rate_per_sec 속도로 채워지고 capacity까지 보관)."""
+
+    def __init__(self, rate_per_sec: float, capacity: int):
+        self.rate = rate_per_sec
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: int = 1, timeout: float = None) -> bool:
+        """토큰을 얻을 때까지 대기합니다. timeout 초과 시 False."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self._paused_until and self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return True
+                wait = max(
+                    self._paused_until - now,
+                    (tokens - self._tokens) / self.rate if self.rate > 0 else 1.0,
+                )
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(max(wait, 0.01))
+
+    def pause(self, seconds: float) -> None:
+        """버킷을 seconds 동안 멈춥니다 (429 응답 시, 이미 더 길게 멈춰 있으면 유지)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+
+def _provider_limit(provider: str) -> tuple:
+    per_min, burst = DEFAULT_LIMITS.get(provider, _FALLBACK_LIMIT)
+    prefix = f"RATE_LIMIT_{provider.upper()}"
+    try:
+        per_min = float(os.getenv(f"{prefix}_PER_MIN", per_min))
+        burst = int(os.getenv(f"{prefix}_BURST", burst))
+    except ValueError:
+        pass
+    return per_min, burst
+
+
+def get_bucket(provider: str) -> TokenBucket:
+    """제공자별 공용 토큰 버킷을 반환합니다 (최초 호출 시 환경변수 설정으로 생성)."""
+    with _buckets_lock:
+        if provider not in _buckets:
+            per_min, burst = _provider_limit(provider)
+            _buckets[provider] = TokenBucket(per_min / 60.0, burst)
+        return _buckets[provider]
+
+
+def is_rate_limited_error(exc: Exception) -> bool:
+    """
+    예외가 429(요청 한도 초과)인지 판별합니다.
+    HTTP 상태 코드(status_code·response.status_code·code)가 있으면 그것만 보고,
+    없을 때만 메시지로 판별합니다 ('429'만으로는 판단하지 않음 — 학교 ID·금액 등 숫자 오탐 방지).
+    """
+    status = getattr(exc, 'status_code', None)
+    if status is None:
+        status = getattr(getattr(exc, 'response', None), 'status_code', None)
+    if status is None and isinstance(getattr(exc, 'code', None), int):
+        status = exc.code
+    if status is not None:
+        return status == 429
+    msg = str(exc).lower()
+    return 'too many requests' in msg or 'resource_exhausted' in msg or 'rate limit' in msg
+
+
+def call_with_backoff(provider: str, fn, *args, max_retries: int = MAX_RETRIES, **kwargs):
+    """
+    제공자 버킷에서 토큰을 얻은 뒤 fn(*args, **kwargs)를 호출합니다.
+    429 응답이면 버킷을 지수 백오프만큼 멈추고 재시도하며, 그 외 예외는 그대로 전달합니다.
+    """
+    bucket = get_bucket(provider)
+    for attempt in range(max_retries + 1):
+        bucket.acquire()
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            if attempt >= max_retries or not is_rate_limited_error(e):
+                raise
+            delay = min(MAX_BACKOFF_SEC, BASE_BACKOFF_SEC * (2 ** attempt))
+            bucket.pause(delay + random.uniform(0, delay / 2))
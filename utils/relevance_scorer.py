@@ -0,0 +1,229 @@
+"""
+가중치 키워드 그룹 기반 관련성 점수 엔진 (뉴스·R&D 크롤러 공용)
+
+■ 목적
+  - 크롤러마다 any(k in text for k in 목록)를 목록 수만큼 반복하던 필터/점수 계산을 통합
+  - 모든 그룹의 키워드를 정규식 1개로 컴파일 → 텍스트 1회 스캔으로 그룹별 적중 여부 계산
+  - 여러 기사를 한 번에 스캔하는 배치 모드 제공 (score_batch)
+
+■ 동작 방식
+  - 대소문자 무시 (텍스트·키워드 모두 대문자로 비교)
+  - 키워드 포함 여부는 기존 부분 문자열 검사(k in text)와 동일한 결과
+    (긴 키워드 우선 매칭 + 매칭 시작 위치 다음 글자부터 재탐색 → 겹친 키워드도 누락 없음)
+  - 모든 그룹이 적중하면 스캔 조기 종료
+
+■ 사용법
+  scorer = RelevanceScorer([
+      KeywordGroup('product', ['CATIA', '솔리드웍스'], weight=30),
+      KeywordGroup('exclude', ['채용', '모집']),
+  ])
+  scorer.match(text)        → (True, False)         # 그룹 순서대로 적중 벡터
+  scorer.score(text)        → 30                    # 적중 그룹 가중치 합 (최대 100)
+  scorer.score_batch(texts) → ([점수, ...], [적중 벡터, ...])
+"""
+import bisect
+import re
+import time
+
+# 배치 스캔 시 기사 사이 구분자 (키워드에 포함될 수 없는 문자)
+_BATCH_SEPARATOR = '\n'
+
+_MAX_SCORE = 100
+
+
+class KeywordGroup:
+    """이름 + 키워드 목록 + 가중치 (가중치 0이면 필터 전용 그룹)."""
+
+    def __init__(self, name: str, keywords: list, weight: int = 0):
+        self.name = name
+        self.keywords = list(keywords)
+        self.weight = weight
+
+    def __repr__(self) -> str:
+        return f"KeywordGroup({self.name!r}, {len(self.keywords)} keywords, weight={self.weight})"
+
+
+class RelevanceScorer:
+    """키워드 그룹 목록을 1개 정규식으로 컴파일해 적중 벡터/점수를 계산합니다."""
+
+    def __init__(self, groups: list, max_score: int = _MAX_SCORE):
+        self.groups = list(groups)
+        self.names = tuple(g.name for g in self.groups)
+        self.weights = tuple(g.weight for g in self.groups)
+        self.max_score = max_score
+
+        # 키워드(대문자) → 적중시키는 그룹 번호 집합
+        owners = {}
+        for idx, group in enumerate(self.groups):
+            for kw in group.keywords:
+                kw = kw.upper()
+                if kw and _BATCH_SEPARATOR not in kw:
+                    owners.setdefault(kw, set()).add(idx)
+
+        # 같은 위치에서 시작하는 짧은 키워드(접두어)는 긴 키워드 매칭에 가려지므로 미리 합침
+        self._covers = {
+            kw: frozenset().union(*(owners[p] for p in owners if kw.startswith(p)))
+            for kw in owners
+        }
+        self._pattern = re.compile(
+            '|'.join(re.escape(k) for k in sorted(owners, key=len, reverse=True))
+        ) if owners else None
+        self._all = frozenset(range(len(self.groups)))
+
+    def __repr__(self) -> str:
+        return f"RelevanceScorer({list(self.names)})"
+
+    def index(self, name: str) -> int:
+        """그룹 이름의 적중 벡터 위치를 반환합니다."""
+        return self.names.index(name)
+
+    def _scan(self, text: str, start: int = 0, end: int = None) -> set:
+        """text[start:end] 구간에서 적중한 그룹 번호 집합을 반환합니다 (대문자 텍스트 기준)."""
+        hit = set()
+        if self._pattern is None:
+            return hit
+        end = len(text) if end is None else end
+        search = self._pattern.search
+        pos = start
+        while True:
+            m = search(text, pos, end)
+            if m is None:
+                break
+            hit |= self._covers[m.group()]
+            if len(hit) == len(self._all):
+                break
+            pos = m.start() + 1
+        return hit
+
+    def _vector(self, hit: set) -> tuple:
+        return tuple(i in hit for i in range(len(self.groups)))
+
+    def _weighted(self, hit: set) -> int:
+        return min(sum(self.weights[i] for i in hit), self.max_score)
+
+    def match(self, text: str) -> tuple:
+        """그룹 순서대로 적중 여부(bool) 벡터를 반환합니다."""
+        return self._vector(self._scan((text or '').upper()))
+
+    def score(self, text: str) -> int:
+        """적중한 그룹 가중치의 합(최대 max_score)을 반환합니다."""
+        return self._weighted(self._scan((text or '').upper()))
+
+    def score_batch(self, texts: list) -> tuple:
+        """
+        여러 텍스트를 이어 붙여 1회 스캔으로 점수를 계산합니다.
+        반환값: ([점수, ...], [적중 벡터, ...]) — 입력 순서 유지
+        """
+        texts = [(t or '').replace(_BATCH_SEPARATOR, ' ').upper() for t in texts]
+        if not texts:
+            return [], []
+
+        joined = _BATCH_SEPARATOR.join(texts)
+        starts = []
+        offset = 0
+        for t in texts:
+            starts.append(offset)
+            offset += len(t) + 1
+
+        hits = [set() for _ in texts]
+        if self._pattern is not None:
+            search = self._pattern.search
+            covers = self._covers
+            full = len(self._all)
+            last = len(starts) - 1
+            idx = 0
+            pos = 0
+            while True:
+                m = search(joined, pos)
+                if m is None:
+                    break
+                pos = m.start()
+                if idx < last and pos >= starts[idx + 1]:
+                    # 매칭은 앞에서부터 순서대로 나오므로 이분 탐색은 텍스트를 건너뛸 때만 사용
+                    idx = bisect.bisect_right(starts, pos, idx + 1) - 1
+                hit = hits[idx]
+                hit |= covers[m.group()]
+                if len(hit) == full:
+                    if idx == last:
+                        break
+                    idx += 1
+                    pos = starts[idx]   # 모든 그룹 적중 → 다음 텍스트로 건너뜀
+                else:
+                    pos += 1
+
+        return [self._weighted(h) for h in hits], [self._vector(h) for h in hits]
+
+
+# ──────────────────────────────────────────────
+# 정합성 검증 / 벤치마크
+# ──────────────────────────────────────────────
+
+def _legacy_match(scorer: RelevanceScorer, text: str) -> tuple:
+    """기존 방식(그룹마다 any() 반복)으로 적중 벡터를 계산합니다 — 비교 기준."""
+    upper = (text or '').upper()
+    return tuple(any(k.upper() in upper for k in g.keywords) for g in scorer.groups)
+
+
+def _collect_texts(samples: list) -> list:
+    """문자열 목록 또는 네이버 API 응답(JSON dict) 목록에서 '제목 + 요약' 텍스트를 모읍니다."""
+    from utils.text_normalizer import clean_snippet
+
+    texts = []
+    for s in samples:
+        if isinstance(s, str):
+            texts.append(s)
+        elif isinstance(s, dict):
+            items = s.get('items') if 'items' in s else [s]
+            for item in items or []:
+                texts.append(
+                    clean_snippet(item.get('title', '')) + ' '
+                    + clean_snippet(item.get('description', ''))
+                )
+    return texts
+
+
+def benchmark_scorers(scorers: dict, samples: list, repeat: int = 5) -> list:
+    """
+    저장해 둔 뉴스 배치로 기존 any() 방식과 통합 스코어러(단건/배치)를 비교합니다.
+    scorers: {'이름': RelevanceScorer, ...} (예: {'ntis': crawler_ntis._SCORER})
+    samples: 기사 텍스트 목록 또는 네이버 API 응답(JSON dict) 목록
+    반환값: [{'scorer', 'items', 'groups', 'keywords', 'legacy_ms', 'single_ms',
+              'batch_ms', 'speedup', 'mismatches'}, ...]
+    ※ mismatches: 기존 방식과 적중 벡터가 다른 건수 (0이어야 정상)
+    """
+    texts = _collect_texts(samples)
+    result = []
+    for name, scorer in scorers.items():
+        mismatches = sum(
+            1 for t in texts if _legacy_match(scorer, t) != scorer.match(t)
+        )
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for t in texts:
+                _legacy_match(scorer, t)
+        legacy_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for t in texts:
+                scorer.match(t)
+        single_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            scorer.score_batch(texts)
+        batch_ms = (time.perf_counter() - start) * 1000
+
+        result.append({
+            'scorer': name,
+            'items': len(texts),
+            'groups': len(scorer.groups),
+            'keywords': sum(len(g.keywords) for g in scorer.groups),
+            'legacy_ms': round(legacy_ms, 2),
+            'single_ms': round(single_ms, 2),
+            'batch_ms': round(batch_ms, 2),
+            'speedup': round(legacy_ms / single_ms, 1) if single_ms else None,
+            'mismatches': mismatches,
+        })
+    return result
@@ -0,0 +1,298 @@
+"""
+구매 신호 규칙 엔진 (수집 데이터 저장 시 신호 자동 생성 — 모든 출처 공용)
+
+■ 목적
+  - 크롤러마다 따로 두던 "점수 N 이상이면 insert_purchase_signal" 인라인 판정을 선언형 규칙으로 통합
+  - 나라장터 입찰·사전규격·교육청 공고·재정지원사업 뉴스·교육부 선정 발표처럼
+    신호로 이어지지 않던 강한 구매 지표도 같은 수집 작업 안에서 바로 신호로 생성
+
+■ 동작 방식
+  - 규칙 = 출처 테이블 + 행 조건 + 키워드 그룹(가중치·필수·제외) + 학교 해석 + 점수식
+  - 출처별 키워드 그룹은 규칙 생성 시 RelevanceScorer 정규식 1개로 컴파일
+  - db_manager의 insert_* 함수가 새로 저장된 행만 모아 get_signal_deriver(출처)로 한 번에 평가
+    → 같은 트랜잭션 안에서 purchase_signals에 upsert (추가 테이블 스캔 없음)
+  - 점수 = min(기본 점수 + 점수 컬럼 + 키워드 가중치 합, 100), min_score 미만이면 버림
+  - 학교 = school_fields 값을 타겟 학교로 해석 → 안 되면 본문에서 가장 많이 언급된 학교
+    → 그래도 없으면 require_target=False인 규칙만 원래 값(예: 교육청명) 사용
+  - 감지 시각 = date_field(공고일·게시일) 값 (없거나 해석 불가면 저장 시각)
+    → max_age_days보다 오래된 행은 신호를 만들지 않음 (과거 N년치 백필 공고가 최신 신호로 잡히지 않도록)
+
+■ 측정
+  - get_signal_rule_stats() → 규칙별 평가 행 수·생성 신호 수·학교 미해석·기간 초과로 버린 행 수
+"""
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+import threading
+
+from utils.relevance_scorer import RelevanceScorer, KeywordGroup
+
+_MAX_SCORE = 100
+
+# 제품·분야 키워드 (출처 공통)
+PRODUCT_KEYWORDS = ['CATIA', '카티아', 'SOLIDWORKS', '솔리드웍스', '3DEXPERIENCE', 'SIMULIA', 'DELMIA', 'ENOVIA']
+CAD_KEYWORDS = ['CAD', 'CAM', 'CAE', 'PLM', '3D설계', '3D 설계', '3D 모델링', '설계 소프트웨어']
+LAB_KEYWORDS = ['실습실', '실습장비', '기자재', '교육장비', '실험실습', '스마트팩토리', '디지털트윈']
+
+
+class SignalRule:
+    """
+    출처 테이블의 새 행 → 구매 신호 변환 규칙.
+
+    source        : 출처 테이블명 ('bid_history', 'grants', 'ntis_projects', 'univ_bids', 'edu_policy_news')
+    signal_type   : 생성할 신호 유형
+    where         : {컬럼: 허용 값 튜플} — 모두 만족하는 행만 평가 (값이 없으면 '' 로 비교)
+    text_fields   : 키워드를 찾을 컬럼 (공백으로 이어 붙여 스캔)
+    groups        : KeywordGroup 목록 (weight가 점수에 더해짐)
+    require/exclude: 반드시 적중해야 하는 / 적중하면 버리는 그룹 이름
+    base_score    : 기본 점수, score_field: 점수에 더할 숫자 컬럼 (예: relevance_score)
+    school_fields : 학교명이 들어 있는 컬럼 (split_schools=True면 ',' 구분 여러 학교 → 학교마다 신호)
+    title_field / detail / url_field: 신호 제목 컬럼, 상세 형식 문자열('{컬럼}' 치환) 또는 함수(row → str), 출처 URL 컬럼
+    date_field    : 공고일·게시일 컬럼 → 신호 감지 시각, max_age_days: 이보다 오래된 행은 신호 생성 안 함
+    """
+
+    def __init__(self, name: str, source: str, signal_type: str, label: str,
+                 text_fields: tuple, title_field: str, school_fields: tuple,
+                 groups: list = (), require: tuple = (), exclude: tuple = (), where: dict = None,
+                 base_score: int = 0, score_field: str = None, min_score: int = 0,
+                 detail='', url_field: str = None,
+                 require_target: bool = True, split_schools: bool = False,
+                 date_field: str = None, max_age_days: int = None):
+        self.name = name
+        self.source = source
+        self.signal_type = signal_type
+        self.label = label
+        self.text_fields = tuple(text_fields)
+        self.title_field = title_field
+        self.school_fields = tuple(school_fields)
+        self.where = dict(where or {})
+        self.base_score = base_score
+        self.score_field = score_field
+        self.min_score = min_score
+        self.detail = detail
+        self.url_field = url_field
+        self.require_target = require_target
+        self.split_schools = split_schools
+        self.date_field = date_field
+        self.max_age_days = max_age_days
+        self.scorer = RelevanceScorer(list(groups), max_score=_MAX_SCORE)
+        self._require = tuple(self.scorer.index(g) for g in require)
+        self._exclude = tuple(self.scorer.index(g) for g in exclude)
+
+    def __repr__(self) -> str:
+        return f"SignalRule({self.name!r}, source={self.source!r}, type={self.signal_type!r})"
+
+    def _text(self, row: dict) -> str:
+        return ' '.join(str(row.get(f) or '') for f in self.text_fields)
+
+    def _accepts(self, row: dict) -> bool:
+        return all(str(row.get(col) or '') in allowed for col, allowed in self.where.items())
+
+    def _schools(self, row: dict, text: str, resolver) -> list:
+        raw = []
+        for field in self.school_fields:
+            value = str(row.get(field) or '')
+            raw.extend(v.strip() for v in (value.split(',') if self.split_schools else [value]) if v.strip())
+        schools = []
+        for value in raw:
+            name = resolver.resolve_name(value) if resolver is not None else None
+            if name and name not in schools:
+                schools.append(name)
+        if not schools and resolver is not None:
+            match = resolver.primary_match(text)
+            if match:
+                schools.append(match['school_name'])
+        if not schools and not self.require_target and raw:
+            schools.append(raw[0])
+        return schools
+
+    def _detected_at(self, row: dict, now: datetime):
+        """date_field 값 → 감지 시각 (해석 불가면 None, 미래 날짜는 현재 시각으로)."""
+        parsed = _parse_date(row.get(self.date_field)) if self.date_field else None
+        return min(parsed, now) if parsed else None
+
+    def _detail(self, row: dict) -> str:
+        if callable(self.detail):
+            return str(self.detail(row) or '')[:150]
+        return self.detail.format_map(_Blank(row))[:150] if self.detail else ''
+
+    def evaluate(self, rows: list, resolver) -> tuple:
+        """
+        새 행 목록을 평가해 신호 목록을 만듭니다 (키워드는 배치 1회 스캔).
+        반환값: ([신호 dict, ...], 학교 미해석으로 버린 행 수, 기간 초과로 버린 행 수)
+        """
+        rows = [r for r in rows if self._accepts(r)]
+        if not rows:
+            return [], 0, 0
+        now = datetime.now()
+        cutoff = now - timedelta(days=self.max_age_days) if self.max_age_days else None
+        dated = [(r, self._detected_at(r, now)) for r in rows]
+        expired = sum(1 for _, d in dated if cutoff and d and d < cutoff)
+        dated = [(r, d) for r, d in dated if not (cutoff and d and d < cutoff)]
+        if not dated:
+            return [], 0, expired
+        rows = [r for r, _ in dated]
+        texts = [self._text(r) for r in rows]
+        scores, vectors = self.scorer.score_batch(texts)
+        signals = []
+        unresolved = 0
+        for (row, detected), text, keyword_score, hit in zip(dated, texts, scores, vectors):
+            if any(not hit[i] for i in self._require) or any(hit[i] for i in self._exclude):
+                continue
+            try:
+                field_score = int(float(row.get(self.score_field) or 0)) if self.score_field else 0
+            except (TypeError, ValueError):
+                field_score = 0
+            score = min(self.base_score + field_score + keyword_score, _MAX_SCORE)
+            if score < self.min_score:
+                continue
+            schools = self._schools(row, text, resolver)
+            if not schools:
+                unresolved += 1
+                continue
+            detail = self._detail(row)
+            for school in schools:
+                signal = {
+                    'school_name': school,
+                    'signal_type': self.signal_type,
+                    'signal_title': str(row.get(self.title_field) or '')[:200],
+                    'signal_detail': detail,
+                    'signal_score': score,
+                    'source': self.label,
+                    'source_url': str(row.get(self.url_field) or '') if self.url_field else '',
+                }
+                if detected:
+                    signal['detected_at'] = detected.strftime("%Y-%m-%d %H:%M:%S")
+                signals.append(signal)
+        return signals, unresolved, expired
+
+
+def _parse_date(value):
+    """공고일·게시일 문자열 → datetime ('YYYY-MM-DD…', 'YYYYMMDD…', RFC 822 뉴스 pubDate). 해석 불가면 None."""
+    value = str(value or '').strip()
+    if not value:
+        return None
+    for fmt, size in (("%Y-%m-%d", 10), ("%Y%m%d", 8), ("%Y/%m/%d", 10), ("%Y.%m.%d", 10)):
+        try:
+            return datetime.strptime(value[:size], fmt)
+        except ValueError:
+            continue
+    try:
+        return parsedate_to_datetime(value).replace(tzinfo=None)
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+class _Blank(dict):
+    """detail 형식 문자열용 — 없는 컬럼은 빈 문자열."""
+
+    def __missing__(self, key):
+        return ''
+
+
+# ──────────────────────────────────────────────
+# 규칙 정의 (출처 → 신호)
+#   점수 기준: 대학 입찰 뉴스 70 · 사전규격 75 (스펙인 단계) · 입찰 공고 60 ·
+#             교육청 공고 55 · 재정지원 선정 뉴스 50 · 교육부 선정 발표 45 (+ 제품·분야 키워드 가중치)
+# ──────────────────────────────────────────────
+
+_PRODUCT_GROUPS = [
+    KeywordGroup('product', PRODUCT_KEYWORDS, weight=20),
+    KeywordGroup('cad', CAD_KEYWORDS, weight=10),
+    KeywordGroup('lab', LAB_KEYWORDS, weight=5),
+]
+
+SIGNAL_RULES = [
+    SignalRule(
+        'koneps_pre_spec', 'bid_history', '사전규격', '나라장터 사전규격',
+        text_fields=('bid_title', 'demand_agency'), title_field='bid_title', school_fields=('demand_agency',),
+        where={'bid_type': ('사전규격',)}, groups=_PRODUCT_GROUPS, base_score=75, min_score=75,
+        detail='{demand_agency} · 예산 {bid_price}', date_field='contract_date', max_age_days=120,
+    ),
+    SignalRule(
+        'koneps_bid', 'bid_history', '나라장터 입찰', '나라장터 입찰공고',
+        text_fields=('bid_title', 'demand_agency'), title_field='bid_title', school_fields=('demand_agency',),
+        where={'bid_type': ('입찰공고', '')}, groups=_PRODUCT_GROUPS, base_score=60, min_score=60,
+        detail='{demand_agency} · 예산 {bid_price}', date_field='contract_date', max_age_days=90,
+    ),
+    SignalRule(
+        'edu_office_bid', 'bid_history', '교육청 공고', '나라장터 교육청 발주',
+        text_fields=('bid_title', 'demand_agency'), title_field='bid_title', school_fields=('demand_agency',),
+        where={'bid_type': ('교육청공고',)}, groups=_PRODUCT_GROUPS, base_score=55, min_score=55,
+        detail='{demand_agency} · 예산 {bid_price}', require_target=False,
+        date_field='contract_date', max_age_days=90,
+    ),
+    SignalRule(
+        'grant_news', 'grants', '재정지원사업', '재정지원사업 뉴스',
+        text_fields=('project_name',), title_field='project_name', school_fields=('selected_school',),
+        groups=_PRODUCT_GROUPS, base_score=50, min_score=50,
+        detail='{status}', url_field='notice_url',
+    ),
+    SignalRule(
+        'edu_policy_selection', 'edu_policy_news', '정책사업 선정', '교육부 선정 발표',
+        text_fields=('title', 'description'), title_field='title', school_fields=('detected_schools',),
+        groups=_PRODUCT_GROUPS, base_score=45, min_score=45,
+        detail='{policy_type} 선정', url_field='source_url', split_schools=True,
+    ),
+    SignalRule(
+        'ntis_research', 'ntis_projects', 'R&D 과제', 'NTIS 뉴스',
+        text_fields=('project_name',), title_field='project_name', school_fields=('lead_agency',),
+        score_field='relevance_score', min_score=50,
+        detail=lambda r: f"연구자: {r['lead_researcher']}" if r.get('lead_researcher') else str(r.get('description') or '')[:100],
+        url_field='source_url',
+    ),
+    SignalRule(
+        'univ_bid_news', 'univ_bids', '대학 입찰', '산학협력단 뉴스',
+        text_fields=('bid_title',), title_field='bid_title', school_fields=('school_name',),
+        base_score=70, min_score=70,
+        detail='{description}', url_field='bid_url', date_field='pub_date', max_age_days=90,
+    ),
+]
+
+
+# ──────────────────────────────────────────────
+# 평가 진입점
+# ──────────────────────────────────────────────
+
+_stats_lock = threading.Lock()
+_stats = {}
+
+
+def _record(rule: SignalRule, evaluated: int, emitted: int, unresolved: int, expired: int = 0) -> None:
+    with _stats_lock:
+        entry = _stats.setdefault(rule.name, {'evaluated': 0, 'signals': 0, 'unresolved': 0, 'expired': 0})
+        entry['evaluated'] += evaluated
+        entry['signals'] += emitted
+        entry['unresolved'] += unresolved
+        entry['expired'] += expired
+
+
+def get_signal_deriver(source: str, rules: list = None):
+    """
+    출처 테이블의 새 행 → 신호 목록 함수를 반환합니다 (해당 출처 규칙이 없으면 None).
+    학교 해석기는 여기서 미리 가져오므로 저장 트랜잭션을 열기 전에 호출합니다.
+    반환 함수: derive(rows: [dict, ...]) → [신호 dict, ...]
+    """
+    rules = [r for r in (rules if rules is not None else SIGNAL_RULES) if r.source == source]
+    if not rules:
+        return None
+    try:
+        from modules.school_resolver import get_resolver
+        resolver = get_resolver()
+    except Exception:
+        resolver = None
+
+    def derive(rows: list) -> list:
+        signals = []
+        for rule in rules:
+            found, unresolved, expired = rule.evaluate(rows, resolver)
+            _record(rule, len(rows), len(found), unresolved, expired)
+            signals.extend(found)
+        return signals
+
+    return derive
+
+
+def get_signal_rule_stats() -> dict:
+    """프로세스 누적 규칙별 {evaluated, signals, unresolved, expired}."""
+    with _stats_lock:
+        return {name: dict(entry) for name, entry in _stats.items()}
@@ -0,0 +1,143 @@
+"""
+Tavily 웹 검색 결과 캐시 (crawler_cad_departments · crawler_contacts 공용)
+
+■ 목적
+  - 학교명으로 만든 고정 쿼리를 재스캔·단일 학교 재조회·Gemini 실패 후 재시도 때마다
+    "advanced" 검색으로 다시 요청하던 비용 제거
+  - 검색 결과를 api_cache.db(utils/cache_store)에 쿼리 계열별 TTL로 저장
+
+■ 쿼리 계열(family)별 TTL — 환경변수 TAVILY_CACHE_TTL_<FAMILY>(초)로 조정
+  - curriculum : 학과·교육과정 (30일, 학기 단위로만 바뀜)
+  - professor  : 학과별 교수진·학과사무실 (14일)
+  - contacts   : 학교 유형별 담당자 검색 (14일)
+
+■ 캐시 모드 (환경변수 TAVILY_CACHE_MODE 또는 set_tavily_cache_mode)
+  - normal : 캐시 우선, 없거나 만료되면 Tavily 호출 후 저장 (기본)
+  - replay : 캐시만 사용 (만료 무시, 미적중 시 빈 결과) — API 키 없이 재현·테스트용
+  - off    : 캐시 미사용
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+
+from utils.cache_store import get_cache_store
+from utils.rate_limiter import call_with_backoff
+
+CACHE_NAMESPACE = 'tavily'
+
+FAMILY_TTL = {
+    'curriculum': 30 * 24 * 3600,
+    'professor':  14 * 24 * 3600,
+    'contacts':   14 * 24 * 3600,
+}
+DEFAULT_TTL = 7 * 24 * 3600
+
+# 결과가 비어 있는 검색은 짧게 보관 (색인 지연 등으로 나중에 결과가 생길 수 있음)
+EMPTY_RESULT_TTL = 24 * 3600
+
+CACHE_MODES = ('normal', 'replay', 'off')
+
+_mode = os.getenv('TAVILY_CACHE_MODE', 'normal').strip().lower()
+if _mode not in CACHE_MODES:
+    _mode = 'normal'
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+_client_lock = threading.Lock()
+_clients = {}
+
+
+def set_tavily_cache_mode(mode: str) -> None:
+    """캐시 모드를 바꿉니다 ('normal' / 'replay' / 'off')."""
+    global _mode
+    if mode not in CACHE_MODES:
+        raise ValueError(f"지원하지 않는 캐시 모드: {mode} ({', '.join(CACHE_MODES)})")
+    _mode = mode
+
+
+def get_tavily_cache_mode() -> str:
+    return _mode
+
+
+def is_replay_mode() -> bool:
+    """캐시만 사용하는 재현 모드 여부 (API 키 검사 생략 판단용)."""
+    return _mode == 'replay'
+
+
+def get_family_ttl(family: str) -> int:
+    env = os.getenv(f"TAVILY_CACHE_TTL_{(family or '').upper()}")
+    if env is not None and env.strip().isdigit():
+        return int(env)
+    return FAMILY_TTL.get(family, DEFAULT_TTL)
+
+
+def normalize_query(query: str) -> str:
+    """쿼리 정규화: 앞뒤 공백 제거, 연속 공백 1칸, 영문 소문자."""
+    return _WHITESPACE_RE.sub(' ', (query or '').strip()).lower()
+
+
+def _cache_key(query: str, params: dict) -> str:
+    raw = json.dumps(
+        {'q': normalize_query(query), 'params': params},
+        ensure_ascii=False, sort_keys=True,
+    )
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def _get_client(api_key: str):
+    from tavily import TavilyClient
+
+    with _client_lock:
+        if api_key not in _clients:
+            _clients[api_key] = TavilyClient(api_key=api_key)
+        return _clients[api_key]
+
+
+def tavily_search(query: str, family: str, api_key: str = '',
+                  max_results: int = 3, search_depth: str = "advanced",
+                  include_raw_content: bool = False) -> dict:
+    """
+    캐시를 거쳐 Tavily 검색을 실행합니다.
+    반환값: Tavily 응답과 같은 형태 {'results': [{'url', 'content', ...}, ...], ...}
+    replay 모드에서 캐시가 없으면 {'results': []}를 반환하고, 그 외 API 오류는 그대로 전달합니다.
+    """
+    params = {
+        'search_depth': search_depth,
+        'max_results': max_results,
+        'include_raw_content': include_raw_content,
+    }
+    store = get_cache_store()
+    key = _cache_key(query, params)
+
+    if _mode != 'off':
+        entry = store.get(CACHE_NAMESPACE, key)
+        if entry and (not entry['expired'] or _mode == 'replay'):
+            store.record(CACHE_NAMESPACE, family, 'hits')
+            return json.loads(entry['value'])
+        if _mode == 'replay':
+            store.record(CACHE_NAMESPACE, family, 'misses')
+            return {'results': []}
+
+    if not api_key:
+        raise ValueError("TAVILY_API_KEY가 누락되었습니다.")
+
+    # 제공자 속도 제한 + 429 백오프 (동시 스캔 시 스레드 간 공유)
+    res = call_with_backoff('tavily', _get_client(api_key).search, query=query, **params)
+    if _mode == 'off':
+        return res
+
+    store.record(CACHE_NAMESPACE, family, 'misses')
+    ttl = get_family_ttl(family) if res.get('results') else min(get_family_ttl(family), EMPTY_RESULT_TTL)
+    store.put(
+        CACHE_NAMESPACE, key, json.dumps(res, ensure_ascii=False), ttl,
+        meta={'query': normalize_query(query), 'family': family}, source=family,
+    )
+    store.record(CACHE_NAMESPACE, family, 'stores')
+    return res
+
+
+def get_tavily_cache_stats() -> list:
+    """쿼리 계열별 Tavily 캐시 통계 (적중률 포함)."""
+    return get_cache_store().stats(CACHE_NAMESPACE)
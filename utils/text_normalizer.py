@@ -0,0 +1,141 @@
+"""
+검색 API 스니펫 텍스트 정규화 모듈
+
+■ 목적
+  - 네이버 뉴스 API의 title/description은 <b> 태그와 HTML 엔티티만 포함된 짧은 조각
+  - 조각마다 BeautifulSoup 파스 트리를 만드는 대신 정규식 태그 제거 + html.unescape로 처리
+  - 동일 스니펫은 LRU 캐시로 재사용 (sim/date 정렬 중복 수집 시 효과 큼)
+
+■ 제공 함수
+  - clean_html(raw)     : BeautifulSoup(raw, "html.parser").get_text()와 동일한 결과
+  - normalize_text(text): 전각 문자 → 반각, 연속 공백 정리
+  - clean_snippet(raw)  : clean_html + normalize_text (크롤러 기본 경로)
+
+■ 검증
+  - check_parity(samples)     : BeautifulSoup 결과와 1:1 비교 (불일치 목록 반환)
+  - benchmark_clean_html(...) : BeautifulSoup 대비 처리 시간 비교
+"""
+import html
+import re
+import time
+from functools import lru_cache
+
+# html.parser와 같은 규칙: '<' 다음에 영문자, '/', '!' 또는 '?'가 와야 태그로 인식
+_TAG_RE = re.compile(r'<!--.*?-->|<[A-Za-z/!?][^<>]*>', re.S)
+
+# 전각 ASCII(！~～) → 반각, 전각 공백(U+3000) → 일반 공백
+_FULLWIDTH_TABLE = {code: code - 0xFEE0 for code in range(0xFF01, 0xFF5F)}
+_FULLWIDTH_TABLE[0x3000] = 0x20
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# BeautifulSoup(html.parser)은 입력 끝의 미완성 엔티티('R&D' → 'RD')에서 '&'를 버림
+# → 원문 보존이 맞으므로 clean_html은 따르지 않고, 정합성 검증에서만 허용 차이로 취급
+_BS_TRAILING_ENTITY_RE = re.compile(r'&(?=[A-Za-z][A-Za-z0-9]*$)')
+
+_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def clean_html(raw: str) -> str:
+    """HTML 태그를 제거하고 엔티티를 복원합니다 (BeautifulSoup get_text 호환)."""
+    if not raw:
+        return ''
+    if '<' not in raw and '&' not in raw:
+        return raw
+
+    parts = _TAG_RE.split(raw)
+    text = ''.join(html.unescape(p) if '&' in p else p for p in parts)
+
+    # 정규식으로 처리하지 못한 비정상 마크업은 BeautifulSoup으로 위임 (정합성 우선)
+    if '<' in ''.join(parts):
+        from bs4 import BeautifulSoup
+        return BeautifulSoup(raw, "html.parser").get_text()
+    return text
+
+
+def normalize_text(text: str) -> str:
+    """전각 문자를 반각으로 바꾸고 연속 공백을 한 칸으로 정리합니다."""
+    if not text:
+        return ''
+    return _WHITESPACE_RE.sub(' ', text.translate(_FULLWIDTH_TABLE)).strip()
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def clean_snippet(raw: str) -> str:
+    """검색 API 스니펫을 태그 제거 + 정규화된 평문으로 변환합니다."""
+    return normalize_text(clean_html(raw))
+
+
+# ──────────────────────────────────────────────
+# 정합성 검증 / 벤치마크
+# ──────────────────────────────────────────────
+
+def _collect_snippets(samples: list) -> list:
+    """문자열 목록 또는 네이버 API 응답(items/dict) 목록에서 스니펫을 모읍니다."""
+    snippets = []
+    for s in samples:
+        if isinstance(s, str):
+            snippets.append(s)
+        elif isinstance(s, dict):
+            items = s.get('items') if 'items' in s else [s]
+            for item in items or []:
+                snippets.append(item.get('title', ''))
+                snippets.append(item.get('description', ''))
+    return snippets
+
+
+def check_parity(samples: list) -> list:
+    """
+    clean_html 결과를 BeautifulSoup get_text와 비교합니다.
+    samples: 스니펫 문자열 목록 또는 저장해 둔 네이버 API 응답(JSON dict) 목록
+    반환값: 불일치 항목 [{'raw', 'expected', 'actual'}, ...] (빈 리스트면 완전 일치)
+    ※ 입력 끝 미완성 엔티티('R&D')는 BeautifulSoup 쪽 손실이므로 불일치로 보지 않음
+    """
+    from bs4 import BeautifulSoup
+
+    mismatches = []
+    for raw in _collect_snippets(samples):
+        expected = BeautifulSoup(raw, "html.parser").get_text()
+        actual = clean_html(raw)
+        if expected != actual and _BS_TRAILING_ENTITY_RE.sub('', actual) != expected:
+            mismatches.append({'raw': raw, 'expected': expected, 'actual': actual})
+    return mismatches
+
+
+def benchmark_clean_html(samples: list, repeat: int = 5) -> dict:
+    """
+    BeautifulSoup 파싱과 clean_html(캐시 미사용/사용)의 처리 시간을 비교합니다.
+    반환값: {'snippets', 'bs4_ms', 'fast_ms', 'cached_ms', 'speedup'}
+    """
+    from bs4 import BeautifulSoup
+
+    snippets = _collect_snippets(samples)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for raw in snippets:
+            BeautifulSoup(raw, "html.parser").get_text()
+    bs4_ms = (time.perf_counter() - start) * 1000
+
+    fast = clean_html.__wrapped__
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for raw in snippets:
+            fast(raw)
+    fast_ms = (time.perf_counter() - start) * 1000
+
+    clean_html.cache_clear()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for raw in snippets:
+            clean_html(raw)
+    cached_ms = (time.perf_counter() - start) * 1000
+
+    return {
+        'snippets': len(snippets),
+        'bs4_ms': round(bs4_ms, 2),
+        'fast_ms': round(fast_ms, 2),
+        'cached_ms': round(cached_ms, 2),
+        'speedup': round(bs4_ms / fast_ms, 1) if fast_ms else None,
+    }